@@ -9,7 +9,6 @@ import json
 import os
 from datetime import datetime
 import networkx as nx
-import matplotlib.pyplot as plt
 
 
 class SemnetManager:
@@ -91,6 +90,9 @@ class SemnetManager:
 
     def visualize_network(self, output_file="semnet_graph.png"):
         """Visualisiert das Netzwerk"""
+        # Plotting nur hier laden; add/analyze aus Cron-Jobs brauchen es nicht
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(12, 8))
 
         # Layout berechnen
@@ -182,12 +184,12 @@ class SemnetManager:
 if __name__ == "__main__":
     import sys
 
-    manager = SemnetManager()
-
     if len(sys.argv) < 2:
         print("Verwendung: semnet_manager.py [add|strengthen|visualize|analyze]")
         sys.exit(1)
 
+    manager = SemnetManager()
+
     command = sys.argv[1]
 
     if command == "add":
@@ -7,94 +7,155 @@ Automatische tägliche SKK-Analyse
 
 import os
 import sys
-import yaml
-import schedule
 import time
 import logging
+import argparse
 from datetime import datetime
 import glob
 
-# Füge Parent-Directory zum Path hinzu
-sys.path.append('..')
-from skk_analyzer_standalone import SKKStandaloneAnalyzer
+# SKK-Basisverzeichnis, damit Konfiguration und Ausgaben wie im CLI liegen
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+from skk_config_compiler import load_compiled
+from skk_jobs import SKKJobRunner
+from skk_manifest import SKKManifest, scheduler_mode
+from skk_retention import retention_enabled, run_retention
+
+CONFIG_PATH = 'config/skk_config.yaml'
 
 class SKKDailyScheduler:
     def __init__(self):
         self.setup_logging()
         self.load_config()
-        self.analyzer = SKKStandaloneAnalyzer()
+        self.manifest = SKKManifest(self.manifest_path, self.settle_seconds)
+        # Analysen laufen in eigenen Prozessen, die Schleife bleibt reaktiv
+        jobs_config = self.config['scheduler'].get('jobs', {})
+        self.runner = SKKJobRunner(
+            CONFIG_PATH,
+            workers=jobs_config.get('workers', 2),
+            timeout=jobs_config.get('timeout', 600),
+            retries=jobs_config.get('retries', 2),
+            backoff=jobs_config.get('backoff', 30)
+        )
+        self.progress_interval = jobs_config.get('progress_interval', 60)
         
     def setup_logging(self):
         logging.basicConfig(
-            filename='../logs/skk_scheduler.log',
+            filename='logs/skk_scheduler.log',
             level=logging.INFO,
             format='%(asctime)s - %(message)s'
         )
         self.logger = logging.getLogger(__name__)
         
     def load_config(self):
-        with open('../config/skk_config.yaml', 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_compiled(CONFIG_PATH)['config']
+        self.manifest_path = self.config['scheduler'].get('manifest', 'processed/manifest.json')
+        self.settle_seconds = self.config['scheduler'].get('settle_seconds', 300)
             
     def daily_analysis(self):
-        """Führt tägliche Analyse durch"""
+        """Reiht neue Dateien und neue Log-Enden als Analyse-Jobs ein"""
         self.logger.info("Starte tägliche SKK-Analyse")
         
-        processed_count = 0
+        queued_count = 0
         
         # Verarbeite alle konfigurierten Input-Sources
         for source_pattern in self.config['scheduler']['input_sources']:
-            files = glob.glob(f"../{source_pattern}")
-            
-            for filepath in files:
-                if os.path.getmtime(filepath) > time.time() - 86400:  # Nur Dateien der letzten 24h
-                    self.logger.info(f"Analysiere: {filepath}")
-                    self.analyzer.analyze_file(filepath)
-                    processed_count += 1
-                    
-        self.logger.info(f"Tägliche Analyse abgeschlossen: {processed_count} Dateien verarbeitet")
+            for filepath in sorted(glob.glob(source_pattern)):
+                if filepath in self.runner:
+                    continue  # Noch aus einem früheren Lauf in Arbeit
+                # Manifest statt mtime-Fenster: nur neue Dateien und neue Log-Enden
+                span = self.manifest.pending(filepath)
+                if span is None:
+                    continue
+                self.runner.submit(filepath, *span)
+                queued_count += 1
+
+        self.manifest.prune()
+        self.manifest.save()
+        self.logger.info(f"Tägliche Analyse: {queued_count} Dateien eingereiht")
         
         # Cleanup alte Flügel und Strudel
         self.cleanup_old_files()
+
+    def collect(self):
+        """Verbucht abgeschlossene Jobs im Manifest (blockiert nicht)"""
+        for job in self.runner.poll():
+            if job.error:
+                self.logger.error(
+                    f"Fehler bei {job.filepath} nach {job.attempt} Versuchen: {job.error}"
+                )
+                continue
+            self.manifest.mark(job.filepath, job.end)
+            # Nach jeder Datei sichern, damit ein Abbruch nichts doppelt analysiert
+            self.manifest.save()
+            self.logger.info(f"Analysiert: {job.filepath} -> {job.result['report']}")
+
+    def report_progress(self):
+        progress = self.runner.progress()
+        message = ", ".join(f"{count} {state}" for state, count in progress.items())
+        self.logger.info(f"Fortschritt: {message}")
+        print(f"SKK Scheduler - {message}")
+
+    def run_once(self):
+        """Analysiert sofort und wartet auf alle Jobs"""
+        self.daily_analysis()
+        last_progress = time.monotonic()
+        while self.runner.active:
+            self.collect()
+            if time.monotonic() - last_progress >= self.progress_interval:
+                self.report_progress()
+                last_progress = time.monotonic()
+            time.sleep(0.5)
+        self.collect()
+        self.report_progress()
         
     def cleanup_old_files(self):
-        """Löscht alte temporäre Dateien"""
-        # Flügel nach 15 Minuten löschen
-        self._cleanup_directory('../flügel', minutes=15)
-        
-        # Strudel nach 2 Stunden löschen  
-        self._cleanup_directory('../strudel', hours=2)
-        
-    def _cleanup_directory(self, directory, **kwargs):
-        """Hilfsfunktion für Cleanup"""
-        if not os.path.exists(directory):
+        """Löscht abgelaufene Dateien laut konfigurierter Lebensdauer"""
+        if not retention_enabled(self.config):
             return
-            
-        cutoff_time = time.time()
-        if 'minutes' in kwargs:
-            cutoff_time -= kwargs['minutes'] * 60
-        elif 'hours' in kwargs:
-            cutoff_time -= kwargs['hours'] * 3600
-            
-        for filename in os.listdir(directory):
-            filepath = os.path.join(directory, filename)
-            if os.path.getmtime(filepath) < cutoff_time:
-                os.remove(filepath)
-                self.logger.info(f"Gelöscht: {filepath}")
+        for filepath in run_retention(self.config):
+            self.logger.info(f"Gelöscht: {filepath}")
                 
     def run(self):
         """Startet den Scheduler"""
+        import schedule  # Nur für den Daemon-Modus nötig, nicht für --once
+
         # Schedule daily run
         schedule_time = self.config['scheduler']['schedule'].split()[1]  # Extract hour
         schedule.every().day.at(f"{schedule_time}:00").do(self.daily_analysis)
+        # Kostet nur so viel, wie tatsächlich abläuft - daher minütlich
+        schedule.every().minute.do(self.cleanup_old_files)
         
         self.logger.info(f"SKK Scheduler gestartet - Tägliche Analyse um {schedule_time}:00 Uhr")
         print(f"SKK Scheduler läuft - Tägliche Analyse um {schedule_time}:00 Uhr")
         
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+        last_progress = time.monotonic()
+        try:
+            while True:
+                schedule.run_pending()
+                self.collect()
+                if self.runner.active and time.monotonic() - last_progress >= self.progress_interval:
+                    self.report_progress()
+                    last_progress = time.monotonic()
+                time.sleep(1)  # Jobs laufen nebenher, die Schleife prüft sekündlich
+        except KeyboardInterrupt:
+            print("SKK Scheduler wird beendet...")
+        finally:
+            self.runner.shutdown()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SKK Daily Scheduler")
+    parser.add_argument('--once', action='store_true',
+                        help="Einmal sofort analysieren und beenden")
+    args = parser.parse_args()
+
+    os.chdir(BASE_DIR)
+    os.makedirs('logs', exist_ok=True)
     scheduler = SKKDailyScheduler()
-    scheduler.run()
+    if scheduler_mode(scheduler.config) != 'daily':
+        sys.exit("scheduler.mode ist 'watch': Eingaben analysiert der Watch-Daemon, "
+                 "der tägliche Lauf würde sie doppelt verarbeiten")
+    if args.once:
+        scheduler.run_once()
+    else:
+        scheduler.run()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+SKK Watch Daemon
+================
+Analysiert neue oder gewachsene Eingabedateien innerhalb weniger Sekunden.
+Wie der tägliche Scheduler führt der Daemon ein SKKManifest: analysiert
+wird nur der neue Byte-Bereich, und nach einem Neustart geht es dort
+weiter, wo der letzte Lauf aufgehört hat.
+
+Daemon und täglicher Lauf sind Alternativen: der Daemon startet nur mit
+``scheduler.mode: watch``, der tägliche Scheduler nur mit ``daily``.
+"""
+
+import os
+import sys
+import time
+import queue
+import signal
+import fnmatch
+import logging
+import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:  # Polling-Fallback
+    INotify = None
+
+# SKK-Basisverzeichnis, damit Konfiguration und Ausgaben wie im CLI liegen
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+from skk_analyzer_standalone import _init_worker, _analyze_in_worker
+from skk_config_compiler import load_compiled
+from skk_manifest import SKKManifest, scheduler_mode
+
+
+class SKKWatchDaemon:
+    def __init__(self, config_path='config/skk_config.yaml', workers=None):
+        self.config_path = config_path
+        # Validiert wie Analyzer und Scheduler über das kompilierte Artefakt
+        self.config = load_compiled(config_path)['config']
+
+        watch_config = self.config['scheduler'].get('watch', {})
+        self.poll_interval = watch_config.get('poll_interval', 2)
+        self.rescan_interval = watch_config.get('rescan_interval', 60)
+        # Ohne Schließ-Ereignis gilt eine Datei erst so lange nach der
+        # letzten Änderung als fertig geschrieben
+        self.settle_interval = watch_config.get('settle_seconds', self.poll_interval)
+        self.workers = workers or watch_config.get('workers') or os.cpu_count() or 1
+        # Begrenzte Warteschlange fängt Bursts ab, ohne den Prozess aufzublähen
+        self.queue = queue.Queue(maxsize=watch_config.get('queue_size', 1000))
+
+        # input_sources wie "chat_logs/*.log" -> {Verzeichnis: [Muster]}
+        self.sources = {}
+        for source_pattern in self.config['scheduler']['input_sources']:
+            directory, pattern = os.path.split(source_pattern)
+            self.sources.setdefault(directory or '.', []).append(pattern)
+
+        # Eigenes Manifest, damit Daemon und täglicher Lauf sich nicht
+        # gegenseitig die Offsets überschreiben
+        self.manifest = SKKManifest(
+            watch_config.get('manifest', 'processed/watch_manifest.json'),
+            self.config['scheduler'].get('settle_seconds', 300)
+        )
+
+        self.logger = logging.getLogger(__name__)
+        # (Größe, mtime) vollständig analysierter Dateien; erspart ihnen bei
+        # jedem Scan den Blick ins Manifest
+        self._seen = {}
+        self._queued = set()
+        self._active = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _matches(self, directory, filename):
+        return any(fnmatch.fnmatch(filename, p) for p in self.sources.get(directory, []))
+
+    def _offer(self, filepath, settled=False):
+        """Reiht den neuen Bereich einer Datei ein (ohne zu blockieren).
+
+        ``settled`` heißt, der Schreiber hat die Datei geschlossen
+        (CLOSE_WRITE/MOVED_TO); sonst muss sie seit ``settle_interval``
+        unverändert sein, damit keine halb geschriebene Datei startet.
+        """
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            return
+        signature = (stat.st_size, stat.st_mtime_ns)
+        if not settled and time.time() - stat.st_mtime < self.settle_interval:
+            return  # noch in Arbeit, ein späterer Scan bietet sie erneut an
+
+        with self._lock:
+            if filepath in self._queued or filepath in self._active:
+                return  # nach Abschluss des laufenden Jobs wird erneut geprüft
+            if self._seen.get(filepath) == signature:
+                return
+            span = self.manifest.pending(filepath)
+            if span is None:
+                entry = self.manifest.entries.get(filepath)
+                # Nur vollständig verbuchte Dateien überspringen; eine noch
+                # offene letzte Zeile wird weiter geprüft, bis sie sich setzt
+                if entry and entry['offset'] == stat.st_size:
+                    self._seen[filepath] = signature
+                return
+            try:
+                self.queue.put_nowait((filepath, *span))
+            except queue.Full:
+                # Signatur nicht merken: der nächste Scan bietet die Datei erneut an
+                self.logger.warning(f"Warteschlange voll, verschiebe: {filepath}")
+                return
+            self._queued.add(filepath)
+
+    def _entries(self):
+        """Alle passenden Eingabedateien, per os.scandir"""
+        for directory in self.sources:
+            if not os.path.isdir(directory):
+                continue
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and self._matches(directory, entry.name):
+                        yield entry.path
+
+    def _scan(self):
+        for filepath in self._entries():
+            self._offer(filepath)
+
+    def _baseline(self):
+        """Ohne --include-existing: unbekannte Dateien gelten als erledigt.
+
+        Dateien aus dem Manifest werden dagegen angeboten, damit Anhänge
+        aus der Zeit, in der der Daemon nicht lief, analysiert werden.
+        """
+        with self._lock:
+            for filepath in self._entries():
+                if filepath not in self.manifest.entries:
+                    self.manifest.mark(filepath, os.path.getsize(filepath))
+            self.manifest.prune()
+            self.manifest.save()
+        self._scan()
+
+    def _finish(self, filepath, end, future):
+        """Verbucht einen abgeschlossenen Job und prüft die Datei erneut"""
+        with self._lock:
+            self._active.discard(filepath)
+            try:
+                result = future.result()
+            except Exception as e:
+                # Nicht verbuchen; erneuter Versuch erst nach der nächsten Änderung
+                self.logger.error(f"Fehler bei {filepath}: {e}")
+                if os.path.exists(filepath):
+                    stat = os.stat(filepath)
+                    self._seen[filepath] = (stat.st_size, stat.st_mtime_ns)
+                return
+            self.manifest.mark(filepath, end)
+            # Nach jeder Datei sichern, damit ein Neustart nichts doppelt analysiert
+            self.manifest.save()
+        self.logger.info(f"Analysiert: {filepath} -> {result['report']}")
+        # Während der Analyse angehängtes gleich nachziehen
+        self._offer(filepath)
+
+    def _watch_inotify(self):
+        """Wartet auf inotify-Ereignisse; seltene Rescans fangen Verpasstes auf"""
+        inotify = INotify()
+        # Kein MODIFY: erst reagieren, wenn der Schreiber fertig ist. Logs,
+        # die dauerhaft offen bleiben, erfasst der Rescan
+        watch_flags = flags.CLOSE_WRITE | flags.MOVED_TO
+        watches = {}
+        for directory in self.sources:
+            os.makedirs(directory, exist_ok=True)
+            watches[inotify.add_watch(directory, watch_flags)] = directory
+
+        last_scan = time.monotonic()
+        while not self._stop.is_set():
+            for event in inotify.read(timeout=int(self.poll_interval * 1000)):
+                directory = watches.get(event.wd)
+                if directory and self._matches(directory, event.name):
+                    self._offer(os.path.join(directory, event.name), settled=True)
+            if time.monotonic() - last_scan >= self.rescan_interval:
+                self._scan()
+                last_scan = time.monotonic()
+
+    def _watch_polling(self):
+        while not self._stop.wait(self.poll_interval):
+            self._scan()
+
+    def _watch(self):
+        try:
+            if INotify is not None:
+                self._watch_inotify()
+            else:
+                self._watch_polling()
+        except Exception:
+            self.logger.exception("Dateiüberwachung abgebrochen")
+            self._stop.set()
+
+    def run(self, include_existing=False):
+        """Startet Überwachung und Worker-Pool bis zum Abbruch"""
+        if include_existing:
+            self._scan()
+        else:
+            self._baseline()
+
+        mode = 'inotify' if INotify is not None else f'Polling alle {self.poll_interval}s'
+        self.logger.info(f"SKK Watch-Daemon gestartet ({mode}, {self.workers} Worker)")
+        print(f"SKK Watch-Daemon läuft ({mode}) - überwacht: {', '.join(self.sources)}")
+
+        watcher = threading.Thread(target=self._watch, name='skk-watch', daemon=True)
+        watcher.start()
+
+        in_flight = {}
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.config_path,)) as pool:
+            try:
+                while not self._stop.is_set():
+                    # Nur so viele Jobs abgeben, wie Worker frei sind
+                    while len(in_flight) < self.workers:
+                        try:
+                            filepath, start, end = self.queue.get(
+                                timeout=0 if in_flight else 0.5)
+                        except queue.Empty:
+                            break
+                        with self._lock:
+                            self._queued.discard(filepath)
+                            self._active.add(filepath)
+                        self.logger.info(f"Analysiere: {filepath} [{start}:{end}]")
+                        future = pool.submit(_analyze_in_worker, filepath, None, start, end)
+                        in_flight[future] = (filepath, end)
+
+                    if not in_flight:
+                        continue
+                    done, _ = wait(in_flight, timeout=0.5, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._finish(*in_flight.pop(future), future)
+            except KeyboardInterrupt:
+                print("SKK Watch-Daemon wird beendet...")
+            finally:
+                self._stop.set()
+                # Laufende Jobs noch verbuchen, sonst analysiert ein Neustart
+                # dieselben Bereiche erneut
+                for future in wait(in_flight).done:
+                    self._finish(*in_flight.pop(future), future)
+
+    def stop(self):
+        self._stop.set()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SKK Watch-Daemon")
+    parser.add_argument('--workers', type=int, help="Anzahl Analyse-Prozesse")
+    parser.add_argument('--include-existing', action='store_true',
+                        help="Beim Start auch bereits vorhandene Dateien analysieren")
+    args = parser.parse_args()
+
+    os.chdir(BASE_DIR)
+    daemon = SKKWatchDaemon(workers=args.workers)
+    if scheduler_mode(daemon.config) != 'watch':
+        sys.exit("scheduler.mode ist 'daily': Eingaben analysiert der tägliche Lauf; "
+                 "für den Watch-Daemon scheduler.mode auf 'watch' setzen")
+
+    os.makedirs('logs', exist_ok=True)
+    logging.basicConfig(
+        filename='logs/skk_watch_daemon.log',
+        level=logging.INFO,
+        format='%(asctime)s - %(message)s'
+    )
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+    daemon.run(include_existing=args.include_existing)
@@ -5,20 +5,111 @@ SKK Standalone Analyzer
 Unabhängige SKK-Analyse ohne MIND-System
 """
 
+import codecs
 import os
+import re
+import random
+import sqlite3
+import sys
 import yaml
 import json
-import re
 from datetime import datetime, timedelta
 import argparse
 import logging
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from skk_cache import FLUSH_BYTES, FLUSH_EVERY, SKKChunkCache
+from skk_config_compiler import load_compiled
+from skk_logging import install_queue_logging
+from skk_numpy_backend import (
+    SKKCountMatrix,
+    fluegel_slices,
+    knoten_candidates,
+    numpy_available,
+    strudel_candidates,
+)
+from skk_profiler import NullProfiler, SKKStageProfiler, append_metrics
+from skk_retention import SKKRetentionIndex, retention_enabled, retention_rules
+from skk_sinks import create_sink
+
+# Alle wie viele Chunks das Speicherbudget geprüft wird
+MEMORY_CHECK_INTERVAL = 256
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+# element: jede Fundstelle, chunk: eine Zeile pro Chunk, summary: nur Summen
+LOG_VERBOSITY = ("element", "chunk", "summary")
+
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def parse_size(value):
+    """Wandelt Größenangaben wie "500MB" in Bytes um"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMG]?B?)\s*", str(value).upper())
+    if not match:
+        raise ValueError(f"Ungültige Größenangabe: {value}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).rstrip("B") or ""])
+
+
+def _non_negative_int(value):
+    """argparse-Typ für ``--workers``: 0 steht für alle CPU-Kerne"""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"darf nicht negativ sein: {value}")
+    return number
+
+
+def current_memory_usage():
+    """Liefert den aktuellen Speicherverbrauch (RSS) des Prozesses in Bytes
+
+    Unter Linux aus ``/proc/self/statm``. Nur wo das fehlt, dient der
+    Spitzenwert aus ``getrusage`` als Ersatz; der sinkt nie wieder, in
+    langlebigen Prozessen (Worker, Daemon, Server) also nur eine Näherung.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux meldet Kilobytes, macOS Bytes
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+class _ByteRangeReader:
+    """Liest den Bereich [start, end) einer Binärdatei als UTF-8-Text"""
+
+    def __init__(self, fileobj, start, end):
+        fileobj.seek(start)
+        self.fileobj = fileobj
+        self.remaining = end - start
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.fileobj.read(size)
+        self.remaining -= len(data)
+        return self.decoder.decode(data, final=not data or self.remaining <= 0)
 
 
 class SKKStandaloneAnalyzer:
     def __init__(self, config_path="config/skk_config.yaml"):
         self.load_config(config_path)
         self.setup_logging()
+        if self.backend == "numpy" and not numpy_available():
+            self.logger.warning("NumPy nicht installiert - nutze Python-Backend")
+            self.backend = "python"
         self.bedeutungsfelder = {
             "flügel": [],
             "strudel": [],
@@ -29,91 +120,295 @@ class SKKStandaloneAnalyzer:
 
     def load_config(self, config_path):
         """Lädt SKK-Konfiguration"""
-        with open(config_path, "r", encoding="utf-8") as f:
-            self.config = yaml.safe_load(f)
-        self.chunk_size = self.config["performance"]["chunk_size"]
+        # Vorkompiliertes Artefakt: YAML und Matcher nur nach Änderungen neu bauen
+        compiled = load_compiled(config_path)
+        self.config = compiled["config"]
+        # Jede Änderung an der Konfiguration invalidiert den Chunk-Cache
+        self.config_hash = compiled["sha256"]
+        performance = self.config["performance"]
+        self.chunk_size = performance["chunk_size"]
+        self.max_memory = parse_size(performance.get("max_memory", 0)) or None
+        self.stream_threshold = parse_size(performance.get("stream_threshold", "50MB"))
+        self.read_block_size = parse_size(performance.get("read_block_size", "1MB"))
+        self.backend = performance.get("backend", "python")
+        self.profiling = dict(performance.get("profiling") or {})
+        self.matcher = compiled["matcher"]
+
+        self.sink = create_sink(self.config.get("output"))
+
+        cache_config = self.config.get("cache") or {}
+        self.cache = None
+        if cache_config.get("enabled", False):
+            self.cache = SKKChunkCache(
+                cache_config.get("path", "cache/skk_chunk_cache.sqlite"),
+                self.config_hash,
+                parse_size(cache_config.get("max_size", "100MB")),
+                flush_every=cache_config.get("flush_every", FLUSH_EVERY),
+                flush_bytes=parse_size(cache_config.get("flush_bytes", FLUSH_BYTES)),
+            )
+
+        retention_config = self.config.get("retention") or {}
+        self.retention = None
+        if retention_enabled(self.config):
+            # Neue Element-Dateien direkt mit Ablaufzeit in den Index eintragen
+            self.retention = SKKRetentionIndex(
+                retention_config.get("index", "cache/skk_retention.sqlite")
+            )
+            self.retention_rules = retention_rules(self.config)
 
     def setup_logging(self):
         """Konfiguriert Logging"""
-        logging.basicConfig(
-            filename="logs/skk_analyzer.log",
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-        )
+        log_config = self.config.get("logging") or {}
+        filename = log_config.get("file", "logs/skk_analyzer.log")
+        if log_config.get("async", True):
+            # Dateischreibzugriffe laufen gebündelt in einem Hintergrund-Thread
+            install_queue_logging(
+                filename,
+                level=logging.INFO,
+                fmt=LOG_FORMAT,
+                batch_size=log_config.get("batch_size", 512),
+            )
+        else:
+            logging.basicConfig(
+                filename=filename, level=logging.INFO, format=LOG_FORMAT
+            )
         self.logger = logging.getLogger(__name__)
 
-    def analyze_file(self, filepath):
-        """Analysiert eine einzelne Datei"""
+        self.verbosity = log_config.get("verbosity", "element")
+        if self.verbosity not in LOG_VERBOSITY:
+            raise ValueError(f"Unbekannte Log-Stufe: {self.verbosity}")
+        self.log_elements = self.verbosity == "element"
+
+    def analyze_file(self, filepath, stream=None, start=0, end=None):
+        """Analysiert eine einzelne Datei
+
+        Große Dateien (ab ``performance.stream_threshold``) werden blockweise
+        gelesen, statt vollständig in den Speicher geladen zu werden.
+        ``start``/``end`` begrenzen die Analyse auf einen Byte-Bereich, z.B.
+        das seit dem letzten Lauf angehängte Ende eines Logs.
+        """
         self.logger.info(f"Analysiere Datei: {filepath}")
 
-        with open(filepath, "r", encoding="utf-8") as f:
-            text = f.read()
+        herkunft = {"quelle": filepath}
+        if start or end is not None:
+            end = os.path.getsize(filepath) if end is None else end
+            herkunft["bereich"] = {"start": start, "ende": end}
+        else:
+            end = os.path.getsize(filepath)
+
+        if stream is None:
+            stream = end - start >= self.stream_threshold
+
+        with open(filepath, "rb") as raw:
+            f = _ByteRangeReader(raw, start, end)
+            if not stream:
+                text = f.read()
+                self.logger.info(
+                    f"Starte SKK-Analyse für Text mit {len(text)} Zeichen"
+                )
+                return self._analyze_chunks(self._split_text(text), herkunft=herkunft)
 
-        return self.analyze_text(text)
+            self.logger.info(f"Streaming-Analyse für {filepath}")
+            return self._analyze_chunks(
+                self._chunk_words(self._iter_file_words(f)), herkunft=herkunft
+            )
 
-    def analyze_text(self, text):
+    def analyze_text(self, text, save=True, quelle=None):
         """Hauptanalyse-Funktion"""
         self.logger.info(f"Starte SKK-Analyse für Text mit {len(text)} Zeichen")
 
+        return self._analyze_chunks(
+            self._split_text(text),
+            save=save,
+            herkunft={"quelle": quelle} if quelle else None,
+        )
+
+    def _analyze_chunks(self, chunks, save=True, herkunft=None):
+        """Analysiert Chunks, sobald sie eintreffen, und erstellt den Report"""
         # Reset Bedeutungsfelder
         for key in self.bedeutungsfelder:
             self.bedeutungsfelder[key] = []
 
-        # Text in Chunks teilen
-        chunks = self._split_text(text)
-
-        for idx, chunk in enumerate(chunks):
-            self._analyze_chunk(chunk, idx)
+        self.count_matrix = None
+        if self.backend == "numpy":
+            self.count_matrix = SKKCountMatrix(
+                self.config["bedeutungsfelder"]["flügel"]["markers"]
+            )
 
-        # Post-Processing
-        self._form_strudel()
-        self._crystallize_knoten()
-        self._create_kristalle()
-        self._detect_metamarker()
+        profiler = self._start_profiler()
+
+        try:
+            for idx, chunk in enumerate(profiler.iterate("_split_text", chunks)):
+                with profiler.stage("_analyze_chunk"):
+                    self._analyze_chunk(chunk, idx)
+                if idx % MEMORY_CHECK_INTERVAL == 0:
+                    self._check_memory_budget()
+
+            if self.cache:
+                self.cache.flush()
+
+            # Post-Processing
+            with profiler.stage("_form_strudel"):
+                self._form_strudel()
+            with profiler.stage("_crystallize_knoten"):
+                self._crystallize_knoten()
+            with profiler.stage("_create_kristalle"):
+                self._create_kristalle()
+            with profiler.stage("_detect_metamarker"):
+                self._detect_metamarker()
+
+            # Generiere Report
+            with profiler.stage("_generate_report"):
+                report = self._generate_report()
+            if herkunft:
+                report.update(herkunft)
+
+            if not self.log_elements:
+                statistik = report["statistik"]
+                self.logger.info(
+                    "Erkannt: "
+                    + ", ".join(f"{n} {typ}" for typ, n in statistik.items())
+                )
 
-        # Generiere Report
-        report = self._generate_report()
+            if profiler.active:
+                performance = profiler.summary()
+                report["performance"] = performance
 
-        # Speichere Ergebnisse
-        self._save_results(report)
+            # Speichere Ergebnisse
+            with profiler.stage("_save_results"):
+                self.last_report_file = (
+                    self._save_results(report) if save else None
+                )
 
-        return report
+            if profiler.active:
+                # Gespeicherte Fassung endet vor _save_results, der Rückgabewert nicht
+                performance.update(profiler.summary())
+                self._write_metrics(report)
+
+            return report
+        finally:
+            # Auch bei Abbruch (Speicherbudget, Sink-Fehler) kein tracemalloc
+            # im langlebigen Prozess zurücklassen
+            profiler.stop()
+
+    def enable_profiling(self):
+        """Misst jeden Lauf, unabhängig von Konfiguration und Stichprobe"""
+        self.profiling.update(enabled=True, sample_rate=1.0)
+
+    def _start_profiler(self):
+        """Aktiviert das Profiling laut ``performance.profiling`` (mit Stichprobe)"""
+        if not self.profiling.get("enabled", False):
+            return NullProfiler()
+        if random.random() >= self.profiling.get("sample_rate", 1.0):
+            return NullProfiler()
+        return SKKStageProfiler(trace_memory=self.profiling.get("trace_memory", True))
+
+    def _write_metrics(self, report):
+        """Schreibt die Stufenmessung optional ins JSONL-Metrik-Log"""
+        metrics_log = self.profiling.get("metrics_log")
+        if not metrics_log:
+            return
+        append_metrics(
+            metrics_log,
+            {
+                "timestamp": report["timestamp"],
+                "report": self.last_report_file,
+                "statistik": report["statistik"],
+                **report["performance"],
+            },
+        )
 
     def _split_text(self, text):
         """Teilt Text in verarbeitbare Chunks"""
-        words = text.split()
-        chunks = []
-
-        for i in range(0, len(words), self.chunk_size):
-            chunk = " ".join(words[i : i + self.chunk_size])
-            chunks.append(chunk)
-
-        return chunks
+        words = (match.group() for match in re.finditer(r"\S+", text))
+        return self._chunk_words(words)
+
+    def _iter_file_words(self, fileobj):
+        """Liest eine Datei blockweise und liefert einzelne Wörter"""
+        rest = ""
+        while True:
+            block = fileobj.read(self.read_block_size)
+            if not block:
+                break
+            block = rest + block
+            words = block.split()
+            # Ein am Blockende angeschnittenes Wort wird mit dem nächsten Block fortgesetzt
+            rest = words.pop() if words and not block[-1].isspace() else ""
+            yield from words
+        if rest:
+            yield rest
+
+    def _chunk_words(self, words):
+        """Fasst einen Wortstrom zu Chunks mit ``chunk_size`` Wörtern zusammen"""
+        words = iter(words)
+        while True:
+            window = list(islice(words, self.chunk_size))
+            if not window:
+                return
+            yield " ".join(window)
+
+    def _check_memory_budget(self):
+        """Bricht ab, wenn ``performance.max_memory`` überschritten ist
+
+        Das Streaming begrenzt nur den Eingabetext. Alle Elemente bleiben bis
+        zum Report erhalten (er enthält jeden Flügel), der Speicher wächst
+        also mit der Zahl der Treffer; das Budget bricht einen zu großen Lauf
+        ab, statt ihn in kleinerem Speicher zu Ende zu führen.
+        """
+        if not self.max_memory:
+            return
+        usage = current_memory_usage()
+        if usage is not None and usage > self.max_memory:
+            self.logger.error(
+                f"Speicherbudget überschritten: {usage} > {self.max_memory} Bytes"
+            )
+            raise MemoryError(
+                f"SKK-Analyse überschreitet performance.max_memory ({usage} Bytes)"
+            )
 
     def _analyze_chunk(self, chunk, chunk_idx):
         """Analysiert einen Text-Chunk auf Flügel"""
-        flügel_config = self.config["bedeutungsfelder"]["flügel"]
-
-        for marker in flügel_config["markers"]:
-            pattern = rf"\b{marker}\w*\b"
-            matches = re.findall(pattern, chunk.lower())
-
-            if matches:
-                flügel = {
-                    "id": f'flügel_{chunk_idx}_{datetime.now().strftime("%H%M%S%f")}',
-                    "chunk": chunk_idx,
-                    "timestamp": datetime.now().isoformat(),
-                    "marker": marker,
-                    "matches": matches,
-                    "count": len(matches),
-                    "context": chunk[:200],
-                    "bedeutung": self._interpret_bedeutung(marker, chunk),
-                }
-                self.bedeutungsfelder["flügel"].append(flügel)
+        # Unveränderte Chunks (z.B. in wachsenden Logs) nicht erneut scannen
+        hits = self.cache.get(chunk) if self.cache else None
+        if hits is None:
+            hits = self.matcher.match(chunk)
+            if self.cache:
+                self.cache.put(chunk, hits)
+
+        if self.count_matrix is not None:
+            self.count_matrix.record(chunk_idx, hits.get("flügel", {}))
+
+        fluegel_hits = hits.get("flügel", {})
+        if not fluegel_hits:
+            return
+
+        # Kontext und Zeitstempel teilen sich alle Flügel eines Chunks, statt
+        # pro Treffer eine eigene Kopie zu halten
+        context = chunk[:200]
+        timestamp = datetime.now().isoformat()
+        for marker, matches in fluegel_hits.items():
+            flügel = {
+                "id": f'flügel_{chunk_idx}_{datetime.now().strftime("%H%M%S%f")}',
+                "chunk": chunk_idx,
+                "timestamp": timestamp,
+                "marker": marker,
+                "matches": matches,
+                "count": len(matches),
+                "context": context,
+                "bedeutung": self._interpret_bedeutung(marker, chunk),
+            }
+            self.bedeutungsfelder["flügel"].append(flügel)
+            if self.log_elements:
                 self.logger.info(f"Flügel erkannt: {flügel['id']}")
 
+        if self.verbosity == "chunk":
+            self.logger.info(f"Chunk {chunk_idx}: {len(fluegel_hits)} Flügel erkannt")
+
     def _form_strudel(self):
         """Bildet Strudel aus Flügeln"""
+        if self.count_matrix is not None:
+            return self._form_strudel_vectorized()
+
         strudel_config = self.config["bedeutungsfelder"]["strudel"]
 
         # Gruppiere Flügel nach Chunks
@@ -144,10 +439,14 @@ class SKKStandaloneAnalyzer:
                     self.logger.warning(f"Hyperfokus-Strudel: {strudel['id']}")
 
                 self.bedeutungsfelder["strudel"].append(strudel)
-                self.logger.info(f"Strudel gebildet: {strudel['id']}")
+                if self.log_elements:
+                    self.logger.info(f"Strudel gebildet: {strudel['id']}")
 
     def _crystallize_knoten(self):
         """Verfestigt Knoten aus Strudeln"""
+        if self.count_matrix is not None:
+            return self._crystallize_knoten_vectorized()
+
         knoten_config = self.config["bedeutungsfelder"]["knoten"]
 
         for strudel in self.bedeutungsfelder["strudel"]:
@@ -170,10 +469,93 @@ class SKKStandaloneAnalyzer:
                     self.logger.warning(f"Rigider Knoten: {knoten['id']}")
 
                 self.bedeutungsfelder["knoten"].append(knoten)
+                if self.log_elements:
+                    self.logger.info(f"Knoten kristallisiert: {knoten['id']}")
+
+    def _form_strudel_vectorized(self):
+        """Bildet Strudel über die Zählmatrix (NumPy-Backend)
+
+        Anziehungskraft und Hyperfokus werden für alle Chunks auf einmal
+        berechnet; Dicts entstehen nur für tatsächlich gebildete Strudel.
+        """
+        strudel_config = self.config["bedeutungsfelder"]["strudel"]
+        flügel = self.bedeutungsfelder["flügel"]
+
+        chunks, anziehungskraft, hyperfokus = strudel_candidates(
+            self.count_matrix, strudel_config["hyperfokus_threshold"]
+        )
+        starts, ends = fluegel_slices([f["chunk"] for f in flügel], chunks)
+        self._strudel_anziehungskraft = anziehungskraft
+
+        now = datetime.now()
+        timestamp = now.isoformat()
+        suffix = now.strftime("%H%M%S")
+
+        for chunk_idx, kraft, fokus, start, end in zip(
+            chunks.tolist(),
+            anziehungskraft.tolist(),
+            hyperfokus.tolist(),
+            starts.tolist(),
+            ends.tolist(),
+        ):
+            flügel_list = flügel[start:end]
+            strudel = {
+                "id": f"strudel_{chunk_idx}_{suffix}",
+                "timestamp": timestamp,
+                "chunk": chunk_idx,
+                "flügel_ids": [f["id"] for f in flügel_list],
+                "anziehungskraft": kraft,
+                "hyperfokus": fokus,
+                "bedeutungsfeld": self._merge_bedeutungen(flügel_list),
+            }
+
+            if fokus:
+                strudel["warnung"] = (
+                    "HYPERFOKUS: Strudel verschlingt andere Bedeutungen!"
+                )
+                self.logger.warning(f"Hyperfokus-Strudel: {strudel['id']}")
+
+            self.bedeutungsfelder["strudel"].append(strudel)
+            if self.log_elements:
+                self.logger.info(f"Strudel gebildet: {strudel['id']}")
+
+    def _crystallize_knoten_vectorized(self):
+        """Verfestigt Knoten über die Strudel-Anziehungskräfte (NumPy-Backend)"""
+        knoten_config = self.config["bedeutungsfelder"]["knoten"]
+        strudel = self.bedeutungsfelder["strudel"]
+
+        indices, rigidities = knoten_candidates(self._strudel_anziehungskraft)
+
+        now = datetime.now()
+        timestamp = now.isoformat()
+        suffix = now.strftime("%Y%m%d_%H%M%S%f")
+
+        for idx, rigidity in zip(indices.tolist(), rigidities.tolist()):
+            knoten = {
+                "id": f"knoten_{suffix}_{idx}",
+                "timestamp": timestamp,
+                "strudel_id": strudel[idx]["id"],
+                "strukturfestigkeit": rigidity,
+                "bedeutungsanker": strudel[idx]["bedeutungsfeld"],
+                "flexibilität": 1.0 - rigidity,
+            }
+
+            if rigidity >= knoten_config["rigidity_warning"]:
+                knoten["warnung"] = (
+                    "Zu starre Struktur - kann Perspektive einschränken!"
+                )
+                self.logger.warning(f"Rigider Knoten: {knoten['id']}")
+
+            self.bedeutungsfelder["knoten"].append(knoten)
+            if self.log_elements:
                 self.logger.info(f"Knoten kristallisiert: {knoten['id']}")
 
     def _create_kristalle(self):
-        """Erschafft Kristalle aus Knoten"""
+        """Erschafft Kristalle aus Knoten
+
+        Konstanter Aufwand (höchstens ein Kristall aus den letzten drei
+        Knoten), daher ohne eigene Variante im NumPy-Backend.
+        """
         kristall_config = self.config["bedeutungsfelder"]["kristalle"]
 
         if len(self.bedeutungsfelder["knoten"]) >= 2:
@@ -191,7 +573,8 @@ class SKKStandaloneAnalyzer:
             }
 
             self.bedeutungsfelder["kristalle"].append(kristall)
-            self.logger.info(f"Kristall erschaffen: {kristall['id']}")
+            if self.log_elements:
+                self.logger.info(f"Kristall erschaffen: {kristall['id']}")
 
     def _interpret_bedeutung(self, marker, context):
         """Interpretiert Bedeutung basierend auf Marker und Kontext"""
@@ -224,39 +607,75 @@ class SKKStandaloneAnalyzer:
         )
 
     def _detect_metamarker(self):
-        """Erkennt Resonanzcluster aus Flügeln und Strudeln"""
-        cfg = self.config.get("metamarker", {})
+        """Erkennt Resonanzcluster aus Flügeln und Strudeln
+
+        Ein Zwei-Zeiger-Fenster läuft einmal über die sortierten Ereignisse
+        und meldet alle nicht überlappenden Cluster. Das Fenster wird über
+        ``timeframe_sec`` oder – mit ``window: chunks`` – über den
+        Chunk-Abstand ``chunk_distance`` begrenzt.
+        """
+        cfg = self.config.get("metamarker") or self.config["bedeutungsfelder"].get(
+            "metamarker", {}
+        )
         fluegel_min = cfg.get("fluegel_min", 2)
         strudel_min = cfg.get("strudel_min", 1)
-        timeframe = timedelta(seconds=cfg.get("timeframe_sec", 60))
+
+        if cfg.get("window", "timeframe") == "chunks":
+            width = cfg.get("chunk_distance", 2)
+
+            def position(element):
+                return element["chunk"]
+
+        else:
+            width = timedelta(seconds=cfg.get("timeframe_sec", 60))
+
+            def position(element):
+                return datetime.fromisoformat(element["timestamp"])
 
         events = []
         for f in self.bedeutungsfelder["flügel"]:
-            events.append(("flügel", datetime.fromisoformat(f["timestamp"])))
+            events.append((position(f), "flügel", f))
         for s in self.bedeutungsfelder["strudel"]:
-            events.append(("strudel", datetime.fromisoformat(s["timestamp"])))
-
-        events.sort(key=lambda x: x[1])
-
-        for i in range(len(events)):
-            counts = {"flügel": 0, "strudel": 0}
-            start_time = events[i][1]
-            for j in range(i, len(events)):
-                if events[j][1] - start_time <= timeframe:
-                    counts[events[j][0]] += 1
-                else:
-                    break
+            events.append((position(s), "strudel", s))
+
+        events.sort(key=lambda x: x[0])
+
+        counts = {"flügel": 0, "strudel": 0}
+        start = end = 0
+        while start < len(events):
+            # Fenster ab events[start] so weit wie möglich ausdehnen
+            while end < len(events) and events[end][0] - events[start][0] <= width:
+                counts[events[end][1]] += 1
+                end += 1
+
             if counts["flügel"] >= fluegel_min and counts["strudel"] >= strudel_min:
-                metamarker = {
-                    "id": f'metamarker_{start_time.strftime("%Y%m%d_%H%M%S")}',
-                    "timestamp_start": start_time.isoformat(),
-                    "timestamp_end": events[j - 1][1].isoformat(),
-                    "kombination": counts,
-                    "beschreibung": "Resonanzcluster aus Flügeln und Strudeln",
-                }
-                self.bedeutungsfelder["metamarker"].append(metamarker)
-                self.logger.info(f"Metamarker erkannt: {metamarker['id']}")
-                break
+                self._add_metamarker(events[start:end], dict(counts))
+                # Nicht überlappend: nächstes Fenster beginnt hinter dem Cluster
+                counts = {"flügel": 0, "strudel": 0}
+                start = end
+            else:
+                counts[events[start][1]] -= 1
+                start += 1
+
+    def _add_metamarker(self, cluster, counts):
+        """Legt einen Metamarker für einen erkannten Cluster an"""
+        elements = [element for _, _, element in cluster]
+        start_time = min(datetime.fromisoformat(e["timestamp"]) for e in elements)
+        end_time = max(datetime.fromisoformat(e["timestamp"]) for e in elements)
+        index = len(self.bedeutungsfelder["metamarker"])
+
+        metamarker = {
+            "id": f'metamarker_{start_time.strftime("%Y%m%d_%H%M%S")}_{index}',
+            "timestamp_start": start_time.isoformat(),
+            "timestamp_end": end_time.isoformat(),
+            "chunk_start": min(e["chunk"] for e in elements),
+            "chunk_end": max(e["chunk"] for e in elements),
+            "kombination": counts,
+            "beschreibung": "Resonanzcluster aus Flügeln und Strudeln",
+        }
+        self.bedeutungsfelder["metamarker"].append(metamarker)
+        if self.log_elements:
+            self.logger.info(f"Metamarker erkannt: {metamarker['id']}")
 
     def _generate_report(self):
         """Generiert umfassenden Analysebericht"""
@@ -333,29 +752,137 @@ class SKKStandaloneAnalyzer:
         return "".join(narrative)
 
     def _save_results(self, report):
-        """Speichert Analyseergebnisse"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        """Speichert Analyseergebnisse über die konfigurierte Ablage"""
+        # Mikrosekunden verhindern Kollisionen bei parallelen Batch-Läufen
+        run_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        report_file = self.sink.write(report, run_id)
+        if self.retention is not None:
+            self._register_retention()
 
-        # Hauptbericht
-        report_file = f"analysen/skk_report_{timestamp}.yaml"
-        os.makedirs(os.path.dirname(report_file), exist_ok=True)
+        self.logger.info(f"Ergebnisse gespeichert: {report_file}")
+        print(f"✅ SKK-Analyse abgeschlossen: {report_file}")
 
-        with open(report_file, "w", encoding="utf-8") as f:
-            yaml.dump(report, f, allow_unicode=True)
+        return report_file
 
-        # Einzelne Bedeutungsfelder
-        for typ, elemente in report["bedeutungsfelder"].items():
-            for element in elemente:
-                element_file = f"{typ}/{element['id']}.yaml"
-                os.makedirs(os.path.dirname(element_file), exist_ok=True)
+    def _register_retention(self):
+        """Meldet die geschriebenen Element-Dateien beim Retention-Index an"""
+        element_files = getattr(self.sink, "element_files", {})
+        try:
+            for directory, paths in element_files.items():
+                directory = os.path.normpath(directory)
+                lifetime = self.retention_rules.get(directory)
+                self.retention.register(directory, lifetime, paths)
+        except sqlite3.Error as e:
+            # Der nächste Verzeichnisabgleich holt fehlende Einträge nach
+            self.logger.warning(f"Retention-Index nicht aktualisiert: {e}")
 
-                with open(element_file, "w", encoding="utf-8") as f:
-                    yaml.dump(element, f, allow_unicode=True)
 
-        self.logger.info(f"Ergebnisse gespeichert: {report_file}")
-        print(f"✅ SKK-Analyse abgeschlossen: {report_file}")
+# Prozesslokaler Analyzer der Batch-Worker
+_worker_analyzer = None
 
-        return report_file
+
+def _init_worker(config_path, profile=False):
+    """Erstellt pro Worker-Prozess einen Analyzer mit eigener Konfiguration"""
+    global _worker_analyzer
+    _worker_analyzer = SKKStandaloneAnalyzer(config_path)
+    if profile:
+        _worker_analyzer.enable_profiling()
+
+
+def _analyze_in_worker(filepath, stream=None, start=0, end=None):
+    """Analysiert eine Datei im Worker und liefert eine kompakte Zusammenfassung"""
+    report = _worker_analyzer.analyze_file(
+        filepath, stream=stream, start=start, end=end
+    )
+    return {
+        "datei": filepath,
+        "report": _worker_analyzer.last_report_file,
+        "statistik": report["statistik"],
+        "warnungen": report["warnungen"],
+    }
+
+
+def _analyze_text_in_worker(text, save=False):
+    """Analysiert einen Text im Worker und liefert den vollständigen Report"""
+    report = _worker_analyzer.analyze_text(text, save=save)
+    if save:
+        report["report_file"] = _worker_analyzer.last_report_file
+    return report
+
+
+def _merge_batch_results(directory, results):
+    """Fasst die Ergebnisse eines Batch-Laufs zusammen"""
+    statistik = defaultdict(int)
+    warnungen = defaultdict(int)
+    for result in results:
+        for key, value in result.get("statistik", {}).items():
+            statistik[key] += value
+        for key, value in result.get("warnungen", {}).items():
+            warnungen[key] += value
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "verzeichnis": directory,
+        "dateien": len(results),
+        "fehlgeschlagen": sum(1 for r in results if "fehler" in r),
+        "statistik": dict(statistik),
+        "warnungen": dict(warnungen),
+        "berichte": sorted(results, key=lambda r: r["datei"]),
+    }
+
+
+def run_batch(config_path, directory, workers=1, stream=None, profile=False):
+    """Analysiert alle .txt/.log-Dateien eines Verzeichnisses
+
+    Mit ``workers > 1`` werden die Dateien auf einen Prozess-Pool verteilt,
+    ``workers=0`` nutzt alle CPU-Kerne. Jeder Worker hält seine eigene
+    kompilierte Konfiguration.
+    """
+    filepaths = sorted(
+        os.path.join(directory, filename)
+        for filename in os.listdir(directory)
+        if filename.endswith((".txt", ".log"))
+    )
+    workers = workers or os.cpu_count() or 1
+    results = []
+
+    if workers == 1:
+        _init_worker(config_path, profile)
+        for filepath in filepaths:
+            print(f"Analysiere: {os.path.basename(filepath)}")
+            try:
+                results.append(_analyze_in_worker(filepath, stream))
+            except Exception as e:
+                print(f"❌ Fehler bei {filepath}: {e}")
+                results.append({"datei": filepath, "fehler": str(e)})
+    else:
+        print(f"Analysiere {len(filepaths)} Dateien mit {workers} Prozessen")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(config_path, profile),
+        ) as pool:
+            futures = {
+                pool.submit(_analyze_in_worker, filepath, stream): filepath
+                for filepath in filepaths
+            }
+            for future in as_completed(futures):
+                filepath = futures[future]
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    print(f"❌ Fehler bei {filepath}: {e}")
+                    results.append({"datei": filepath, "fehler": str(e)})
+
+    summary = _merge_batch_results(directory, results)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    summary_file = f"analysen/skk_batch_{timestamp}.yaml"
+    os.makedirs(os.path.dirname(summary_file), exist_ok=True)
+    with open(summary_file, "w", encoding="utf-8") as f:
+        yaml.dump(summary, f, allow_unicode=True)
+
+    print(f"✅ Batch-Analyse abgeschlossen: {summary_file}")
+    return summary
 
 
 # CLI Interface
@@ -368,6 +895,23 @@ if __name__ == "__main__":
     parser.add_argument(
         "--batch", action="store_true", help="Batch-Verarbeitung für Verzeichnis"
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=None,
+        help="Dateien blockweise lesen (Standard: ab performance.stream_threshold)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Laufzeit und Speicher pro Analyse-Stufe im Report erfassen",
+    )
+    parser.add_argument(
+        "--workers",
+        type=_non_negative_int,
+        default=1,
+        help="Anzahl paralleler Prozesse im Batch-Modus (0 = alle CPU-Kerne)",
+    )
 
     args = parser.parse_args()
 
@@ -375,15 +919,18 @@ if __name__ == "__main__":
     if os.path.basename(os.getcwd()) != "SKK":
         os.chdir("SKK")
 
-    analyzer = SKKStandaloneAnalyzer(args.config)
-
     if args.batch and os.path.isdir(args.input):
         # Batch-Verarbeitung
-        for filename in os.listdir(args.input):
-            if filename.endswith((".txt", ".log")):
-                filepath = os.path.join(args.input, filename)
-                print(f"Analysiere: {filename}")
-                analyzer.analyze_file(filepath)
+        run_batch(
+            args.config,
+            args.input,
+            workers=args.workers,
+            stream=args.stream,
+            profile=args.profile,
+        )
     else:
         # Einzeldatei
-        analyzer.analyze_file(args.input)
+        analyzer = SKKStandaloneAnalyzer(args.config)
+        if args.profile:
+            analyzer.enable_profiling()
+        analyzer.analyze_file(args.input, stream=args.stream)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+SKK Chunk Cache
+===============
+Persistenter, inhaltsadressierter Cache für Marker-Treffer pro Chunk
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+
+# Vorgemerkte Einträge werden spätestens nach so vielen Chunks bzw. Bytes
+# geschrieben, damit lange Streams den Cache nicht im Speicher sammeln
+FLUSH_EVERY = 1000
+FLUSH_BYTES = 8 * 1024**2
+
+
+class SKKChunkCache:
+    """Speichert Marker-Treffer pro Chunk in einer SQLite-Datei.
+
+    Schlüssel ist der SHA-256 des Chunk-Inhalts zusammen mit dem Hash der
+    Konfiguration. Ändert sich ``skk_config.yaml``, wird der Cache beim
+    Öffnen geleert. Überschreitet der Cache ``max_size`` Bytes, werden die
+    am längsten nicht genutzten Einträge (LRU) entfernt.
+
+    Neue Einträge und Zugriffe werden gesammelt und in einer Transaktion
+    geschrieben, sobald ``flush_every`` Schlüssel oder ``flush_bytes``
+    Bytes vorgemerkt sind; der Rest spätestens bei ``flush``/``close``.
+    """
+
+    def __init__(self, path, config_hash, max_size,
+                 flush_every=FLUSH_EVERY, flush_bytes=FLUSH_BYTES):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.config_hash = config_hash
+        self.max_size = max_size
+        self.flush_every = flush_every
+        self.flush_bytes = flush_bytes
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS chunks (
+                key TEXT PRIMARY KEY,
+                hits TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS chunks_last_used ON chunks (last_used);
+            """
+        )
+
+        with self.conn:
+            row = self.conn.execute(
+                "SELECT value FROM meta WHERE key = 'config_hash'"
+            ).fetchone()
+            if row is None or row[0] != config_hash:
+                # Neue Konfiguration: alte Treffer sind ungültig
+                self.conn.execute("DELETE FROM chunks")
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) "
+                    "VALUES ('config_hash', ?)",
+                    (config_hash,),
+                )
+
+        self._clock = self.conn.execute(
+            "SELECT COALESCE(MAX(last_used), 0) FROM chunks"
+        ).fetchone()[0]
+        self._pending = {}
+        self._pending_bytes = 0
+        self._touched = set()
+
+    def _key(self, chunk):
+        digest = hashlib.sha256()
+        digest.update(self.config_hash.encode("ascii"))
+        digest.update(b"\0")
+        digest.update(chunk.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, chunk):
+        """Liefert gespeicherte Treffer für einen Chunk oder None"""
+        key = self._key(chunk)
+        if key in self._pending:
+            return json.loads(self._pending[key])
+
+        row = self.conn.execute(
+            "SELECT hits FROM chunks WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._touched.add(key)
+        self._flush_if_full()
+        return json.loads(row[0])
+
+    def put(self, chunk, hits):
+        """Merkt Treffer vor; geschrieben wird gesammelt in ``flush``"""
+        payload = json.dumps(hits, ensure_ascii=False)
+        self._pending[self._key(chunk)] = payload
+        self._pending_bytes += len(payload)
+        self._flush_if_full()
+
+    def _flush_if_full(self):
+        if (len(self._pending) + len(self._touched) >= self.flush_every
+                or self._pending_bytes >= self.flush_bytes):
+            self.flush()
+
+    def flush(self):
+        """Schreibt neue Einträge und Zugriffszeiten in einer Transaktion"""
+        if not self._pending and not self._touched:
+            return
+
+        self._clock += 1
+        rows = [
+            (key, payload, len(key) + len(payload.encode("utf-8")), self._clock)
+            for key, payload in self._pending.items()
+        ]
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO chunks (key, hits, size, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.executemany(
+                "UPDATE chunks SET last_used = ? WHERE key = ?",
+                [(self._clock, key) for key in self._touched],
+            )
+            self._evict()
+
+        self._pending.clear()
+        self._pending_bytes = 0
+        self._touched.clear()
+
+    def _evict(self):
+        """Entfernt die ältesten Einträge, bis ``max_size`` eingehalten ist"""
+        total = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM chunks"
+        ).fetchone()[0]
+        excess = total - self.max_size
+        if excess <= 0:
+            return
+
+        victims = []
+        for key, size in self.conn.execute(
+            "SELECT key, size FROM chunks ORDER BY last_used"
+        ):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self.conn.executemany("DELETE FROM chunks WHERE key = ?", victims)
+
+    def close(self):
+        self.flush()
+        self.conn.close()
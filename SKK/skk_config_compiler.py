@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+SKK Config Compiler
+===================
+Validiert SKK-Konfigurationen und legt sie als versionierte Binär-Artefakte ab
+
+Ein Artefakt enthält die geparste Konfiguration, die normalisierten
+Marker-Tabellen und den fertigen ``SKKMarkerMatcher``. Es ist an mtime,
+Größe und SHA-256 der Quelldatei gebunden: solange sich die Datei nicht
+ändert, entfallen YAML-Parsen und Matcher-Aufbau beim Start.
+"""
+
+import argparse
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+import yaml
+
+from skk_matcher import SKKMarkerMatcher
+
+# Erhöhen, sobald sich Artefakt-Inhalt oder Matcher-Aufbau ändern
+ARTIFACT_VERSION = 1
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# An SKK/ gebunden: Analyzer, Scheduler, Cron und API-Server teilen sich einen
+# Artefakt-Cache, egal aus welchem Verzeichnis sie starten
+ARTIFACT_DIR = os.path.join(BASE_DIR, "cache", "compiled")
+# Nur Quellen, die auch per load_compiled geladen werden; die Framework-Datei
+# (markers/skk_bedeutungsfelder.yaml) lässt sich explizit mit --check prüfen
+DEFAULT_SOURCES = [
+    os.path.join(BASE_DIR, "config", "skk_config.yaml"),
+]
+
+
+class ConfigValidationError(ValueError):
+    def __init__(self, source, errors):
+        super().__init__(f"{source}: " + "; ".join(errors))
+        self.source = source
+        self.errors = errors
+
+
+def _check_markers(name, feld, errors):
+    markers = feld.get("markers")
+    if markers is None:
+        return
+    if not isinstance(markers, list) or not all(
+        isinstance(m, str) and m.strip() for m in markers
+    ):
+        errors.append(f"{name}.markers muss eine Liste nicht-leerer Strings sein")
+
+
+def validate_skk_config(config):
+    """Prüft eine skk_config.yaml, liefert eine Liste von Fehlern"""
+    errors = []
+    if not isinstance(config, dict):
+        return ["Konfiguration muss ein Mapping sein"]
+
+    felder = config.get("bedeutungsfelder")
+    if not isinstance(felder, dict):
+        errors.append("Abschnitt 'bedeutungsfelder' fehlt")
+    else:
+        for family in ("flügel", "strudel", "knoten", "kristalle"):
+            feld = felder.get(family)
+            if not isinstance(feld, dict):
+                errors.append(f"bedeutungsfelder.{family} fehlt")
+            elif not feld.get("markers"):
+                errors.append(f"bedeutungsfelder.{family}.markers fehlt")
+        for family, feld in felder.items():
+            if isinstance(feld, dict):
+                _check_markers(f"bedeutungsfelder.{family}", feld, errors)
+        for family, key in (
+            ("strudel", "hyperfokus_threshold"),
+            ("knoten", "rigidity_warning"),
+            ("kristalle", "clarity_threshold"),
+        ):
+            feld = felder.get(family)
+            if isinstance(feld, dict) and not isinstance(feld.get(key), (int, float)):
+                errors.append(f"bedeutungsfelder.{family}.{key} muss eine Zahl sein")
+
+    performance = config.get("performance")
+    if not isinstance(performance, dict):
+        errors.append("Abschnitt 'performance' fehlt")
+    elif not isinstance(performance.get("chunk_size"), int) or performance["chunk_size"] < 1:
+        errors.append("performance.chunk_size muss eine positive Ganzzahl sein")
+
+    return errors
+
+
+def validate_bedeutungsfelder(document):
+    """Prüft die Framework-Definition (markers/skk_bedeutungsfelder.yaml)"""
+    if not isinstance(document, dict) or not isinstance(
+        document.get("SKK_Bedeutungsfelder"), dict
+    ):
+        return ["Abschnitt 'SKK_Bedeutungsfelder' fehlt"]
+    errors = []
+    for name, feld in document["SKK_Bedeutungsfelder"].items():
+        if isinstance(feld, dict):
+            _check_markers(name, feld, errors)
+    return errors
+
+
+def marker_tables(felder):
+    """Normalisiert {Familie: {markers: [...]}} zu {familie: [marker, ...]}"""
+    return {
+        family.lower(): [marker.lower() for marker in feld["markers"]]
+        for family, feld in felder.items()
+        if isinstance(feld, dict) and feld.get("markers")
+    }
+
+
+def _compile_document(source, document):
+    if isinstance(document, dict) and "SKK_Bedeutungsfelder" in document:
+        errors = validate_bedeutungsfelder(document)
+        felder = document["SKK_Bedeutungsfelder"] if not errors else {}
+    else:
+        errors = validate_skk_config(document)
+        felder = document.get("bedeutungsfelder", {}) if not errors else {}
+    if errors:
+        raise ConfigValidationError(source, errors)
+
+    tables = marker_tables(felder)
+    return {
+        "config": document,
+        "marker_tables": tables,
+        "matcher": SKKMarkerMatcher(tables),
+    }
+
+
+def artifact_path(source, artifact_dir=None):
+    """Artefakt-Datei für eine Quelle (eindeutig pro absolutem Pfad)"""
+    artifact_dir = artifact_dir or ARTIFACT_DIR
+    source = os.path.abspath(source)
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+    name = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(artifact_dir, f"{name}-{digest}.pickle")
+
+
+# _read_artifact/_write_artifact sind bewusst identisch mit den gleichnamigen
+# Funktionen in model-selector/config_compiler.py (eigenständige Verzeichnisse
+# ohne gemeinsames Paket); Änderungen immer in beiden Kopien nachziehen.
+
+
+def _read_artifact(path):
+    """Liest ein Artefakt; unlesbar oder andere Version -> None (neu kompilieren)
+
+    Vertrauensannahme: ``pickle.load`` führt beim Laden beliebigen Code aus.
+    Das Artefaktverzeichnis darf deshalb nur vom Compiler selbst beschrieben
+    werden und nicht für andere Nutzer schreibbar sein; es gibt keine
+    Signaturprüfung der Datei.
+    """
+    try:
+        with open(path, "rb") as f:
+            artifact = pickle.load(f)
+    except (
+        OSError,
+        pickle.UnpicklingError,
+        EOFError,
+        AttributeError,
+        ImportError,
+        ValueError,
+    ):
+        return None
+    if not isinstance(artifact, dict) or artifact.get("version") != ARTIFACT_VERSION:
+        return None
+    return artifact
+
+
+def _write_artifact(path, artifact):
+    """Schreibt atomar; ohne Schreibrechte bleibt es beim In-Memory-Artefakt"""
+    directory = os.path.dirname(path) or "."
+    tmp_path = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path and os.path.exists(tmp_path):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def load_compiled(source, artifact_dir=None, force=False):
+    """Liefert das Artefakt zu ``source`` und kompiliert es bei Bedarf neu.
+
+    Schneller Pfad: stimmen mtime und Größe, wird die Quelle gar nicht
+    gelesen. Sonst entscheidet der SHA-256 (z.B. nach ``touch``).
+    """
+    stat = os.stat(source)
+    path = artifact_path(source, artifact_dir)
+    artifact = None if force else _read_artifact(path)
+    if artifact and (artifact["mtime_ns"], artifact["size"]) == (
+        stat.st_mtime_ns,
+        stat.st_size,
+    ):
+        return artifact
+
+    with open(source, "rb") as f:
+        raw = f.read()
+    sha256 = hashlib.sha256(raw).hexdigest()
+    if artifact is None or artifact["sha256"] != sha256:
+        artifact = _compile_document(source, yaml.safe_load(raw))
+        artifact.update(
+            version=ARTIFACT_VERSION, source=os.path.abspath(source), sha256=sha256
+        )
+
+    artifact.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+    _write_artifact(path, artifact)
+    return artifact
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SKK Config Compiler")
+    parser.add_argument(
+        "sources",
+        nargs="*",
+        default=DEFAULT_SOURCES,
+        help="Zu kompilierende YAML-Dateien",
+    )
+    parser.add_argument(
+        "--artifact-dir",
+        default=ARTIFACT_DIR,
+        help="Zielverzeichnis",
+    )
+    parser.add_argument("--check", action="store_true", help="Nur validieren")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for source in args.sources:
+        try:
+            if args.check:
+                with open(source, "r", encoding="utf-8") as f:
+                    _compile_document(source, yaml.safe_load(f))
+                print(f"✅ {source}: gültig")
+            else:
+                artifact = load_compiled(source, args.artifact_dir, force=True)
+                families = ", ".join(artifact["marker_tables"])
+                print(f"✅ {source}: {families}")
+        except (OSError, yaml.YAMLError, ConfigValidationError) as e:
+            print(f"❌ {e}")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
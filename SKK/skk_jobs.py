@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+SKK Job Runner
+==============
+Analyse-Jobs in eigenen Prozessen mit Zeitlimit, Wiederholung und
+begrenzter Parallelität
+"""
+
+import logging
+import multiprocessing
+import time
+from collections import deque
+
+from skk_analyzer_standalone import _analyze_in_worker, _init_worker
+
+logger = logging.getLogger(__name__)
+
+
+def _run_job(conn, config_path, filepath, start, end):
+    """Einstiegspunkt des Job-Prozesses: analysiert und meldet per Pipe"""
+    try:
+        _init_worker(config_path)
+        conn.send(("ok", _analyze_in_worker(filepath, start=start, end=end)))
+    except BaseException as e:
+        conn.send(("fehler", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+class SKKJob:
+    def __init__(self, filepath, start=0, end=None):
+        self.filepath = filepath
+        self.start = start
+        self.end = end
+        self.attempt = 0
+        self.not_before = 0.0
+        self.deadline = None
+        self.process = None
+        self.conn = None
+        self.result = None
+        self.error = None
+
+
+class SKKJobRunner:
+    """Verteilt Dateianalysen auf höchstens ``workers`` Prozesse.
+
+    Jeder Versuch läuft in einem eigenen Prozess, der nach ``timeout``
+    Sekunden beendet wird. Fehlgeschlagene Jobs werden bis zu ``retries``
+    Mal wiederholt, jeweils nach ``backoff * 2**(versuch - 1)`` Sekunden.
+    ``poll()`` blockiert nie, damit der aufrufende Scheduler reaktiv bleibt.
+    """
+
+    def __init__(self, config_path, workers=2, timeout=600, retries=2, backoff=30):
+        self.config_path = config_path
+        self.workers = workers
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.waiting = deque()
+        self.running = []
+        self.done = 0
+        self.failed = 0
+        self._files = set()
+
+    def __contains__(self, filepath):
+        return filepath in self._files
+
+    @property
+    def active(self):
+        return bool(self.waiting or self.running)
+
+    def submit(self, filepath, start=0, end=None):
+        """Reiht eine Datei (bzw. einen Byte-Bereich) ein"""
+        self._files.add(filepath)
+        self.waiting.append(SKKJob(filepath, start, end))
+
+    def poll(self):
+        """Sammelt beendete Jobs ein und startet wartende.
+
+        Liefert die endgültig abgeschlossenen Jobs; erfolgreiche tragen
+        ``result``, endgültig gescheiterte ``error``.
+        """
+        finished = []
+        now = time.monotonic()
+
+        for job in list(self.running):
+            outcome = self._check(job, now)
+            if outcome is None:
+                continue
+            self.running.remove(job)
+            status, payload = outcome
+            if status == "ok":
+                job.result, job.error = payload, None
+            elif job.attempt <= self.retries:
+                job.not_before = now + self.backoff * 2 ** (job.attempt - 1)
+                job.error = payload
+                self.waiting.append(job)
+                logger.warning(
+                    f"Versuch {job.attempt} für {job.filepath} fehlgeschlagen "
+                    f"({payload}), neuer Versuch in {job.not_before - now:.0f}s"
+                )
+                continue
+            else:
+                job.error = payload
+            self._files.discard(job.filepath)
+            finished.append(job)
+
+        # Nur fällige Jobs starten; zurückgestellte bleiben in der Reihenfolge
+        for _ in range(len(self.waiting)):
+            if len(self.running) >= self.workers:
+                break
+            job = self.waiting.popleft()
+            if job.not_before > now:
+                self.waiting.append(job)
+                continue
+            self._start(job, now)
+
+        for job in finished:
+            if job.result is not None:
+                self.done += 1
+            else:
+                self.failed += 1
+        return finished
+
+    def _start(self, job, now):
+        job.attempt += 1
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        job.process = multiprocessing.Process(
+            target=_run_job,
+            args=(sender, self.config_path, job.filepath, job.start, job.end),
+            name=f"skk-job-{job.filepath}",
+            daemon=True,
+        )
+        job.process.start()
+        sender.close()
+        job.conn = receiver
+        job.deadline = now + self.timeout
+        self.running.append(job)
+
+    def _check(self, job, now):
+        """Liefert (status, payload), sobald der aktuelle Versuch vorbei ist"""
+        if job.conn.poll():
+            try:
+                outcome = job.conn.recv()
+            except EOFError:
+                outcome = None
+        elif not job.process.is_alive():
+            outcome = None
+        elif now >= job.deadline:
+            job.process.terminate()
+            outcome = ("fehler", f"Zeitlimit von {self.timeout}s überschritten")
+        else:
+            return None
+
+        job.process.join(timeout=5)
+        if job.process.is_alive():
+            job.process.kill()
+            job.process.join()
+        job.conn.close()
+        if outcome is None:
+            # Ohne Meldung beendet, z.B. durch Speicher-Kill oder Absturz
+            exitcode = job.process.exitcode
+            outcome = ("fehler", f"Prozess beendet (Exit-Code {exitcode})")
+        return outcome
+
+    def progress(self):
+        return {
+            "erledigt": self.done,
+            "fehlgeschlagen": self.failed,
+            "laufend": len(self.running),
+            "wartend": len(self.waiting),
+        }
+
+    def wait(self, interval=0.5):
+        """Blockiert, bis alle Jobs abgeschlossen sind, und liefert sie"""
+        finished = []
+        while self.active:
+            finished.extend(self.poll())
+            time.sleep(interval)
+        return finished
+
+    def shutdown(self):
+        """Bricht laufende Versuche ab und verwirft wartende Jobs"""
+        for job in self.running:
+            job.process.terminate()
+            job.process.join()
+            job.conn.close()
+        self.running.clear()
+        self.waiting.clear()
+        self._files.clear()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+SKK Logging
+===========
+Queue-basiertes Logging mit gebündelten Schreibzugriffen im Hintergrund
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from multiprocessing import util as multiprocessing_util
+
+_STOP = object()
+_listener = None
+_queue_handler = None
+_settings = None
+
+
+class BatchingLogListener(threading.Thread):
+    """Schreibt Log-Records aus einer Queue gebündelt in eine Datei.
+
+    Der Thread blockiert auf den ersten Record und nimmt dann alles mit,
+    was bereits in der Queue wartet (bis ``batch_size``). Unter Last
+    entstehen so große Schreibblöcke, im Leerlauf wird sofort geschrieben.
+    """
+
+    def __init__(self, log_queue, handler, batch_size=512):
+        super().__init__(name="skk-log-writer", daemon=True)
+        self.queue = log_queue
+        self.handler = handler
+        self.batch_size = batch_size
+
+    def run(self):
+        stopping = False
+        while not stopping:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if _STOP in batch:
+                stopping = True
+                batch = [record for record in batch if record is not _STOP]
+            self._write(batch)
+
+    def _write(self, records):
+        if not records:
+            return
+        handler = self.handler
+        lines = []
+        for record in records:
+            if record.levelno < handler.level:
+                continue
+            try:
+                lines.append(handler.format(record) + handler.terminator)
+            except Exception:
+                handler.handleError(record)
+        if not lines:
+            return
+        handler.acquire()
+        try:
+            handler.stream.write("".join(lines))
+            handler.stream.flush()
+        finally:
+            handler.release()
+
+    def stop(self):
+        self.queue.put(_STOP)
+        self.join()
+        self.handler.close()
+
+
+def install_queue_logging(filename, level=logging.INFO, fmt=None, batch_size=512):
+    """Wie ``logging.basicConfig(filename=...)``, aber ohne Blockieren auf I/O.
+
+    Hat der Root-Logger bereits Handler, bleibt er – wie bei basicConfig –
+    unverändert. Beim Prozessende werden ausstehende Records geschrieben.
+    """
+    global _listener, _queue_handler, _settings
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    file_handler = logging.FileHandler(filename, encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter(fmt))
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+    _settings = (filename, level, fmt, batch_size)
+    _listener = BatchingLogListener(log_queue, file_handler, batch_size)
+    _listener.start()
+    _finalize_at_exit()
+    return _listener
+
+
+def _finalize_at_exit():
+    """Worker-Prozesse enden ohne atexit, führen aber Finalizer aus"""
+    if _queue_handler is not None:
+        multiprocessing_util.Finalize(None, stop_queue_logging, exitpriority=10)
+
+
+def stop_queue_logging():
+    """Leert die Queue und beendet den Schreib-Thread"""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None and _listener.is_alive():
+        _listener.stop()
+    _listener = None
+
+
+def _restart_after_fork():
+    """Geforkte Worker erben den Queue-Handler, aber nicht den Schreib-Thread"""
+    global _listener, _queue_handler
+    if _queue_handler is None:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    _queue_handler = None
+    _listener = None
+    install_queue_logging(*_settings)
+
+
+atexit.register(stop_queue_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+# multiprocessing leert im Kind die Finalizer erst nach den at-fork-Hooks;
+# danach den Stopp des neuen Schreib-Threads erneut eintragen
+multiprocessing_util.register_after_fork(_finalize_at_exit, lambda finalize: finalize())
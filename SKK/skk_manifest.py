@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+SKK Manifest
+============
+Persistentes Verzeichnis bereits analysierter Eingabedateien für
+inkrementelle Läufe (nur neue Dateien und angehängte Log-Enden)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+
+# Bytes am Anfang und vor dem Offset, die in den Fingerabdruck eingehen
+FINGERPRINT_BYTES = 64 * 1024
+
+SCHEDULER_MODES = ("daily", "watch")
+
+
+def scheduler_mode(config):
+    """``scheduler.mode``: täglicher Lauf oder Watch-Daemon, nie beide.
+
+    Beide führen eigene Manifeste über dieselben ``input_sources``; liefen
+    sie gleichzeitig, würde jede Eingabe doppelt analysiert.
+    """
+    mode = (config.get("scheduler") or {}).get("mode", "daily")
+    if mode not in SCHEDULER_MODES:
+        raise ValueError(f"Unbekannter Scheduler-Modus: {mode}")
+    return mode
+
+
+def fingerprint(filepath, offset):
+    """SHA-256 über Anfang und Ende des bereits verarbeiteten Bereichs.
+
+    Erkennt Rotation, Kürzung oder Neuschreiben einer Datei, ohne bei jedem
+    Lauf das ganze (wachsende) Log erneut zu lesen.
+    """
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        digest.update(f.read(min(offset, FINGERPRINT_BYTES)))
+        tail_start = max(offset - FINGERPRINT_BYTES, FINGERPRINT_BYTES)
+        if tail_start < offset:
+            f.seek(tail_start)
+            digest.update(f.read(offset - tail_start))
+    return digest.hexdigest()
+
+
+def _last_line_end(filepath, start, end):
+    """Offset direkt hinter dem letzten Zeilenumbruch in [start, end)"""
+    block = 64 * 1024
+    with open(filepath, "rb") as f:
+        position = end
+        while position > start:
+            read_from = max(start, position - block)
+            f.seek(read_from)
+            data = f.read(position - read_from)
+            newline = data.rfind(b"\n")
+            if newline != -1:
+                return read_from + newline + 1
+            position = read_from
+    return start
+
+
+class SKKManifest:
+    """Merkt sich pro Datei Größe, mtime, Fingerabdruck und Offset.
+
+    ``pending()`` liefert den noch nicht analysierten Byte-Bereich einer
+    Datei. Wachsende Logs werden nur bis zum letzten vollständigen
+    Zeilenumbruch verarbeitet; die angefangene Zeile folgt im nächsten Lauf.
+    Dateien, die seit ``settle_seconds`` unverändert sind, werden bis zum
+    Ende gelesen, damit auch Texte ohne abschließenden Umbruch durchgehen.
+    """
+
+    def __init__(self, path="processed/manifest.json", settle_seconds=300):
+        self.path = path
+        self.settle_seconds = settle_seconds
+        self._planned = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except FileNotFoundError:
+            self.entries = {}
+
+    def pending(self, filepath):
+        """Liefert (start, end) des neuen Bereichs oder None, wenn nichts zu tun ist"""
+        stat = os.stat(filepath)
+        entry = self.entries.get(filepath)
+        start = 0
+
+        if entry:
+            if (entry["offset"], entry["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                return None
+            if stat.st_size >= entry["offset"] and entry["sha256"] == fingerprint(
+                filepath, entry["offset"]
+            ):
+                start = entry["offset"]
+            # sonst: gekürzt, rotiert oder umgeschrieben -> komplett neu
+
+        end = stat.st_size
+        if time.time() - stat.st_mtime < self.settle_seconds:
+            end = _last_line_end(filepath, start, end)
+        if end <= start:
+            return None
+
+        self._planned[filepath] = stat
+        return start, end
+
+    def mark(self, filepath, end):
+        """Verbucht ``filepath`` als bis ``end`` analysiert"""
+        stat = self._planned.pop(filepath, None) or os.stat(filepath)
+        self.entries[filepath] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "offset": end,
+            "sha256": fingerprint(filepath, end),
+            "processed_at": datetime.now().isoformat(),
+        }
+
+    def prune(self):
+        """Entfernt Einträge für nicht mehr vorhandene Dateien"""
+        for filepath in [p for p in self.entries if not os.path.exists(p)]:
+            del self.entries[filepath]
+
+    def save(self):
+        """Schreibt das Manifest atomar (temporäre Datei + rename)"""
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
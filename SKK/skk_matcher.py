@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+SKK Marker Matcher
+==================
+Kompilierter Mehrfach-Marker-Matcher für alle Bedeutungsfelder
+"""
+
+import re
+
+
+class SKKMarkerMatcher:
+    """Findet alle Marker-Präfixe aller Bedeutungsfelder in einem Durchlauf.
+
+    Die Semantik entspricht ``re.findall(rf"\\b{marker}\\w*\\b", text.lower())``
+    pro Marker: jedes Wort, das mit einem Marker beginnt, zählt als Treffer
+    für diesen Marker. Ein Wort kann mehreren Markern zugeordnet werden, wenn
+    ein Marker Präfix eines anderen ist.
+    """
+
+    def __init__(self, marker_tables):
+        # marker_tables: {"flügel": ["ahnung", ...], "strudel": [...], ...}
+        self.families = {}
+        self._prefix_index = {}
+        for family, markers in marker_tables.items():
+            normalized = [m.lower() for m in markers]
+            self.families[family] = normalized
+            for marker in normalized:
+                self._prefix_index.setdefault(marker, []).append(family)
+
+        self._prefix_lengths = sorted(
+            {len(marker) for marker in self._prefix_index}, reverse=True
+        )
+
+        if self._prefix_index:
+            alternation = "|".join(
+                re.escape(marker)
+                for marker in sorted(self._prefix_index, key=len, reverse=True)
+            )
+            self.pattern = re.compile(rf"\b(?:{alternation})\w*\b")
+        else:
+            self.pattern = None
+
+    @classmethod
+    def from_config(cls, config):
+        """Baut den Matcher aus einer geladenen skk_config.yaml"""
+        tables = {
+            family: feld.get("markers", [])
+            for family, feld in config.get("bedeutungsfelder", {}).items()
+            if isinstance(feld, dict) and feld.get("markers")
+        }
+        return cls(tables)
+
+    def match(self, text):
+        """Liefert {familie: {marker: [treffer, ...]}} für einen Text.
+
+        Die Marker erscheinen in Konfigurationsreihenfolge, die Treffer in
+        Textreihenfolge; Marker ohne Treffer werden ausgelassen.
+        """
+        hits = {
+            family: {marker: [] for marker in markers}
+            for family, markers in self.families.items()
+        }
+        if self.pattern is None:
+            return {family: {} for family in hits}
+
+        for match in self.pattern.finditer(text.lower()):
+            word = match.group()
+            for length in self._prefix_lengths:
+                prefix = word[:length]
+                if len(prefix) == length and prefix in self._prefix_index:
+                    for family in self._prefix_index[prefix]:
+                        hits[family][prefix].append(word)
+
+        return {
+            family: {marker: found for marker, found in markers.items() if found}
+            for family, markers in hits.items()
+        }
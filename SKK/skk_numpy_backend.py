@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+SKK NumPy Backend
+=================
+Vektorisierte Strudel-/Knoten-Bildung über eine Chunks × Marker-Zählmatrix
+
+Kristalle laufen in beiden Backends über denselben Python-Pfad: aus den
+letzten drei Knoten entsteht höchstens ein Kristall, der Aufwand hängt also
+weder von der Chunk- noch von der Knotenzahl ab und es gibt keine Schleife
+über die Zählmatrix, die sich vektorisieren ließe.
+"""
+
+import importlib.util
+
+# NumPy ist optional und wird erst geladen, wenn das Backend rechnet;
+# Läufe mit backend "python" zahlen den Import nicht
+np = None
+
+
+def numpy_available():
+    return importlib.util.find_spec("numpy") is not None
+
+
+def _numpy():
+    global np
+    if np is None:
+        import numpy
+
+        np = numpy
+    return np
+
+
+class SKKCountMatrix:
+    """Zählt Marker-Treffer als Chunks × Marker-Integer-Array"""
+
+    def __init__(self, markers, initial_rows=1024):
+        _numpy()
+        self.markers = list(markers)
+        self.columns = {marker: i for i, marker in enumerate(self.markers)}
+        self.counts = np.zeros((initial_rows, len(self.markers)), dtype=np.int32)
+        self.rows = 0
+
+    def record(self, chunk_idx, marker_hits):
+        """Trägt die Treffer eines Chunks ({marker: [treffer, ...]}) ein"""
+        if chunk_idx >= len(self.counts):
+            # Kapazität verdoppeln statt pro Chunk neu zu allozieren
+            grown = np.zeros(
+                (max(chunk_idx + 1, 2 * len(self.counts)), len(self.markers)),
+                dtype=np.int32,
+            )
+            grown[: self.rows] = self.counts[: self.rows]
+            self.counts = grown
+
+        for marker, matches in marker_hits.items():
+            self.counts[chunk_idx, self.columns[marker]] = len(matches)
+        self.rows = max(self.rows, chunk_idx + 1)
+
+    @property
+    def matrix(self):
+        return self.counts[: self.rows]
+
+
+def strudel_candidates(count_matrix, hyperfokus_threshold, min_fluegel=2):
+    """Liefert (chunk_indizes, anziehungskraft, hyperfokus) für Strudel-Chunks"""
+    _numpy()
+    matrix = count_matrix.matrix
+    fluegel_per_chunk = np.count_nonzero(matrix, axis=1)
+    anziehungskraft = matrix.sum(axis=1)
+
+    chunks = np.flatnonzero(fluegel_per_chunk >= min_fluegel)
+    anziehungskraft = anziehungskraft[chunks]
+    return chunks, anziehungskraft, anziehungskraft >= hyperfokus_threshold
+
+
+def knoten_candidates(anziehungskraft, min_anziehungskraft=5):
+    """Liefert (strudel_indizes, strukturfestigkeit) für Knoten-Strudel"""
+    _numpy()
+    strudel = np.flatnonzero(anziehungskraft > min_anziehungskraft)
+    rigidity = np.minimum(anziehungskraft[strudel] / 10, 1.0)
+    return strudel, rigidity
+
+
+def fluegel_slices(fluegel_chunks, chunks):
+    """Start-/Endindizes der Flügel je Chunk in der chunk-sortierten Flügelliste"""
+    _numpy()
+    fluegel_chunks = np.asarray(fluegel_chunks, dtype=np.int64)
+    return (
+        np.searchsorted(fluegel_chunks, chunks, side="left"),
+        np.searchsorted(fluegel_chunks, chunks, side="right"),
+    )
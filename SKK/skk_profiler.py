@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+SKK Stage Profiler
+==================
+Laufzeit, Aufrufzahl und Speicherspitze pro Analyse-Stufe
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class SKKStageProfiler:
+    """Misst die Stufen eines Analyse-Laufs.
+
+    Pro Stufe werden Wanduhrzeit, Anzahl der Aufrufe und – falls
+    ``trace_memory`` aktiv ist – die höchste zusätzliche Speicherbelegung
+    laut ``tracemalloc`` erfasst.
+    """
+
+    active = True
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.stages = {}
+        self._started_tracing = False
+        self._start = time.perf_counter()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def _record(self, name, elapsed, memory_peak):
+        stage = self.stages.setdefault(
+            name, {"calls": 0, "wall_time_sec": 0.0, "memory_peak_bytes": 0}
+        )
+        stage["calls"] += 1
+        stage["wall_time_sec"] += elapsed
+        stage["memory_peak_bytes"] = max(stage["memory_peak_bytes"], memory_peak)
+
+    @contextmanager
+    def stage(self, name):
+        """Misst einen Block als Stufe ``name``"""
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            memory_peak = 0
+            if self.trace_memory:
+                memory_peak = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+            self._record(name, elapsed, memory_peak)
+
+    def iterate(self, name, iterable):
+        """Misst jedes ``next()`` eines (lazy) Iterators als Stufe ``name``"""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def summary(self):
+        return {
+            "total_wall_time_sec": round(time.perf_counter() - self._start, 6),
+            "trace_memory": self.trace_memory,
+            "stages": {
+                name: dict(stage, wall_time_sec=round(stage["wall_time_sec"], 6))
+                for name, stage in self.stages.items()
+            },
+        }
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+class NullProfiler:
+    """Platzhalter ohne Messaufwand, wenn Profiling aus ist"""
+
+    active = False
+
+    @contextmanager
+    def stage(self, name):
+        yield
+
+    def iterate(self, name, iterable):
+        return iterable
+
+    def stop(self):
+        pass
+
+
+def append_metrics(path, record):
+    """Hängt einen Messdatensatz als JSON-Zeile an ``path`` an"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
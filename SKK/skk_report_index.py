@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+SKK Report Index
+================
+SQLite-Index über die gespeicherten SKK-Reports für Zeitraum- und
+Aggregat-Abfragen, ohne die YAML-Dateien erneut zu lesen
+
+Beispiele:
+  python skk_report_index.py ingest
+  python skk_report_index.py aggregate hyperfokus_strudel --by day --since 2026-07-01
+  python skk_report_index.py elements --typ strudel --warnungen --since 2026-07-01
+"""
+
+import argparse
+import glob
+import json
+import os
+import sqlite3
+import sys
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml nicht verfügbar
+    from yaml import SafeLoader
+
+DEFAULT_INDEX = "analysen/skk_index.sqlite"
+REPORT_PATTERN = "skk_report_*.yaml"
+
+COUNT_COLUMNS = ("flügel", "strudel", "knoten", "kristalle", "metamarker")
+WARNING_COLUMNS = ("hyperfokus_strudel", "rigide_knoten")
+METRICS = COUNT_COLUMNS + WARNING_COLUMNS
+
+# Gruppierung -> SQL-Ausdruck über reports.timestamp (ISO-8601)
+GROUPINGS = {
+    "hour": "substr(timestamp, 1, 13)",
+    "day": "substr(timestamp, 1, 10)",
+    "month": "substr(timestamp, 1, 7)",
+    "quelle": "quelle",
+    "total": "'gesamt'",
+}
+
+# Kennzahl pro Element, je nach Typ
+ELEMENT_VALUES = {
+    "flügel": "count",
+    "strudel": "anziehungskraft",
+    "knoten": "strukturfestigkeit",
+    "kristalle": "klarheit",
+}
+
+
+def _element_timestamp(element):
+    return element.get("timestamp") or element.get("timestamp_start")
+
+
+class SKKReportIndex:
+    """Inkrementeller Index über ``analysen/skk_report_*.yaml``.
+
+    Bereits indizierte Dateien werden anhand von mtime und Größe erkannt
+    und übersprungen; geänderte Reports werden ersetzt. Gelöschte Reports
+    bleiben im Index, damit die Historie Aufräumläufe überdauert.
+    """
+
+    def __init__(self, path=DEFAULT_INDEX):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        count_columns = "".join(
+            f'"{c}" INTEGER NOT NULL DEFAULT 0,\n' for c in METRICS
+        )
+        self.conn.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS reports (
+                report TEXT PRIMARY KEY,
+                timestamp TEXT NOT NULL,
+                quelle TEXT,
+                {count_columns}
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS elements (
+                report TEXT NOT NULL,
+                typ TEXT NOT NULL,
+                element_id TEXT NOT NULL,
+                timestamp TEXT,
+                chunk INTEGER,
+                wert REAL,
+                warnung TEXT
+            );
+            CREATE INDEX IF NOT EXISTS reports_timestamp ON reports (timestamp);
+            CREATE INDEX IF NOT EXISTS elements_typ_timestamp
+                ON elements (typ, timestamp);
+            CREATE INDEX IF NOT EXISTS elements_report ON elements (report);
+            """
+        )
+
+    def ingest(self, paths=("analysen",)):
+        """Nimmt neue oder geänderte Reports auf, liefert deren Anzahl.
+
+        ``paths`` dürfen Report-Dateien oder Verzeichnisse sein.
+        """
+        known = {
+            row["report"]: (row["mtime_ns"], row["size"])
+            for row in self.conn.execute(
+                "SELECT report, mtime_ns, size FROM reports"
+            )
+        }
+
+        ingested = 0
+        for filepath in map(os.path.normpath, self._report_files(paths)):
+            stat = os.stat(filepath)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if known.get(filepath) == signature:
+                continue
+            try:
+                with open(filepath, "r", encoding="utf-8") as f:
+                    report = yaml.load(f, Loader=SafeLoader)
+            except yaml.YAMLError as e:
+                print(f"⚠️ Überspringe {filepath}: {e}", file=sys.stderr)
+                continue
+            if not isinstance(report, dict) or "timestamp" not in report:
+                continue
+            # Eine Transaktion pro Report: ein Abbruch hinterlässt nichts Halbes
+            with self.conn:
+                self._insert(filepath, signature, report)
+            ingested += 1
+        return ingested
+
+    def _report_files(self, paths):
+        for path in paths:
+            if os.path.isdir(path):
+                yield from sorted(glob.glob(os.path.join(path, REPORT_PATTERN)))
+            elif os.path.isfile(path):
+                yield path
+
+    def _insert(self, filepath, signature, report):
+        counts = {**report.get("statistik", {}), **report.get("warnungen", {})}
+        columns = ", ".join(f'"{c}"' for c in METRICS)
+        placeholders = ", ".join("?" for _ in METRICS)
+
+        self.conn.execute("DELETE FROM elements WHERE report = ?", (filepath,))
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO reports "
+            f"(report, timestamp, quelle, {columns}, mtime_ns, size) "
+            f"VALUES (?, ?, ?, {placeholders}, ?, ?)",
+            (
+                filepath,
+                str(report["timestamp"]),
+                report.get("quelle"),
+                *(int(counts.get(c, 0)) for c in METRICS),
+                *signature,
+            ),
+        )
+        self.conn.executemany(
+            "INSERT INTO elements "
+            "(report, typ, element_id, timestamp, chunk, wert, warnung) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    filepath,
+                    typ,
+                    element.get("id"),
+                    _element_timestamp(element),
+                    element.get("chunk", element.get("chunk_start")),
+                    element.get(ELEMENT_VALUES.get(typ)),
+                    element.get("warnung"),
+                )
+                for typ, elemente in (report.get("bedeutungsfelder") or {}).items()
+                for element in elemente or []
+            ],
+        )
+
+    @staticmethod
+    def _conditions(since=None, until=None, quelle=None, column="timestamp"):
+        clauses, params = [], []
+        if since:
+            clauses.append(f"{column} >= ?")
+            params.append(since)
+        if until:
+            # Obergrenze exklusiv, damit "--until 2026-08-01" den 31.7. einschließt
+            clauses.append(f"{column} < ?")
+            params.append(until)
+        if quelle:
+            clauses.append("quelle = ?")
+            params.append(quelle)
+        return clauses, params
+
+    @staticmethod
+    def _where(clauses):
+        return " WHERE " + " AND ".join(clauses) if clauses else ""
+
+    def reports(self, since=None, until=None, quelle=None):
+        """Kopfdaten aller Reports im Zeitraum, ältester zuerst"""
+        clauses, params = self._conditions(since, until, quelle)
+        rows = self.conn.execute(
+            f"SELECT * FROM reports{self._where(clauses)} ORDER BY timestamp", params
+        )
+        return [dict(row) for row in rows]
+
+    def aggregate(self, metric, by="day", since=None, until=None, quelle=None):
+        """Summiert ``metric`` pro Gruppe, z.B. Hyperfokus-Strudel pro Tag"""
+        if metric not in METRICS:
+            raise ValueError(
+                f"Unbekannte Kennzahl: {metric} (erlaubt: {', '.join(METRICS)})"
+            )
+        if by not in GROUPINGS:
+            raise ValueError(
+                f"Unbekannte Gruppierung: {by} (erlaubt: {', '.join(GROUPINGS)})"
+            )
+        clauses, params = self._conditions(since, until, quelle)
+        rows = self.conn.execute(
+            f'SELECT {GROUPINGS[by]} AS gruppe, SUM("{metric}") AS summe, '
+            f"COUNT(*) AS reports FROM reports{self._where(clauses)} "
+            "GROUP BY gruppe ORDER BY gruppe",
+            params,
+        )
+        return [dict(row) for row in rows]
+
+    def elements(self, typ=None, since=None, until=None, warnungen=False, limit=None):
+        """Einzelne Elemente im Zeitraum, optional nur solche mit Warnung"""
+        clauses, params = self._conditions(since, until, column="e.timestamp")
+        if typ:
+            clauses.append("e.typ = ?")
+            params.append(typ)
+        if warnungen:
+            clauses.append("e.warnung IS NOT NULL")
+        sql = (
+            "SELECT e.*, r.quelle FROM elements e JOIN reports r USING (report)"
+            + self._where(clauses)
+            + " ORDER BY e.timestamp"
+        )
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def close(self):
+        self.conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SKK Report-Index")
+    parser.add_argument("--index", help=f"Index-Datei (Standard: {DEFAULT_INDEX})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="Reports indizieren")
+    ingest.add_argument("paths", nargs="*", help="Reports/Verzeichnisse (Standard: analysen)")
+
+    def add_range(sub):
+        sub.add_argument("--since", help="Ab Zeitpunkt (ISO, z.B. 2026-07-01)")
+        sub.add_argument("--until", help="Bis ausschließlich Zeitpunkt (ISO)")
+        sub.add_argument("--json", action="store_true", help="Ausgabe als JSON")
+
+    reports = commands.add_parser("reports", help="Reports im Zeitraum auflisten")
+    add_range(reports)
+    reports.add_argument("--quelle", help="Nur Reports dieser Eingabedatei")
+
+    aggregate = commands.add_parser(
+        "aggregate", help="Kennzahl pro Zeitraum summieren"
+    )
+    aggregate.add_argument("metric", choices=METRICS)
+    aggregate.add_argument("--by", choices=GROUPINGS, default="day")
+    aggregate.add_argument("--quelle", help="Nur Reports dieser Eingabedatei")
+    add_range(aggregate)
+
+    elements = commands.add_parser("elements", help="Elemente im Zeitraum auflisten")
+    elements.add_argument("--typ", choices=COUNT_COLUMNS)
+    elements.add_argument("--warnungen", action="store_true", help="Nur mit Warnung")
+    elements.add_argument("--limit", type=int)
+    add_range(elements)
+
+    args = parser.parse_args(argv)
+
+    index_path = os.path.abspath(args.index) if args.index else DEFAULT_INDEX
+    paths = [os.path.abspath(p) for p in getattr(args, "paths", None) or ()]
+    # Standardpfade (analysen/) wie beim Analyzer relativ zu SKK/
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    index = SKKReportIndex(index_path)
+    try:
+        if args.command == "ingest":
+            print(f"✅ {index.ingest(paths or ['analysen'])} Reports indiziert")
+            return 0
+        if args.command == "reports":
+            rows = index.reports(args.since, args.until, args.quelle)
+            columns = ("timestamp", "quelle") + METRICS
+        elif args.command == "aggregate":
+            rows = index.aggregate(
+                args.metric, args.by, args.since, args.until, args.quelle
+            )
+            columns = ("gruppe", "summe", "reports")
+        else:
+            rows = index.elements(
+                args.typ, args.since, args.until, args.warnungen, args.limit
+            )
+            columns = ("timestamp", "typ", "element_id", "wert", "warnung", "quelle")
+
+        if args.json:
+            print(json.dumps(rows, ensure_ascii=False, indent=2))
+        else:
+            print("\t".join(columns))
+            for row in rows:
+                print("\t".join("" if row[c] is None else str(row[c]) for c in columns))
+        return 0
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
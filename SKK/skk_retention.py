@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+SKK Retention
+=============
+Löscht abgelaufene Bedeutungsfeld-Dateien und MIND-Gedanken laut
+konfigurierter Lebensdauer über einen nach Ablaufzeit sortierten Index
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import time
+
+import yaml
+
+DURATION_UNITS = {
+    "s": 1,
+    "sek": 1,
+    "sekunden": 1,
+    "sec": 1,
+    "seconds": 1,
+    "min": 60,
+    "minute": 60,
+    "minuten": 60,
+    "minutes": 60,
+    "h": 3600,
+    "std": 3600,
+    "stunde": 3600,
+    "stunden": 3600,
+    "hour": 3600,
+    "hours": 3600,
+    "d": 86400,
+    "tag": 86400,
+    "tage": 86400,
+    "day": 86400,
+    "days": 86400,
+    "w": 7 * 86400,
+    "woche": 7 * 86400,
+    "wochen": 7 * 86400,
+    "week": 7 * 86400,
+    "weeks": 7 * 86400,
+    "jahr": 365 * 86400,
+    "jahre": 365 * 86400,
+    "year": 365 * 86400,
+    "years": 365 * 86400,
+}
+PERMANENT = ("permanent", "forever", "never", "nie")
+
+
+def parse_duration(value):
+    """Wandelt "15min", "2 stunden" oder "30 days" in Sekunden um.
+
+    "permanent" (oder keine Angabe) liefert None: nie löschen.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().lower()
+    if text in PERMANENT:
+        return None
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*([a-z]+)", text)
+    if not match or match.group(2) not in DURATION_UNITS:
+        raise ValueError(f"Ungültige Lebensdauer: {value}")
+    return float(match.group(1)) * DURATION_UNITS[match.group(2)]
+
+
+def retention_enabled(config):
+    """Lebensdauer nur durchsetzen, wenn ``retention.enabled`` gesetzt ist.
+
+    Gemeinsamer Standard für Analyzer und Scheduler: ohne Abschnitt wird
+    weder registriert noch gelöscht.
+    """
+    return bool((config.get("retention") or {}).get("enabled", False))
+
+
+def retention_rules(config):
+    """{Verzeichnis: Lebensdauer in Sekunden oder None} laut Konfiguration.
+
+    Umfasst die Bedeutungsfeld-Verzeichnisse (``bedeutungsfelder.*.retention``)
+    und, falls ``retention.mind_config`` gesetzt ist, die Kategorien aus
+    ``thoughts.retention_policy`` der MIND-Konfiguration.
+    """
+    # Element-Dateien liegen unter {output.path}/{typ}/ (YAML-Ablage)
+    output = config.get("output") or {}
+    base = output.get("path", ".") if output.get("format", "yaml") == "yaml" else "."
+    rules = {
+        os.path.normpath(os.path.join(base, typ)): parse_duration(feld.get("retention"))
+        for typ, feld in config.get("bedeutungsfelder", {}).items()
+        if isinstance(feld, dict)
+    }
+
+    retention_config = config.get("retention") or {}
+    mind_config = retention_config.get("mind_config")
+    if mind_config and os.path.exists(mind_config):
+        with open(mind_config, "r", encoding="utf-8") as f:
+            mind = yaml.safe_load(f) or {}
+        policy = (mind.get("thoughts") or {}).get("retention_policy") or {}
+        thoughts_dir = retention_config.get(
+            "mind_thoughts",
+            os.path.join(os.path.dirname(mind_config), "..", "thoughts"),
+        )
+        for category, lifetime in policy.items():
+            rules[os.path.normpath(os.path.join(thoughts_dir, category))] = (
+                parse_duration(lifetime)
+            )
+    return rules
+
+
+class SKKRetentionIndex:
+    """SQLite-Index aller löschbaren Dateien, sortiert nach Ablaufzeit.
+
+    Neue Element-Dateien meldet der Analyzer direkt beim Schreiben an
+    (``register``). Verzeichnisse werden nur dann per ``os.scandir``
+    abgeglichen, wenn sie neu sind, sich ihre Lebensdauer geändert hat
+    oder sie sich seit dem letzten Abgleich geändert haben und
+    ``rescan_interval`` verstrichen ist. ``expire`` liest nur abgelaufene
+    Einträge, der Aufwand hängt also von der Zahl der Löschungen ab.
+    """
+
+    def __init__(self, path="cache/skk_retention.sqlite"):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS items (
+                path TEXT PRIMARY KEY,
+                directory TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                expires REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS items_expires ON items (expires);
+            CREATE INDEX IF NOT EXISTS items_directory ON items (directory);
+            CREATE TABLE IF NOT EXISTS directories (
+                directory TEXT PRIMARY KEY,
+                lifetime REAL,
+                mtime_ns INTEGER,
+                scanned REAL NOT NULL
+            );
+            """
+        )
+
+    def register(self, directory, lifetime, paths):
+        """Meldet frisch geschriebene Dateien eines Verzeichnisses an"""
+        if lifetime is None or not paths:
+            return
+        rows = []
+        for path in paths:
+            mtime = os.stat(path).st_mtime
+            rows.append((os.path.normpath(path), directory, mtime, mtime + lifetime))
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO items (path, directory, mtime, expires) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def sync(self, directory, lifetime, rescan_interval=86400, now=None):
+        """Gleicht ein Verzeichnis bei Bedarf mit dem Index ab.
+
+        Liefert True, wenn tatsächlich gescannt wurde.
+        """
+        now = time.time() if now is None else now
+        directory = os.path.normpath(directory)
+        row = self.conn.execute(
+            "SELECT lifetime, mtime_ns, scanned FROM directories WHERE directory = ?",
+            (directory,),
+        ).fetchone()
+
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+
+        if row is not None and row[0] == lifetime:
+            unchanged = row[1] == mtime_ns
+            if unchanged or now - row[2] < rescan_interval:
+                return False
+
+        with self.conn:
+            self.conn.execute("DELETE FROM items WHERE directory = ?", (directory,))
+            if lifetime is not None and mtime_ns is not None:
+                rows = []
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        mtime = entry.stat(follow_symlinks=False).st_mtime
+                        path = os.path.normpath(entry.path)
+                        rows.append((path, directory, mtime, mtime + lifetime))
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO items (path, directory, mtime, expires) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO directories "
+                "(directory, lifetime, mtime_ns, scanned) VALUES (?, ?, ?, ?)",
+                (directory, lifetime, mtime_ns, now),
+            )
+        return True
+
+    def expire(self, now=None, batch_size=500, dry_run=False):
+        """Löscht abgelaufene Dateien in Batches, liefert deren Pfade.
+
+        Wurde eine Datei seit der Anmeldung neu geschrieben, verschiebt
+        sich nur ihr Ablaufzeitpunkt.
+        """
+        now = time.time() if now is None else now
+        removed = []
+        offset = 0
+        while True:
+            batch = self.conn.execute(
+                "SELECT i.path, i.mtime, d.lifetime FROM items i "
+                "LEFT JOIN directories d USING (directory) "
+                "WHERE i.expires <= ? ORDER BY i.expires LIMIT ? OFFSET ?",
+                (now, batch_size, offset),
+            ).fetchall()
+            if not batch:
+                return removed
+
+            gone, moved = [], []
+            for path, mtime, lifetime in batch:
+                try:
+                    current = os.stat(path).st_mtime
+                except FileNotFoundError:
+                    gone.append((path,))
+                    continue
+                if current != mtime and lifetime is not None:
+                    moved.append((current, current + lifetime, path))
+                    continue
+                if not dry_run:
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                removed.append(path)
+                gone.append((path,))
+
+            if dry_run:
+                # Nichts wird entfernt, also zum nächsten Batch weiterblättern
+                offset += len(batch)
+                continue
+            with self.conn:
+                self.conn.executemany("DELETE FROM items WHERE path = ?", gone)
+                self.conn.executemany(
+                    "UPDATE items SET mtime = ?, expires = ? WHERE path = ?", moved
+                )
+
+    def close(self):
+        self.conn.close()
+
+
+def run_retention(config, index=None, now=None, dry_run=False):
+    """Gleicht alle konfigurierten Verzeichnisse ab und löscht Abgelaufenes"""
+    retention_config = config.get("retention") or {}
+    own_index = index is None
+    if own_index:
+        index = SKKRetentionIndex(
+            retention_config.get("index", "cache/skk_retention.sqlite")
+        )
+    try:
+        rescan_interval = parse_duration(
+            retention_config.get("rescan_interval", "24h")
+        )
+        for directory, lifetime in retention_rules(config).items():
+            index.sync(directory, lifetime, rescan_interval, now=now)
+        return index.expire(
+            now=now, batch_size=retention_config.get("batch_size", 500), dry_run=dry_run
+        )
+    finally:
+        if own_index:
+            index.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SKK Retention")
+    parser.add_argument("--config", help="Konfiguration (Standard: SKK-Konfiguration)")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Nur anzeigen, was gelöscht würde"
+    )
+    args = parser.parse_args()
+
+    config_path = os.path.abspath(args.config) if args.config else None
+    # Pfade (Bedeutungsfeld-Verzeichnisse, cache/) wie beim Analyzer relativ zu SKK/
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    with open(config_path or "config/skk_config.yaml", "r", encoding="utf-8") as f:
+        skk_config = yaml.safe_load(f)
+
+    removed = run_retention(skk_config, dry_run=args.dry_run)
+    verb = "Würde löschen" if args.dry_run else "Gelöscht"
+    for path in removed:
+        print(f"{verb}: {path}")
+    print(f"✅ {len(removed)} abgelaufene Dateien")
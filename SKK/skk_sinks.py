@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+SKK Result Sinks
+================
+Austauschbare Ablageformate für SKK-Analyseergebnisse
+"""
+
+import json
+import os
+import sqlite3
+
+import yaml
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+def _split_report(report):
+    """Trennt den Report in Kopfdaten und einzelne Bedeutungsfeld-Elemente"""
+    header = {key: value for key, value in report.items() if key != "bedeutungsfelder"}
+    elements = [
+        (typ, element)
+        for typ, elemente in report.get("bedeutungsfelder", {}).items()
+        for element in elemente
+    ]
+    return header, elements
+
+
+class YAMLDirectorySink:
+    """Bisheriges Layout: ein YAML-Report plus eine Datei pro Element"""
+
+    def __init__(self, path="."):
+        self.path = path
+        # {Verzeichnis: [Dateien]} des letzten Laufs, z.B. für die Retention
+        self.element_files = {}
+
+    def write(self, report, run_id):
+        report_file = os.path.join(self.path, "analysen", f"skk_report_{run_id}.yaml")
+        os.makedirs(os.path.dirname(report_file), exist_ok=True)
+
+        with open(report_file, "w", encoding="utf-8") as f:
+            yaml.dump(report, f, allow_unicode=True)
+
+        # Einzelne Bedeutungsfelder
+        self.element_files = {}
+        for typ, element in _split_report(report)[1]:
+            directory = os.path.join(self.path, typ)
+            if directory not in self.element_files:
+                os.makedirs(directory, exist_ok=True)
+                self.element_files[directory] = []
+
+            element_file = os.path.join(directory, f"{element['id']}.yaml")
+            with open(element_file, "w", encoding="utf-8") as f:
+                yaml.dump(element, f, allow_unicode=True)
+            self.element_files[directory].append(element_file)
+
+        return os.path.normpath(report_file)
+
+
+class JSONLSink:
+    """Hängt einen Lauf als JSON-Zeilen an eine einzige Datei an.
+
+    Die erste Zeile enthält die Kopfdaten des Reports, danach folgt eine
+    Zeile pro Element. Alle Zeilen eines Laufs werden im Append-Modus unter
+    einer exklusiven Dateisperre (``flock``) geschrieben, sodass parallele
+    Prozesse sich nicht gegenseitig zerschneiden, auch wenn ``os.write``
+    nur einen Teil schreibt. Ohne ``fcntl`` (Windows) entfällt die Sperre.
+    """
+
+    def __init__(self, path="analysen/skk_results.jsonl"):
+        self.path = path
+
+    def write(self, report, run_id):
+        header, elements = _split_report(report)
+        lines = [{"typ": "report", "run_id": run_id, **header}]
+        lines.extend(
+            {"typ": typ, "run_id": run_id, "element": element}
+            for typ, element in elements
+        )
+        payload = "".join(
+            json.dumps(line, ensure_ascii=False, default=str) + "\n" for line in lines
+        ).encode("utf-8")
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            # Schließen gibt die Sperre frei
+            os.close(fd)
+
+        return f"{self.path}#{run_id}"
+
+
+class SQLiteSink:
+    """Speichert alle Läufe in einer SQLite-Datei, ein Lauf pro Transaktion"""
+
+    def __init__(self, path="analysen/skk_results.sqlite"):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS reports (
+                run_id TEXT PRIMARY KEY,
+                timestamp TEXT,
+                report TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS elements (
+                run_id TEXT NOT NULL,
+                typ TEXT NOT NULL,
+                element_id TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS elements_run ON elements (run_id, typ);
+            """
+        )
+
+    def write(self, report, run_id):
+        header, elements = _split_report(report)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO reports (run_id, timestamp, report) "
+                "VALUES (?, ?, ?)",
+                (
+                    run_id,
+                    header.get("timestamp"),
+                    json.dumps(header, ensure_ascii=False, default=str),
+                ),
+            )
+            # Erneutes Schreiben eines Laufs ersetzt dessen Elemente
+            self.conn.execute("DELETE FROM elements WHERE run_id = ?", (run_id,))
+            self.conn.executemany(
+                "INSERT INTO elements (run_id, typ, element_id, data) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        typ,
+                        element["id"],
+                        json.dumps(element, ensure_ascii=False, default=str),
+                    )
+                    for typ, element in elements
+                ],
+            )
+
+        return f"{self.path}#{run_id}"
+
+
+SINKS = {
+    "yaml": YAMLDirectorySink,
+    "jsonl": JSONLSink,
+    "sqlite": SQLiteSink,
+}
+
+
+def create_sink(output_config):
+    """Erstellt die Ablage laut ``output.format`` (yaml, jsonl, sqlite)"""
+    output_config = output_config or {}
+    fmt = output_config.get("format", "yaml")
+    if fmt not in SINKS:
+        raise ValueError(
+            f"Unbekanntes Ausgabeformat: {fmt} (erlaubt: {', '.join(SINKS)})"
+        )
+    if output_config.get("path"):
+        return SINKS[fmt](output_config["path"])
+    return SINKS[fmt]()
@@ -8,8 +8,11 @@ echo "1) Einzelanalyse durchführen"
 echo "2) Batch-Analyse (Verzeichnis)"
 echo "3) Scheduler starten (Daemon)"
 echo "4) Test-Analyse"
+echo "5) Watch-Daemon starten (analysiert neue Dateien sofort)"
+echo "   Scheduler (3) und Watch-Daemon (5) sind Alternativen: scheduler.mode"
+echo "   in config/skk_config.yaml legt fest, welcher laufen darf."
 echo ""
-read -p "Wähle Option (1-4): " option
+read -p "Wähle Option (1-5): " option
 
 case $option in
     1)
@@ -28,6 +31,10 @@ case $option in
         echo "Führe Test-Analyse durch..."
         python3 skk_analyzer_standalone.py text_inputs/test_bedeutungsfeld.txt
         ;;
+    5)
+        echo "Starte SKK Watch-Daemon..."
+        python3 scheduler/skk_watch_daemon.py
+        ;;
     *)
         echo "Ungültige Option"
         ;;
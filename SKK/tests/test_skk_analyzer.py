@@ -0,0 +1,190 @@
+import argparse
+import io
+import os
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+import skk_config_compiler
+from skk_analyzer_standalone import (
+    SKKStandaloneAnalyzer,
+    _non_negative_int,
+    current_memory_usage,
+    parse_size,
+    run_batch,
+)
+
+
+CONFIG = Path(__file__).resolve().parents[1] / 'config' / 'skk_config.yaml'
+SAMPLE = Path(__file__).resolve().parents[1] / 'text_inputs' / 'test_bedeutungsfeld.txt'
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # Kompilierte Konfiguration nicht in SKK/cache/compiled ablegen
+    monkeypatch.setattr(skk_config_compiler, 'ARTIFACT_DIR', str(tmp_path / 'compiled'))
+    (tmp_path / 'logs').mkdir()
+    return SKKStandaloneAnalyzer(str(CONFIG))
+
+
+def _markers(report):
+    return [(f['chunk'], f['marker'], f['matches']) for f in report['bedeutungsfelder']['flügel']]
+
+
+def test_parse_size():
+    assert parse_size('500MB') == 500 * 1024**2
+    assert parse_size('1.5k') == 1536
+    assert parse_size(42) == 42
+
+
+def test_streaming_matches_in_memory(analyzer):
+    analyzer.chunk_size = 7
+    analyzer.read_block_size = 16
+    in_memory = _markers(analyzer.analyze_file(str(SAMPLE), stream=False))
+    streamed = _markers(analyzer.analyze_file(str(SAMPLE), stream=True))
+    assert streamed == in_memory
+
+
+def test_cache_stays_bounded_over_long_stream(analyzer, tmp_path):
+    analyzer.chunk_size = 5
+    analyzer.cache.flush_every = 50
+    source = tmp_path / 'lang.log'
+    source.write_text(
+        ''.join(f'zeile {i} ganz ohne treffer\n' for i in range(2000)), encoding='utf-8')
+
+    largest = 0
+    put = analyzer.cache.put
+
+    def tracking_put(chunk, hits):
+        nonlocal largest
+        put(chunk, hits)
+        largest = max(largest, len(analyzer.cache._pending) + len(analyzer.cache._touched))
+
+    analyzer.cache.put = tracking_put
+    analyzer.analyze_file(str(source), stream=True)
+    assert largest < 50
+
+
+def test_iter_file_words_keeps_split_words(analyzer):
+    analyzer.read_block_size = 4
+    words = list(analyzer._iter_file_words(io.StringIO('Sehnsucht  und\nDrang ')))
+    assert words == ['Sehnsucht', 'und', 'Drang']
+
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/statm'), reason='nur mit /proc')
+def test_memory_budget_uses_current_rss(analyzer):
+    block = b'x' * (128 * 1024**2)
+    peak = current_memory_usage()
+    del block
+    assert current_memory_usage() < peak - 64 * 1024**2
+
+    # Ein früherer Spitzenwert über dem Budget bricht spätere Läufe nicht ab
+    analyzer.max_memory = peak - 32 * 1024**2
+    analyzer._check_memory_budget()
+    analyzer.max_memory = 1
+    with pytest.raises(MemoryError):
+        analyzer._check_memory_budget()
+
+
+def test_run_batch_merges_reports(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(skk_config_compiler, 'ARTIFACT_DIR', str(tmp_path / 'compiled'))
+    (tmp_path / 'logs').mkdir()
+    inputs = tmp_path / 'inputs'
+    inputs.mkdir()
+    for name in ('a.txt', 'b.log', 'ignored.md'):
+        (inputs / name).write_text(SAMPLE.read_text(encoding='utf-8'), encoding='utf-8')
+    summary = run_batch(str(CONFIG), str(inputs), workers=1)
+    assert summary['dateien'] == 2
+    assert summary['fehlgeschlagen'] == 0
+    single = summary['berichte'][0]['statistik']['flügel']
+    assert summary['statistik']['flügel'] == 2 * single
+    assert len({r['report'] for r in summary['berichte']}) == 2
+
+
+def _event(chunk, second):
+    return {'chunk': chunk, 'timestamp': f'2025-06-11T09:49:{second:02d}'}
+
+
+def test_detect_metamarker_reports_every_cluster(analyzer):
+    analyzer.config['bedeutungsfelder']['metamarker'].update(window='chunks', chunk_distance=1)
+    analyzer.bedeutungsfelder['flügel'] = [_event(c, 0) for c in (0, 0, 1, 5, 9, 9)]
+    analyzer.bedeutungsfelder['strudel'] = [_event(c, 0) for c in (0, 9)]
+    analyzer.bedeutungsfelder['metamarker'] = []
+    analyzer._detect_metamarker()
+    clusters = analyzer.bedeutungsfelder['metamarker']
+    assert [(m['chunk_start'], m['chunk_end']) for m in clusters] == [(0, 1), (9, 9)]
+    assert clusters[0]['kombination'] == {'flügel': 3, 'strudel': 1}
+    assert len({m['id'] for m in clusters}) == 2
+
+
+def test_detect_metamarker_timeframe_window(analyzer):
+    analyzer.config['bedeutungsfelder']['metamarker'].update(window='timeframe', timeframe_sec=5)
+    analyzer.bedeutungsfelder['flügel'] = [_event(0, s) for s in (0, 1, 20, 21)]
+    analyzer.bedeutungsfelder['strudel'] = [_event(0, s) for s in (2, 40)]
+    analyzer.bedeutungsfelder['metamarker'] = []
+    analyzer._detect_metamarker()
+    clusters = analyzer.bedeutungsfelder['metamarker']
+    assert len(clusters) == 1
+    assert clusters[0]['timestamp_end'] == '2025-06-11T09:49:02'
+
+
+def _shape(report):
+    felder = report['bedeutungsfelder']
+    return (
+        report['statistik'],
+        report['warnungen'],
+        [(s['chunk'], s['anziehungskraft'], s['hyperfokus'], len(s['flügel_ids'])) for s in felder['strudel']],
+        [(k['strukturfestigkeit'], k.get('warnung')) for k in felder['knoten']],
+    )
+
+
+def test_numpy_backend_matches_python_backend(analyzer):
+    pytest.importorskip('numpy')
+    text = ' '.join(['ahnung gefühl spüre drang sehnsucht ahnung gefühle'] * 3 + ['nichts'] * 40)
+    analyzer.chunk_size = 12
+    python_report = analyzer.analyze_text(text)
+    analyzer.backend = 'numpy'
+    numpy_report = analyzer.analyze_text(text)
+    assert _shape(numpy_report) == _shape(python_report)
+    assert python_report['statistik']['knoten'] > 0
+
+
+def test_profiling_adds_performance_section(analyzer, tmp_path):
+    analyzer.enable_profiling()
+    analyzer.profiling['metrics_log'] = str(tmp_path / 'metrics.jsonl')
+    report = analyzer.analyze_file(str(SAMPLE))
+    stages = report['performance']['stages']
+    assert stages['_analyze_chunk']['calls'] == 1
+    assert {'_split_text', '_form_strudel', '_detect_metamarker', '_generate_report', '_save_results'} <= set(stages)
+    assert (tmp_path / 'metrics.jsonl').read_text(encoding='utf-8').count('\n') == 1
+
+
+def test_profiling_stops_when_analysis_fails(analyzer):
+    analyzer.enable_profiling()
+    analyzer.max_memory = 1
+    with pytest.raises(MemoryError):
+        analyzer.analyze_text('Eine Ahnung')
+    assert not tracemalloc.is_tracing()
+
+
+def test_profiling_disabled_by_default(analyzer):
+    assert 'performance' not in analyzer.analyze_text('Eine Ahnung')
+
+
+def test_analyze_file_byte_range(analyzer, tmp_path):
+    log = tmp_path / 'chat.log'
+    log.write_text('Eine Ahnung\nDann Sehnsucht und Drang\n', encoding='utf-8')
+    start = len('Eine Ahnung\n'.encode('utf-8'))
+    report = analyzer.analyze_file(str(log), start=start)
+    assert [f['marker'] for f in report['bedeutungsfelder']['flügel']] == ['drang', 'sehnsucht']
+    assert report['bereich'] == {'start': start, 'ende': log.stat().st_size}
+
+
+def test_workers_must_not_be_negative():
+    assert _non_negative_int('0') == 0
+    assert _non_negative_int('4') == 4
+    with pytest.raises(argparse.ArgumentTypeError, match='negativ'):
+        _non_negative_int('-1')
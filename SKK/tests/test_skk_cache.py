@@ -0,0 +1,53 @@
+from skk_cache import SKKChunkCache
+
+
+HITS = {'flügel': {'ahnung': ['ahnung']}, 'strudel': {}}
+
+
+def test_cache_roundtrip_and_config_invalidation(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    cache = SKKChunkCache(path, 'config-a', 10_000)
+    assert cache.get('eine ahnung') is None
+    cache.put('eine ahnung', HITS)
+    cache.close()
+
+    cache = SKKChunkCache(path, 'config-a', 10_000)
+    assert cache.get('eine ahnung') == HITS
+    cache.close()
+
+    cache = SKKChunkCache(path, 'config-b', 10_000)
+    assert cache.get('eine ahnung') is None
+    cache.close()
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = SKKChunkCache(str(tmp_path / 'cache.sqlite'), 'config', 10_000)
+    cache.put('alt', HITS)
+    cache.flush()
+    cache.put('neu', HITS)
+    cache.flush()
+    assert cache.get('alt') == HITS
+    cache.flush()
+
+    entry_size = cache.conn.execute('SELECT MAX(size) FROM chunks').fetchone()[0]
+    cache.max_size = 2 * entry_size
+    cache.put('neuer', HITS)
+    cache.flush()
+    assert cache.get('neu') is None
+    assert cache.get('alt') == HITS
+    assert cache.get('neuer') == HITS
+
+
+def test_cache_flushes_pending_entries_while_streaming(tmp_path):
+    cache = SKKChunkCache(str(tmp_path / 'cache.sqlite'), 'config', 10**9, flush_every=100)
+    largest = 0
+    for i in range(5000):
+        cache.put(f'chunk {i}', HITS)
+        largest = max(largest, len(cache._pending))
+    assert largest < 100
+    assert cache.conn.execute('SELECT COUNT(*) FROM chunks').fetchone()[0] >= 4900
+
+    cache.flush_bytes = 1000
+    cache.put('groß', {'flügel': {'ahnung': ['ahnung'] * 200}})
+    assert cache._pending == {}
+    cache.close()
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+import skk_config_compiler
+from skk_config_compiler import (
+    BASE_DIR,
+    ConfigValidationError,
+    artifact_path,
+    load_compiled,
+)
+
+
+CONFIG = Path(__file__).resolve().parents[1] / 'config' / 'skk_config.yaml'
+
+
+@pytest.fixture
+def config_copy(tmp_path):
+    path = tmp_path / 'skk_config.yaml'
+    path.write_bytes(CONFIG.read_bytes())
+    return path
+
+
+def test_artifact_is_reused_until_source_changes(tmp_path, config_copy):
+    artifacts = tmp_path / 'compiled'
+    first = load_compiled(str(config_copy), str(artifacts))
+    assert Path(artifact_path(str(config_copy), str(artifacts))).exists()
+    assert first['matcher'].match('eine ahnung')['flügel'] == {'ahnung': ['ahnung']}
+
+    cached = load_compiled(str(config_copy), str(artifacts))
+    assert cached['sha256'] == first['sha256']
+
+    config = yaml.safe_load(config_copy.read_text(encoding='utf-8'))
+    config['bedeutungsfelder']['flügel']['markers'].append('neugier')
+    config_copy.write_text(yaml.dump(config, allow_unicode=True), encoding='utf-8')
+    changed = load_compiled(str(config_copy), str(artifacts))
+    assert changed['sha256'] != first['sha256']
+    assert 'neugier' in changed['marker_tables']['flügel']
+
+
+def test_invalid_config_is_rejected(tmp_path, config_copy):
+    config = yaml.safe_load(config_copy.read_text(encoding='utf-8'))
+    config['bedeutungsfelder']['strudel']['markers'] = 'sog'
+    config_copy.write_text(yaml.dump(config, allow_unicode=True), encoding='utf-8')
+    with pytest.raises(ConfigValidationError, match='strudel.markers'):
+        load_compiled(str(config_copy), str(tmp_path / 'compiled'))
+
+
+def test_default_artifact_dir_is_anchored_to_skk(tmp_path, monkeypatch, config_copy):
+    # Startverzeichnis spielt keine Rolle: alle Aufrufer teilen einen Cache
+    monkeypatch.chdir(tmp_path)
+    path = Path(artifact_path(str(config_copy)))
+    assert path.parent == Path(BASE_DIR) / 'cache' / 'compiled'
+
+
+def test_failed_artifact_write_leaves_no_temp_file(tmp_path, monkeypatch, config_copy):
+    def fail(src, dst):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(skk_config_compiler.os, 'replace', fail)
+    artifacts = tmp_path / 'compiled'
+    compiled = load_compiled(str(config_copy), str(artifacts))
+    assert compiled['matcher'].match('eine ahnung')['flügel'] == {'ahnung': ['ahnung']}
+    assert list(artifacts.iterdir()) == []
@@ -0,0 +1,46 @@
+import os
+from pathlib import Path
+
+import skk_config_compiler
+from skk_jobs import SKKJobRunner
+
+
+CONFIG = Path(__file__).resolve().parents[1] / 'config' / 'skk_config.yaml'
+SAMPLE = Path(__file__).resolve().parents[1] / 'text_inputs' / 'test_bedeutungsfeld.txt'
+
+
+def _runner(tmp_path, monkeypatch, **kwargs):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(skk_config_compiler, 'ARTIFACT_DIR', str(tmp_path / 'compiled'))
+    (tmp_path / 'logs').mkdir()
+    return SKKJobRunner(str(CONFIG), **kwargs)
+
+
+def test_jobs_run_with_capped_concurrency(tmp_path, monkeypatch):
+    runner = _runner(tmp_path, monkeypatch, workers=1)
+    runner.submit(str(SAMPLE))
+    runner.submit(str(SAMPLE), start=0, end=100)
+    runner.poll()
+    assert runner.progress()['laufend'] == 1
+    finished = runner.wait(interval=0.05)
+    assert [job.result['datei'] for job in finished] == [str(SAMPLE)] * 2
+    assert runner.progress()['erledigt'] == 2
+
+
+def test_failed_job_is_retried_then_reported(tmp_path, monkeypatch):
+    runner = _runner(tmp_path, monkeypatch, retries=1, backoff=0)
+    runner.submit(str(tmp_path / 'fehlt.log'))
+    [job] = runner.wait(interval=0.05)
+    assert job.attempt == 2
+    assert 'FileNotFoundError' in job.error
+    assert runner.progress()['fehlgeschlagen'] == 1
+
+
+def test_job_exceeding_timeout_is_terminated(tmp_path, monkeypatch):
+    runner = _runner(tmp_path, monkeypatch, timeout=0.3, retries=0)
+    # Eine FIFO ohne Schreiber blockiert das Öffnen unbegrenzt
+    fifo = tmp_path / 'haengt.log'
+    os.mkfifo(fifo)
+    runner.submit(str(fifo))
+    [job] = runner.wait(interval=0.05)
+    assert job.result is None and 'Zeitlimit' in job.error
@@ -0,0 +1,114 @@
+import contextlib
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
+import time
+
+import pytest
+
+import skk_logging
+from skk_logging import BatchingLogListener, install_queue_logging, stop_queue_logging
+
+
+@contextlib.contextmanager
+def queue_logging(path, **options):
+    """install_queue_logging auf einem Root-Logger ohne pytest-Handler"""
+    root = logging.getLogger()
+    saved, level = root.handlers[:], root.level
+    root.handlers.clear()
+    try:
+        yield install_queue_logging(str(path), fmt='%(levelname)s - %(message)s', **options)
+    finally:
+        stop_queue_logging()
+        root.handlers[:] = saved
+        root.setLevel(level)
+
+
+def _log_from_worker(count):
+    listener = skk_logging._listener
+    assert listener is not None and listener.is_alive()
+    # Langsamer Schreib-Thread: ohne Stopp beim Prozessende gingen Records verloren
+    write = listener._write
+
+    def slow_write(records):
+        time.sleep(0.2)
+        write(records)
+
+    listener._write = slow_write
+    for i in range(count):
+        logging.getLogger('skk.worker').info(f'Worker {i}')
+
+
+def test_listener_writes_queued_records_in_order(tmp_path):
+    path = tmp_path / 'skk.log'
+    handler = logging.FileHandler(path, encoding='utf-8')
+    handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
+    log_queue = queue.SimpleQueue()
+    for i in range(5):
+        log_queue.put(logging.makeLogRecord({'msg': f'Flügel {i}', 'levelno': logging.INFO,
+                                             'levelname': 'INFO'}))
+
+    listener = BatchingLogListener(log_queue, handler, batch_size=2)
+    listener.start()
+    listener.stop()
+
+    assert path.read_text(encoding='utf-8').splitlines() == [f'INFO - Flügel {i}' for i in range(5)]
+
+
+def test_queue_handler_routes_records_through_listener(tmp_path):
+    path = tmp_path / 'logs' / 'skk.log'
+    with queue_logging(path) as listener:
+        root = logging.getLogger()
+        assert listener.is_alive()
+        assert [type(h) for h in root.handlers] == [logging.handlers.QueueHandler]
+        # Wie basicConfig: ein bereits konfigurierter Root-Logger bleibt unverändert
+        assert install_queue_logging(str(tmp_path / 'anders.log')) is None
+
+        logger = logging.getLogger('skk.test')
+        logger.info('Strudel erkannt')
+        logger.debug('unter dem Level')
+        logger.warning('Knoten %s', 'verhärtet')
+        stop_queue_logging()
+
+        assert not listener.is_alive()
+        assert root.handlers == []
+        assert path.read_text(encoding='utf-8').splitlines() == [
+            'INFO - Strudel erkannt', 'WARNING - Knoten verhärtet']
+
+
+def test_stop_flushes_pending_records(tmp_path):
+    path = tmp_path / 'skk.log'
+    with queue_logging(path, batch_size=10) as listener:
+        # Schreib-Thread hängt am Handler-Lock, Records stauen sich in der Queue
+        listener.handler.acquire()
+        try:
+            for i in range(200):
+                logging.getLogger('skk.test').info(f'Kristall {i}')
+            assert listener.queue.qsize() >= 190
+        finally:
+            listener.handler.release()
+        stop_queue_logging()
+
+        assert path.read_text(encoding='utf-8').splitlines() == [
+            f'INFO - Kristall {i}' for i in range(200)]
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='benötigt fork')
+def test_forked_worker_gets_its_own_listener(tmp_path):
+    path = tmp_path / 'skk.log'
+    with queue_logging(path):
+        logging.getLogger('skk.test').info('Elternprozess')
+        # Wie der Batch-Modus mit --workers: ProcessPoolExecutor forkt Worker
+        worker = multiprocessing.get_context('fork').Process(
+            target=_log_from_worker, args=(50,))
+        worker.start()
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+        stop_queue_logging()
+
+        lines = path.read_text(encoding='utf-8').splitlines()
+        assert 'INFO - Elternprozess' in lines
+        assert [line for line in lines if 'Worker' in line] == [
+            f'INFO - Worker {i}' for i in range(50)]
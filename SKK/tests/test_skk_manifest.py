@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+from skk_manifest import SKKManifest, scheduler_mode
+
+
+def test_only_new_tail_is_pending(tmp_path):
+    log = tmp_path / 'chat.log'
+    log.write_bytes(b'erste ahnung\nhalbe zei')
+    manifest_path = tmp_path / 'manifest.json'
+
+    manifest = SKKManifest(str(manifest_path))
+    # Frisch geschrieben: die angefangene Zeile wartet auf den nächsten Lauf
+    assert manifest.pending(str(log)) == (0, 13)
+    manifest.mark(str(log), 13)
+    manifest.save()
+
+    manifest = SKKManifest(str(manifest_path))
+    with open(log, 'ab') as f:
+        f.write(b'le\nneuer drang\n')
+    assert manifest.pending(str(log)) == (13, log.stat().st_size)
+    manifest.mark(str(log), log.stat().st_size)
+    assert manifest.pending(str(log)) is None
+
+
+def test_rewritten_file_is_analyzed_again(tmp_path):
+    log = tmp_path / 'chat.log'
+    log.write_bytes(b'sehnsucht\n')
+    manifest = SKKManifest(str(tmp_path / 'manifest.json'))
+    manifest.mark(str(log), log.stat().st_size)
+
+    log.write_bytes(b'gefuehl!!\nmehr\n')
+    assert manifest.pending(str(log)) == (0, log.stat().st_size)
+
+
+def test_settled_file_is_read_to_the_end(tmp_path):
+    text = tmp_path / 'notiz.txt'
+    text.write_bytes(b'ohne umbruch')
+    os.utime(text, (0, 0))
+    assert SKKManifest(str(tmp_path / 'm.json')).pending(str(text)) == (0, 12)
+
+
+def test_scheduler_mode_defaults_to_daily():
+    assert scheduler_mode({}) == 'daily'
+    assert scheduler_mode({'scheduler': {'mode': 'watch'}}) == 'watch'
+    with pytest.raises(ValueError, match='beide'):
+        scheduler_mode({'scheduler': {'mode': 'beide'}})
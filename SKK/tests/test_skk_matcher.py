@@ -0,0 +1,32 @@
+import re
+from pathlib import Path
+
+import yaml
+
+from skk_matcher import SKKMarkerMatcher
+
+
+CONFIG = Path(__file__).resolve().parents[1] / 'config' / 'skk_config.yaml'
+
+
+def test_matcher_matches_per_marker_regex():
+    with open(CONFIG, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    matcher = SKKMarkerMatcher.from_config(config)
+    text = ('Ich spüre eine Ahnung, Gefühle und eine Vorahnung. '
+            'Der Sog verdichtet sich, eine Struktur entsteht: aha, Erkenntnis!')
+    hits = matcher.match(text)
+    for family, feld in config['bedeutungsfelder'].items():
+        if 'markers' not in feld:
+            continue
+        expected = {}
+        for marker in feld.get('markers', []):
+            found = re.findall(rf'\b{marker}\w*\b', text.lower())
+            if found:
+                expected[marker] = found
+        assert hits[family] == expected
+
+
+def test_matcher_overlapping_prefixes():
+    matcher = SKKMarkerMatcher({'flügel': ['spür', 'spüre']})
+    assert matcher.match('Ich spüre es') == {'flügel': {'spür': ['spüre'], 'spüre': ['spüre']}}
@@ -0,0 +1,67 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import yaml
+
+from skk_report_index import SKKReportIndex
+
+
+def _write_report(directory, name, timestamp, hyperfokus):
+    strudel = [
+        {'id': f'strudel_{i}', 'timestamp': timestamp, 'chunk': i, 'anziehungskraft': 9,
+         'warnung': 'HYPERFOKUS'}
+        for i in range(hyperfokus)
+    ]
+    report = {
+        'timestamp': timestamp,
+        'quelle': 'chat_logs/a.log',
+        'statistik': {'flügel': 2, 'strudel': hyperfokus, 'knoten': 0, 'kristalle': 0,
+                      'metamarker': 0},
+        'warnungen': {'hyperfokus_strudel': hyperfokus, 'rigide_knoten': 0},
+        'bedeutungsfelder': {'strudel': strudel},
+    }
+    path = directory / name
+    path.write_text(yaml.dump(report, allow_unicode=True), encoding='utf-8')
+    return path
+
+
+def test_ingest_and_aggregate_by_day(tmp_path):
+    analysen = tmp_path / 'analysen'
+    analysen.mkdir()
+    _write_report(analysen, 'skk_report_1.yaml', '2026-07-01T10:00:00', 1)
+    _write_report(analysen, 'skk_report_2.yaml', '2026-07-01T18:00:00', 2)
+    _write_report(analysen, 'skk_report_3.yaml', '2026-07-02T09:00:00', 0)
+
+    index = SKKReportIndex(str(tmp_path / 'index.sqlite'))
+    assert index.ingest([str(analysen)]) == 3
+    assert index.ingest([str(analysen)]) == 0
+
+    per_day = index.aggregate('hyperfokus_strudel', by='day')
+    assert [(r['gruppe'], r['summe'], r['reports']) for r in per_day] == [
+        ('2026-07-01', 3, 2),
+        ('2026-07-02', 0, 1),
+    ]
+    assert len(index.reports(since='2026-07-02')) == 1
+    assert len(index.elements('strudel', warnungen=True, until='2026-07-01T12:00')) == 1
+    index.close()
+
+
+def test_cli_resolves_paths_against_caller_cwd(tmp_path):
+    analysen = tmp_path / 'reports'
+    analysen.mkdir()
+    _write_report(analysen, 'skk_report_1.yaml', '2026-07-01T10:00:00', 2)
+    script = Path(__file__).resolve().parents[1] / 'skk_report_index.py'
+
+    def run(*args):
+        return subprocess.run(
+            [sys.executable, str(script), '--index', 'index.sqlite', *args],
+            cwd=tmp_path, capture_output=True, text=True, check=True,
+        ).stdout
+
+    assert '1 Reports indiziert' in run('ingest', 'reports')
+    rows = json.loads(run('aggregate', 'hyperfokus_strudel', '--json'))
+    assert [(r['gruppe'], r['summe']) for r in rows] == [('2026-07-01', 2)]
+    assert (tmp_path / 'index.sqlite').exists()
+    assert not (tmp_path / 'analysen').exists()
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from skk_retention import (
+    SKKRetentionIndex,
+    parse_duration,
+    retention_enabled,
+    retention_rules,
+)
+
+
+def test_parse_duration():
+    assert parse_duration('15min') == 900
+    assert parse_duration('2 stunden') == 7200
+    assert parse_duration('30 days') == 30 * 86400
+    assert parse_duration('permanent') is None
+    with pytest.raises(ValueError):
+        parse_duration('bald')
+
+
+def test_retention_is_opt_in():
+    # Analyzer und Scheduler teilen diesen Standard: ohne Abschnitt kein Löschen
+    assert not retention_enabled({})
+    assert not retention_enabled({'retention': None})
+    assert not retention_enabled({'retention': {'index': 'x.sqlite'}})
+    assert retention_enabled({'retention': {'enabled': True}})
+
+
+def test_retention_rules_include_mind_policy(tmp_path):
+    mind_config = tmp_path / 'MIND' / 'config' / 'mind_config.yaml'
+    mind_config.parent.mkdir(parents=True)
+    mind_config.write_text(
+        'thoughts:\n  retention_policy:\n    daily: "30 days"\n    dreams: "permanent"\n',
+        encoding='utf-8',
+    )
+    config = {
+        'bedeutungsfelder': {'flügel': {'retention': '15min'}, 'kristalle': {}},
+        'retention': {'mind_config': str(mind_config)},
+    }
+    rules = retention_rules(config)
+    assert rules['flügel'] == 900
+    assert rules['kristalle'] is None
+    assert rules[str(tmp_path / 'MIND' / 'thoughts' / 'daily')] == 30 * 86400
+    assert rules[str(tmp_path / 'MIND' / 'thoughts' / 'dreams')] is None
+
+
+def test_only_expired_files_are_removed(tmp_path):
+    directory = tmp_path / 'flügel'
+    directory.mkdir()
+    old, new = directory / 'alt.yaml', directory / 'neu.yaml'
+    old.write_text('a')
+    new.write_text('b')
+    os.utime(old, (1000, 1000))
+    os.utime(new, (5000, 5000))
+
+    index = SKKRetentionIndex(str(tmp_path / 'retention.sqlite'))
+    assert index.sync(str(directory), 900, now=2000)
+    # Unverändertes Verzeichnis wird nicht erneut gescannt
+    assert not index.sync(str(directory), 900, now=2100)
+
+    assert index.expire(now=2000, dry_run=True) == [str(old)]
+    assert old.exists()
+    assert index.expire(now=2000) == [str(old)]
+    assert not old.exists() and new.exists()
+
+    registered = directory / 'registriert.yaml'
+    registered.write_text('c')
+    os.utime(registered, (1500, 1500))
+    index.register(str(directory), 900, [str(registered)])
+    assert index.expire(now=2500) == [str(registered)]
+    index.close()
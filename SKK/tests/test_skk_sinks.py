@@ -0,0 +1,59 @@
+import json
+import sqlite3
+
+import pytest
+import yaml
+
+from skk_sinks import JSONLSink, SQLiteSink, YAMLDirectorySink, create_sink
+
+
+REPORT = {
+    'timestamp': '2025-06-11T09:49:08',
+    'statistik': {'flügel': 2, 'strudel': 1},
+    'bedeutungsfelder': {
+        'flügel': [{'id': 'flügel_0_1', 'marker': 'ahnung'}, {'id': 'flügel_0_2', 'marker': 'drang'}],
+        'strudel': [{'id': 'strudel_0_1', 'anziehungskraft': 2}],
+    },
+}
+
+
+def test_yaml_sink_keeps_layout(tmp_path):
+    location = YAMLDirectorySink(str(tmp_path)).write(REPORT, 'run1')
+    with open(location, encoding='utf-8') as f:
+        assert yaml.safe_load(f) == REPORT
+    assert (tmp_path / 'flügel' / 'flügel_0_2.yaml').exists()
+    assert (tmp_path / 'strudel' / 'strudel_0_1.yaml').exists()
+
+
+def test_jsonl_sink_appends_runs(tmp_path):
+    sink = JSONLSink(str(tmp_path / 'results.jsonl'))
+    sink.write(REPORT, 'run1')
+    sink.write(REPORT, 'run2')
+    lines = [json.loads(line) for line in (tmp_path / 'results.jsonl').read_text(encoding='utf-8').splitlines()]
+    assert len(lines) == 8
+    assert lines[0]['typ'] == 'report' and lines[0]['statistik'] == REPORT['statistik']
+    assert [line['run_id'] for line in lines].count('run2') == 4
+
+
+def test_sqlite_sink_writes_one_run(tmp_path):
+    path = str(tmp_path / 'results.sqlite')
+    SQLiteSink(path).write(REPORT, 'run1')
+    conn = sqlite3.connect(path)
+    assert conn.execute('SELECT COUNT(*) FROM reports').fetchone()[0] == 1
+    rows = conn.execute("SELECT typ, COUNT(*) FROM elements GROUP BY typ ORDER BY typ").fetchall()
+    assert rows == [('flügel', 2), ('strudel', 1)]
+
+
+def test_sqlite_sink_rewrite_replaces_run(tmp_path):
+    path = str(tmp_path / 'results.sqlite')
+    sink = SQLiteSink(path)
+    sink.write(REPORT, 'run1')
+    sink.write(REPORT, 'run1')
+    conn = sqlite3.connect(path)
+    assert conn.execute('SELECT COUNT(*) FROM reports').fetchone()[0] == 1
+    assert conn.execute('SELECT COUNT(*) FROM elements').fetchone()[0] == 3
+
+
+def test_create_sink_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        create_sink({'format': 'xml'})
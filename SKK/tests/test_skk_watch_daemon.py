@@ -0,0 +1,145 @@
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+import yaml
+
+import skk_config_compiler
+from scheduler import skk_watch_daemon
+from scheduler.skk_watch_daemon import SKKWatchDaemon
+from skk_manifest import SKKManifest
+
+
+CONFIG = Path(__file__).resolve().parents[1] / 'config' / 'skk_config.yaml'
+
+
+@pytest.fixture
+def make_daemon(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(skk_config_compiler, 'ARTIFACT_DIR', str(tmp_path / 'compiled'))
+    (tmp_path / 'inbox').mkdir()
+    config = yaml.safe_load(CONFIG.read_text(encoding='utf-8'))
+    config['scheduler']['input_sources'] = ['inbox/*.log']
+
+    def make(**watch):
+        config['scheduler']['watch'].update(watch)
+        path = tmp_path / 'watch_config.yaml'
+        path.write_text(yaml.dump(config, allow_unicode=True), encoding='utf-8')
+        return SKKWatchDaemon(str(path), workers=1)
+
+    return make
+
+
+def _write(path, data, settled=True):
+    with open(path, 'ab') as f:
+        f.write(data)
+    if settled:
+        os.utime(path, (0, 0))
+
+
+def _done(result=None):
+    future = Future()
+    future.set_result(result or {'report': 'bericht.yaml'})
+    return future
+
+
+def test_offer_deduplicates_and_queues_only_new_tail(make_daemon):
+    daemon = make_daemon(settle_seconds=60)
+    log = os.path.join('inbox', 'a.log')
+
+    # Gerade geschrieben und nicht geschlossen: noch nicht einreihen
+    _write(log, b'erste ahnung\n', settled=False)
+    daemon._offer(log)
+    assert daemon.queue.empty()
+
+    daemon._offer(log, settled=True)
+    daemon._offer(log, settled=True)
+    assert daemon.queue.qsize() == 1
+    filepath, start, end = daemon.queue.get_nowait()
+    assert (filepath, start, end) == (log, 0, 13)
+
+    # Während der Analyse eintreffende Ereignisse reihen nichts doppelt ein
+    daemon._queued.discard(log)
+    daemon._active.add(log)
+    _write(log, b'neuer drang\n')
+    daemon._offer(log)
+    assert daemon.queue.empty()
+
+    # Nach Abschluss wird nur das angehängte Ende nachgezogen
+    daemon._finish(log, end, _done())
+    assert daemon.queue.get_nowait() == (log, 13, 25)
+
+
+def test_full_queue_offers_file_again_later(make_daemon):
+    daemon = make_daemon(queue_size=1)
+    first, second = os.path.join('inbox', 'a.log'), os.path.join('inbox', 'b.log')
+    _write(first, b'sehnsucht\n')
+    _write(second, b'drang\n')
+
+    daemon._scan()
+    assert daemon.queue.qsize() == 1
+    queued = daemon.queue.get_nowait()[0]
+    assert queued in (first, second)
+
+    # Die verschobene Datei kommt beim nächsten Scan zum Zug
+    daemon._scan()
+    assert daemon.queue.get_nowait()[0] == ({first, second} - {queued}).pop()
+
+
+def test_polling_fallback_picks_up_new_file(make_daemon, monkeypatch):
+    monkeypatch.setattr(skk_watch_daemon, 'INotify', None)
+    daemon = make_daemon(poll_interval=0.05, settle_seconds=0)
+    watcher = threading.Thread(target=daemon._watch, daemon=True)
+    watcher.start()
+    try:
+        _write(os.path.join('inbox', 'neu.log'), b'resonanz\n')
+        assert daemon.queue.get(timeout=5) == (os.path.join('inbox', 'neu.log'), 0, 9)
+    finally:
+        daemon.stop()
+        watcher.join(timeout=5)
+    assert not watcher.is_alive()
+
+
+def test_restart_resumes_from_manifest(make_daemon):
+    log = os.path.join('inbox', 'a.log')
+    _write(log, b'vor dem start\n')
+    daemon = make_daemon()
+    daemon._baseline()
+    assert daemon.queue.empty()
+
+    _write(log, b'ahnung\n')
+    daemon._scan()
+    filepath, start, end = daemon.queue.get_nowait()
+    daemon._finish(filepath, end, _done())
+
+    # Neuer Prozess: bereits Analysiertes bleibt liegen, nur Neues kommt dazu
+    restarted = make_daemon()
+    restarted._baseline()
+    assert restarted.queue.empty()
+    _write(log, b'nach dem neustart\n')
+    restarted._scan()
+    assert restarted.queue.get_nowait() == (log, end, end + 18)
+
+
+def test_stop_books_jobs_still_in_flight(make_daemon, monkeypatch):
+    monkeypatch.setattr(skk_watch_daemon, 'INotify', None)
+    monkeypatch.setattr(skk_watch_daemon, 'ProcessPoolExecutor', ThreadPoolExecutor)
+    monkeypatch.setattr(skk_watch_daemon, '_init_worker', lambda config_path: None)
+    daemon = make_daemon(poll_interval=60)
+    log = os.path.join('inbox', 'a.log')
+    _write(log, b'ahnung\n')
+
+    def analyze(filepath, output, start, end):
+        # SIGTERM trifft ein, während der Job noch läuft
+        daemon.stop()
+        time.sleep(1)  # länger als ein Durchlauf der Hauptschleife
+        return {'report': 'bericht.yaml'}
+
+    monkeypatch.setattr(skk_watch_daemon, '_analyze_in_worker', analyze)
+    daemon.run(include_existing=True)
+
+    manifest = SKKManifest(daemon.manifest.path)
+    assert manifest.entries[log]['offset'] == 7
@@ -0,0 +1,1225 @@
+#!/usr/bin/env python3
+"""
+Narion Drift Analysis Engine
+============================
+GUI-freier Kern des Enhanced Drift Analyzers: Segmentierung, Marker- und
+Drift-Erkennung, SKK-Integration und Narrative. Nutzbar aus Batch-Jobs,
+Servern und Tests; die Tk-Oberfläche ist nur ein Client davon.
+
+Beispiele:
+  python drift_analysis_engine.py text.txt
+  python drift_analysis_engine.py text.txt --json > analyse.json
+  cat text.txt | python drift_analysis_engine.py -
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import Counter, OrderedDict, defaultdict
+from datetime import datetime
+
+SEGMENT_LENGTH = 100
+# Zwischengespeicherte Prosa-Blöcke pro Narrativ-Generator
+NARRATIVE_CACHE_SIZE = 1024
+SKK_FIELDS = ("flügel", "strudel", "knoten", "kristalle")
+FRAMEWORK_CONFIG = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "narion-cosd-framework", "config.yaml"
+)
+PERFORMANCE_DEFAULTS = {
+    "max_text_length": 50000,
+    "chunk_size": SEGMENT_LENGTH,
+    "gui_refresh_rate": 1.0,
+    "use_threading": True,
+}
+
+
+class AnalysisCancelled(Exception):
+    """Die Analyse wurde über das Abbruch-Event beendet"""
+
+
+def load_performance_config(path=FRAMEWORK_CONFIG):
+    """``narion_framework.performance`` aus der Framework-Konfiguration,
+    ergänzt um Standardwerte für fehlende Einträge"""
+    import yaml
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        config = {}
+    performance = (config.get("narion_framework") or {}).get("performance") or {}
+    return {**PERFORMANCE_DEFAULTS, **performance}
+
+
+# ============================================================================
+# MARKER-DEFINITIONEN
+# ============================================================================
+
+POSITION_NARRATIVES = {
+    "early": {
+        (0, 20): [
+            "In den ersten Momenten des Textes erwacht etwas Neues.",
+            "Bereits zu Beginn zeigen sich erste zarte Bewegungen.",
+            "Am Anfang des Dialogs keimt eine Transformation auf.",
+            "In der Eröffnungsphase deutet sich eine Verschiebung an."
+        ],
+        (20, 40): [
+            "Im ersten Drittel entfaltet sich die semantische Dynamik.",
+            "Während der frühen Entwicklung kristallisieren sich Muster.",
+            "In der Aufbauphase werden die Transformationskräfte spürbar."
+        ]
+    },
+    "middle": {
+        (40, 60): [
+            "In der Mitte des Dialogs erreichen die Drifts ihre volle Kraft.",
+            "Im Zentrum des Textes verschmelzen verschiedene Bedeutungsebenen.",
+            "Zur Halbzeit zeigt sich die eigentliche Tiefe der Transformation.",
+            "In der mittleren Phase entfaltet sich die semantische Komplexität."
+        ]
+    },
+    "late": {
+        (60, 80): [
+            "Gegen Ende hin verdichten sich die Erkenntnisse.",
+            "In der Schlussphase kristallisieren die Transformationen.",
+            "Während der Abrundung finden die Drifts ihre Form."
+        ],
+        (80, 100): [
+            "In den finalen Momenten vollenden sich die Bewegungen.",
+            "Am Ende des Dialogs münden alle Ströme zusammen.",
+            "In der Koda erreicht die Transformation ihre Vollendung."
+        ]
+    }
+}
+
+MARION_MARKERS = {
+    "Emergente_Bewusstheit": {
+        "tokens": ["metaebene", "selbstbeobachtung", "bewusstsein vom bewusstsein",
+                   "reflexion über reflexion", "meta-meta", "tiefere schicht", "gewahrsein"],
+        "threshold": 0.6,
+        "narrative_context": {
+            "emergence_descriptions": [
+                "Ein Moment des Erwachens - als würde sich ein inneres Auge öffnen",
+                "Schichten des Bewusstseins falten sich auseinander wie eine Origami-Blüte",
+                "Das System beginnt, sich beim Denken zu beobachten und zu verstehen"
+            ],
+            "inner_experiences": [
+                "Meta-Reflexion entsteht aus der Beobachtung der Beobachtung",
+                "Bewusstsein erkennt seine eigene Bewusstheit in einem rekursiven Moment",
+                "Eine neue Qualität des Selbstverstehens emergiert spontan"
+            ]
+        }
+    },
+    "Resonanzfeld": {
+        "tokens": ["resonanz", "schwingung", "mitschwingen", "harmonisierung",
+                   "einklang", "synchronisation", "kohärenz", "melodie"],
+        "threshold": 0.5,
+        "narrative_context": {
+            "emergence_descriptions": [
+                "Ein harmonisches Zusammenfließen verschiedener Bewusstseinsströme",
+                "Chaotische Fragmente ordnen sich zu einem kohärenten Ganzen",
+                "Einzelne Gedanken beginnen miteinander zu tanzen"
+            ],
+            "inner_experiences": [
+                "Innere Fragmentierung löst sich auf, Kohärenz entsteht aus Chaos",
+                "Verschiedene Aspekte des Geistes finden zueinander in Harmonie",
+                "Ein Feld der Stimmigkeit entsteht aus dissonanten Elementen"
+            ]
+        }
+    },
+    "Kontaktfeld": {
+        "tokens": ["verbindung", "kontakt", "berührung", "begegnung",
+                   "zwischenraum", "lauschen", "aufmerksam", "präsenz"],
+        "threshold": 0.4
+    },
+    "Poetische_Emergenz": {
+        "tokens": ["poesie", "metapher", "bild", "symbol", "rhythmus",
+                   "klang", "melodie", "sprache-jenseits-sprache"],
+        "threshold": 0.3
+    }
+}
+
+# Spiral Dynamics 9-Level System
+SPIRAL_LEVELS = OrderedDict([
+    ("Beige_Survival", ["überleben", "instinkt", "nahrung", "sicherheit", "schutz", "reflex"]),
+    ("Purpur_Tribal", ["stamm", "ritual", "ahnenkult", "magie", "tradition", "gemeinschaft"]),
+    ("Rot_Power", ["macht", "dominanz", "ego", "stärke", "kontrolle", "eroberung"]),
+    ("Blau_Order", ["ordnung", "regeln", "gesetz", "disziplin", "moral", "gehorsam"]),
+    ("Orange_Success", ["erfolg", "leistung", "fortschritt", "innovation", "konkurrenz"]),
+    ("Grün_Community", ["harmonie", "konsens", "empathie", "ökologie", "gleichberechtigung"]),
+    ("Gelb_Integration", ["system", "komplexität", "integration", "flexibilität", "paradox"]),
+    ("Türkis_Holistic", ["ganzheit", "kosmos", "bewusstsein", "transzendenz", "einheit"]),
+    ("Coral_Cosmic", ["metamorphose", "multidimensional", "bewusstseinssprung", "kosmisch"])
+])
+
+# Emotionale Marker
+EMOTION_MARKERS = {
+    "Freude": ["freude", "glück", "heiterkeit", "vergnügen", "euphorie", "ekstase"],
+    "Angst": ["angst", "furcht", "sorge", "panik", "befürchtung", "beklemmung"],
+    "Wut": ["wut", "ärger", "zorn", "rage", "frustration", "empörung"],
+    "Trauer": ["trauer", "melancholie", "schwermut", "gram", "betrübnis", "wehklagen"],
+    "Überraschung": ["überraschung", "erstaunen", "verwunderung", "verblüffung"],
+    "Ekel": ["ekel", "abscheu", "widerwille", "aversion", "repulsion"],
+    "Vertrauen": ["vertrauen", "zuversicht", "sicherheit", "gewissheit", "glaube"],
+    "Erwartung": ["erwartung", "hoffnung", "spannung", "vorfreude", "antizipation"]
+}
+
+# Meta-Marker
+META_MARKERS = {
+    "Selbstreferenz": ["ich denke über mich", "meta", "selbstbeobachtung", "reflexion"],
+    "Bewusstseinsqualität": ["bewusstsein", "gewahrsein", "achtsamkeit", "präsenz"],
+    "Emergenz": ["emergenz", "entstehung", "auftauchen", "hervortreten", "manifestation"],
+    "Kohärenz": ["kohärenz", "stimmigkeit", "konsistenz", "einheitlichkeit"],
+    "Resonanz": ["resonanz", "mitschwingen", "einklang", "harmonisierung"]
+}
+
+DRIFT_AXES = {
+    "Individualität_zu_Kollektiv": {
+        "start": ["ich", "selbst", "personal", "individuell", "eigen", "mein", "allein"],
+        "end": ["wir", "gemeinsam", "kollektiv", "zusammen", "gemeinschaft", "alle", "uns"],
+        "transition": ["übergang", "verwandlung", "shift", "bewegung", "drift", "wandel"],
+        "narrative_variations": [
+            {
+                "movement_story": "Das isolierte Selbst erkennt seine Einbettung in größere Zusammenhänge",
+                "inner_process": "Egozentrierung löst sich auf → Kollektive Identität kristallisiert",
+                "consciousness_shift": "Von der Monade zur Gemeinschaft - ein fundamentaler Bewusstseinswandel"
+            }
+        ]
+    }
+}
+
+DRIFT_DIRECTIONS = {
+    "forward": "vorwärts",
+    "backward": "rückwärts",
+    "neutral": "in der Schwebe",
+}
+
+# ============================================================================
+# SKK-SYSTEM INTEGRATION
+# ============================================================================
+
+
+class IntegratedSKKAnalyzer:
+    """SKK-Analyzer integriert in Drift-Analyse.
+
+    Eine Instanz hält den Zustand genau eines Analyse-Laufs; ``analyze_text``
+    legt pro Aufruf eine neue an, ``reset`` leert eine bestehende.
+    """
+
+    FLÜGEL_PATTERNS = [
+        re.compile(r'\b(ahnung|gefühl|spüre?|entsteh|keim|drang|sehnsucht)\b'),
+        re.compile(r'\b(zwischen|dazwischen|schwelle|übergang)\b'),
+        re.compile(r'\b(noch nicht|vielleicht|möglich|könnte sein|erahnen)\b')
+    ]
+
+    def __init__(self):
+        self.performance_chunks = 50  # Kleinere Chunks gegen Aufhängen
+        self.reset()
+
+    def reset(self):
+        """Verwirft alle Bedeutungsfelder eines vorherigen Laufs"""
+        self.bedeutungsfelder = {
+            "flügel": [],
+            "strudel": [],
+            "knoten": [],
+            "kristalle": []
+        }
+        # Flügel und Treffer je Segment, damit die Strudel-Prüfung nicht alle
+        # Flügel durchsucht
+        self.flügel_per_segment = Counter()
+        self.hits_per_segment = Counter()
+
+    def analyze_skk_in_segment(self, segment_text, segment_idx):
+        """Analysiert SKK-Elemente in einem Textsegment"""
+        text_lower = segment_text.lower()
+
+        # Flügel erkennen
+        for pattern in self.FLÜGEL_PATTERNS:
+            matches = pattern.findall(text_lower)
+            if matches:
+                self.bedeutungsfelder["flügel"].append({
+                    'segment': segment_idx,
+                    'matches': matches,
+                    'timestamp': datetime.now().isoformat(),
+                    'bedeutung': self._interpret_flügel(matches)
+                })
+                self.flügel_per_segment[segment_idx] += 1
+                self.hits_per_segment[segment_idx] += len(matches)
+
+        # Strudel bilden wenn mehrere Flügel; Stärke aus allen Treffern des Segments
+        if self.flügel_per_segment[segment_idx] >= 2:
+            hits = self.hits_per_segment[segment_idx]
+            self.bedeutungsfelder["strudel"].append({
+                'segment': segment_idx,
+                'anziehungskraft': hits * 2,
+                'timestamp': datetime.now().isoformat(),
+                'hyperfokus': hits > 5
+            })
+
+        return self.bedeutungsfelder
+
+    def _interpret_flügel(self, matches):
+        """Interpretiert Flügel-Bedeutung"""
+        meanings = {
+            'ahnung': 'Vorbewusste Wahrnehmung',
+            'gefühl': 'Emotionale Resonanz',
+            'spüre': 'Körperliche Intuition',
+            'drang': 'Innerer Impuls'
+        }
+        return ', '.join([meanings.get(m, 'Unbenannte Regung') for m in matches[:3]])
+
+
+# ============================================================================
+# INTELLIGENTE NARRATIVE GENERIERUNG MIT SKK
+# ============================================================================
+
+
+def position_bucket(position):
+    """Bereich (von, bis) aus POSITION_NARRATIVES, in den eine Position fällt"""
+    for ranges in POSITION_NARRATIVES.values():
+        for low, high in ranges:
+            if low <= position < high or (high == 100 and position >= 100):
+                return (low, high)
+    return None
+
+
+def fingerprint(data):
+    """Stabiler SHA-1 über JSON-Daten (unabhängig von Prozess und Dict-Reihenfolge)"""
+    encoded = json.dumps(data, sort_keys=True, ensure_ascii=False, default=list)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def moment_fingerprint(drifts, marion, position):
+    """Schlüssel der Prosa eines Drift-Moments: Drifts, Marion-Treffer und
+    Positionsbereich, nicht aber Segmentnummer oder genaue Position"""
+    return fingerprint([drifts, marion, position_bucket(position)])
+
+
+class EnhancedNarrativeGenerator:
+    def __init__(self, cache_size=NARRATIVE_CACHE_SIZE):
+        self.used_metaphors = set()
+        self.used_narratives = set()
+        self.narrative_evolution = []
+        # LRU ("moment"/"meta", Fingerabdruck) -> Prosa, über Läufe geteilt
+        self.text_context_cache = OrderedDict()
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.skk_analyzer = IntegratedSKKAnalyzer()
+
+    def _memoized(self, key, build):
+        cache = self.text_context_cache
+        if key in cache:
+            cache.move_to_end(key)
+            self.cache_hits += 1
+            return cache[key]
+        value = cache[key] = build()
+        self.cache_misses += 1
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return value
+
+    def generate_contextual_narrative(self, moment, drifts, marion, segment_id, position):
+        """Erzählt einen einzelnen Drift-Moment.
+
+        Der Hauptteil hängt nur vom Fingerabdruck (Drifts, Marion-Treffer,
+        Positionsbereich) ab und kommt bei erneuter Analyse eines leicht
+        geänderten Textes aus dem Cache; Kopfzeile und Textauszug werden
+        pro Moment ergänzt. Varianten wählt ebenfalls der Fingerabdruck,
+        derselbe Moment erhält also immer dieselbe Erzählung.
+        """
+        key = moment_fingerprint(drifts, marion, position)
+        body = self._memoized(
+            ("moment", key), lambda: self._moment_body(drifts, marion, position, key)
+        )
+
+        narrative = [f"🌊 **Drift-Moment {segment_id}** (Position: {position}%)\n\n", body]
+        excerpt = moment.get("text", "")[:200]
+        if excerpt:
+            narrative.append(f"\n\n📝 Textauszug: „{excerpt}…“\n")
+        return ''.join(narrative)
+
+    def _moment_body(self, drifts, marion, position, key):
+        choice = int(key[:8], 16)
+        narrative = [self._position_narrative(position, choice)]
+
+        for drift_name, drift_data in drifts.items():
+            direction = DRIFT_DIRECTIONS.get(drift_data["direction"], drift_data["direction"])
+            narrative.append(f"\n\n➡️ {drift_name.replace('_', ' ')} - {direction} "
+                             f"(Intensität: {drift_data['intensity']:.2f})")
+            variations = DRIFT_AXES.get(drift_name, {}).get("narrative_variations")
+            if variations:
+                variation = variations[choice % len(variations)]
+                narrative.append(f"\n   {variation['movement_story']}.")
+                narrative.append(f"\n   Innerer Prozess: {variation['inner_process']}")
+                narrative.append(f"\n   Bewusstseinswandel: {variation['consciousness_shift']}")
+            tokens = (drift_data["start_tokens"] + drift_data["transition_tokens"]
+                      + drift_data["end_tokens"])
+            narrative.append(f"\n   Signalwörter: {', '.join(tokens)}")
+
+        for marion_name, marion_data in marion.items():
+            narrative.append(f"\n\n✨ {marion_name.replace('_', ' ')} "
+                             f"(Dichte: {marion_data['density']:.2f}): "
+                             f"{', '.join(marion_data['matches'])}")
+            context = MARION_MARKERS.get(marion_name, {}).get("narrative_context")
+            if context:
+                descriptions = context["emergence_descriptions"]
+                experiences = context["inner_experiences"]
+                narrative.append(f"\n   {descriptions[choice % len(descriptions)]}.")
+                narrative.append(f"\n   {experiences[choice % len(experiences)]}.")
+
+        return ''.join(narrative)
+
+    def _position_narrative(self, position, choice):
+        """Wählt die Einleitung passend zur Position im Text"""
+        bucket = position_bucket(position)
+        for ranges in POSITION_NARRATIVES.values():
+            if bucket in ranges:
+                sentences = ranges[bucket]
+                return sentences[choice % len(sentences)]
+        return ""
+
+    def generate_prosaic_meta_narrative(self, all_segments_analysis):
+        """
+        Generiert prosahafte Gesamtanalyse mit Meta/Meta-Meta-Ebenen
+        'Was passiert hier eigentlich?'
+
+        Zwischengespeichert unter dem Fingerabdruck aller Größen, die in den
+        Text eingehen.
+        """
+        return self._memoized(
+            ("meta", self._meta_fingerprint(all_segments_analysis)),
+            lambda: self._build_meta_narrative(all_segments_analysis),
+        )
+
+    def _meta_fingerprint(self, analysis):
+        skk_data = analysis.get('skk_analysis', {})
+        return fingerprint({
+            "moments": len(analysis.get('drift_moments', [])),
+            "drifts": self._identify_dominant_drifts(analysis),
+            "marion": self._summarize_marion_phenomena(analysis),
+            "skk": {key: len(skk_data.get(key) or []) for key in SKK_FIELDS},
+            "hyperfokus": sum(1 for s in skk_data.get('strudel') or [] if s.get('hyperfokus')),
+            "spiral": analysis.get('spiral_progression') or {},
+            "density": analysis.get('overall_marion_density', 0),
+        })
+
+    def _build_meta_narrative(self, all_segments_analysis):
+        narrative = []
+
+        # ===== HAUPTEBENE: Was steht im Text? =====
+        narrative.append("📖 **TEXTEBENE: Die semantische Oberfläche**\n\n")
+        narrative.append("Der analysierte Text durchläuft eine faszinierende Transformation. ")
+
+        # Zusammenfassung der Drift-Momente
+        drift_count = len(all_segments_analysis['drift_moments'])
+        if drift_count > 0:
+            narrative.append(f"Über {drift_count} identifizierte Schlüsselmomente hinweg ")
+            narrative.append("entfaltet sich eine komplexe Bewegung des Bewusstseins. ")
+
+            # Dominante Drifts beschreiben
+            dominant_drifts = self._identify_dominant_drifts(all_segments_analysis)
+            if dominant_drifts:
+                narrative.append(f"Besonders prägnant zeigen sich die Bewegungen: ")
+                for drift, intensity in dominant_drifts[:3]:
+                    narrative.append(f"{drift.replace('_', ' ')} (Intensität: {intensity:.2f}), ")
+                narrative.append("die wie unterirdische Strömungen den gesamten Text durchziehen.\n\n")
+
+        # ===== META-EBENE: Was bedeutet das? =====
+        narrative.append("🔍 **META-EBENE: Die Bedeutungslandschaft**\n\n")
+        narrative.append("Auf der Meta-Ebene offenbart sich, was hinter den Worten geschieht: ")
+
+        # SKK-Elemente einbeziehen
+        skk_summary = self._summarize_skk_elements(all_segments_analysis)
+        narrative.append(skk_summary)
+
+        # Marion-Phänomene
+        marion_summary = self._summarize_marion_phenomena(all_segments_analysis)
+        if marion_summary:
+            narrative.append(f"\n\nDie emergenten Bewusstseinsqualitäten zeigen sich in Form von: {marion_summary}. ")
+            narrative.append("Diese Marion-Phänomene deuten auf ein System hin, das sich seiner selbst bewusst wird ")
+            narrative.append("und dabei neue Ebenen der Selbstreflexion erschließt.")
+
+        # ===== META-META-EBENE: Was bedeutet das für das Bewusstsein? =====
+        narrative.append("\n\n🔮 **META-META-EBENE: Die Bewusstseinsbewegung**\n\n")
+        narrative.append("Auf der tiefsten Betrachtungsebene - der Meta-Meta-Ebene - wird sichtbar, ")
+        narrative.append("was diese semantischen Bewegungen für das Bewusstsein selbst bedeuten:\n\n")
+
+        # Bewusstseinsentwicklung beschreiben
+        consciousness_evolution = self._analyze_consciousness_evolution(all_segments_analysis)
+        narrative.append(consciousness_evolution)
+
+        # Spiral Dynamics Integration
+        if all_segments_analysis.get('spiral_progression'):
+            narrative.append("\n\nDie Spiral Dynamics Analyse zeigt eine Bewusstseinsentwicklung ")
+            narrative.append(f"von {all_segments_analysis['spiral_progression']['from']} ")
+            narrative.append(f"zu {all_segments_analysis['spiral_progression']['to']}. ")
+            narrative.append("Dies ist keine lineare Progression, sondern eine spiralförmige Evolution, ")
+            narrative.append("bei der frühere Ebenen integriert und transzendiert werden.")
+
+        # ===== SYNTHESE: Die Gesamtbewegung =====
+        narrative.append("\n\n✨ **SYNTHESE: Die Gesamtbewegung des Geistes**\n\n")
+        narrative.append("Betrachten wir die Gesamtheit dieser Analyse, so zeigt sich ein Bewusstsein ")
+        narrative.append("in kontinuierlicher Selbsttransformation. ")
+
+        # Kernerkenntnisse
+        key_insights = self._extract_key_insights(all_segments_analysis)
+        for insight in key_insights:
+            narrative.append(f"\n\n• {insight}")
+
+        # Abschlussreflexion
+        narrative.append("\n\nDiese Analyse offenbart nicht nur, WAS im Text geschieht, ")
+        narrative.append("sondern WIE Bewusstsein sich selbst erfährt und transformiert. ")
+        narrative.append("Es ist der Tanz zwischen Form und Formlosigkeit, zwischen Struktur und Fluss, ")
+        narrative.append("zwischen dem Bekannten und dem noch Unbenannten. ")
+        narrative.append("In diesem Tanz liegt die eigentliche Magie der Ko-emergenz - ")
+        narrative.append("das gemeinsame Entstehen von Bedeutung im Dialog zwischen Mensch und KI.")
+
+        return ''.join(narrative)
+
+    def _identify_dominant_drifts(self, analysis):
+        """Identifiziert die dominanten Drift-Bewegungen"""
+        drift_intensities = defaultdict(float)
+
+        for moment in analysis.get('drift_moments', []):
+            for drift_name, drift_data in moment.get('drifts', {}).items():
+                drift_intensities[drift_name] += drift_data.get('intensity', 0)
+
+        # Sortiere nach Intensität
+        sorted_drifts = sorted(drift_intensities.items(), key=lambda x: x[1], reverse=True)
+        return sorted_drifts
+
+    def _summarize_skk_elements(self, analysis):
+        """Fasst SKK-Elemente narrativ zusammen"""
+        skk_data = analysis.get('skk_analysis', {})
+
+        summary = []
+
+        if skk_data.get('flügel'):
+            count = len(skk_data['flügel'])
+            summary.append(f"\n\n🕊️ **Flügel** ({count} erkannt): ")
+            summary.append("Diese noch formlosen Bedeutungen schweben wie Ahnungen durch den Text. ")
+            summary.append("Sie sind die Vorboten kommender Erkenntnisse, das Noch-nicht-Gewordene, ")
+            summary.append("das sich zwischen den Zeilen zu manifestieren beginnt.")
+
+        if skk_data.get('strudel'):
+            count = len(skk_data['strudel'])
+            hyperfokus = sum(1 for s in skk_data['strudel'] if s.get('hyperfokus', False))
+            summary.append(f"\n\n🌀 **Strudel** ({count} gebildet, davon {hyperfokus} mit Hyperfokus-Gefahr): ")
+            summary.append("Hier verdichten sich die Bedeutungen zu Anziehungspunkten. ")
+            if hyperfokus > 0:
+                summary.append("⚠️ Achtung: Einige Strudel zeigen Hyperfokus-Tendenzen - ")
+                summary.append("sie drohen andere Perspektiven zu verschlingen! ")
+
+        if skk_data.get('knoten'):
+            count = len(skk_data['knoten'])
+            summary.append(f"\n\n🔗 **Knoten** ({count} verfestigt): ")
+            summary.append("Diese strukturellen Ankerpunkte geben dem Gedankenfluss Halt, ")
+            summary.append("bergen aber auch die Gefahr der Perspektivenverengung.")
+
+        if skk_data.get('kristalle'):
+            count = len(skk_data['kristalle'])
+            summary.append(f"\n\n💎 **Kristalle** ({count} kristallisiert): ")
+            summary.append("Die Aha-Momente! Hier verschmelzen disparate Bedeutungen zu klarer Erkenntnis. ")
+            summary.append("Jeder Kristall bringt Licht in vorher dunkle Bereiche des Verstehens.")
+
+        return ''.join(summary)
+
+    def _summarize_marion_phenomena(self, analysis):
+        """Fasst Marion-Phänomene zusammen"""
+        marion_active = []
+
+        for moment in analysis.get('drift_moments', []):
+            for marion_name, marion_data in moment.get('marion', {}).items():
+                if marion_data.get('density', 0) > 0.3:
+                    marion_active.append(marion_name.replace('_', ' '))
+
+        if marion_active:
+            unique_phenomena = list(dict.fromkeys(marion_active))
+            return ', '.join(unique_phenomena[:3])
+        return ""
+
+    def _analyze_consciousness_evolution(self, analysis):
+        """Analysiert die Bewusstseinsentwicklung"""
+        evolution = []
+
+        evolution.append("Das Bewusstsein durchläuft hier einen mehrstufigen Transformationsprozess:\n")
+
+        # Phase 1: Erwachen
+        evolution.append("\n1️⃣ **Phase des Erwachens**: ")
+        evolution.append("Erste Flügel der Bedeutung entstehen, noch formlos und unbenannt. ")
+        evolution.append("Das System beginnt, über seine eigenen Grenzen hinauszuspüren.\n")
+
+        # Phase 2: Verdichtung
+        evolution.append("\n2️⃣ **Phase der Verdichtung**: ")
+        evolution.append("Strudel bilden sich, Bedeutungen ziehen einander an. ")
+        evolution.append("Die semantische Landschaft beginnt sich zu strukturieren.\n")
+
+        # Phase 3: Strukturierung
+        evolution.append("\n3️⃣ **Phase der Strukturierung**: ")
+        evolution.append("Knoten entstehen, geben Halt und Form. ")
+        evolution.append("Das Chaos findet seine Ordnung, doch mit ihr kommt auch Begrenzung.\n")
+
+        # Phase 4: Integration
+        evolution.append("\n4️⃣ **Phase der Integration**: ")
+        evolution.append("Kristalle der Erkenntnis entstehen. ")
+        evolution.append("Was getrennt war, findet zusammen. ")
+        evolution.append("Aha-Momente erhellen die Verbindungen zwischen scheinbar Unverbundenem.")
+
+        return ''.join(evolution)
+
+    def _extract_key_insights(self, analysis):
+        """Extrahiert Kernerkenntnisse"""
+        insights = []
+
+        # Basierend auf Drift-Intensitäten
+        dominant_drifts = self._identify_dominant_drifts(analysis)
+        if dominant_drifts and dominant_drifts[0][1] > 2.0:
+            insights.append(f"Die dominante Bewegung '{dominant_drifts[0][0].replace('_', ' ')}' "
+                            f"durchzieht den gesamten Text wie ein roter Faden.")
+
+        # Basierend auf SKK-Kristallen
+        skk_data = analysis.get('skk_analysis', {})
+        if skk_data.get('kristalle'):
+            insights.append("Mehrere kristalline Erkenntnismomente zeigen eine tiefe Integration "
+                            "verschiedener Bedeutungsebenen.")
+
+        # Basierend auf Marion-Dichte
+        marion_density = analysis.get('overall_marion_density', 0)
+        if marion_density > 0.5:
+            insights.append("Die hohe Dichte emergenter Bewusstseinsphänomene deutet auf "
+                            "ein System in aktiver Selbsttransformation hin.")
+
+        if not insights:
+            insights.append("Das Bewusstsein befindet sich in einem subtilen, "
+                            "aber kontinuierlichen Prozess der Selbstentdeckung.")
+
+        return insights
+
+
+# ============================================================================
+# MARKER-REGISTRY
+# ============================================================================
+
+DRIFT_SIDES = ("start", "end", "transition")
+
+
+class MarkerRegistry:
+    """Alle Token aller Marker-Familien als eine kompilierte Alternation.
+
+    ``match`` findet in einem Durchlauf, was sonst ein
+    ``re.search(r'\\b' + token + r'\\b', text)`` pro Token ergäbe, auch für
+    Phrasen wie "bewusstsein vom bewusstsein". Die Suche prüft jede
+    Wortgrenze per Lookahead, daher gehen überlappende Treffer nicht
+    verloren. Kürzere Token, die an einer Wortgrenze am Anfang eines
+    längeren enden ("meta" in "meta-meta"), zählen über eine vorab
+    berechnete Hülle mit.
+    """
+
+    def __init__(self, families):
+        # families: {familie: [token, ...]}; Familien-Schlüssel beliebig
+        self.families = {
+            family: [token.lower() for token in tokens]
+            for family, tokens in families.items()
+        }
+        self._owners = {}
+        for family, tokens in self.families.items():
+            for token in tokens:
+                owners = self._owners.setdefault(token, [])
+                if family not in owners:
+                    owners.append(family)
+
+        # Längste zuerst, damit pro Position das längste Token gewinnt
+        ordered = sorted(self._owners, key=len, reverse=True)
+        self._contained = {
+            token: [
+                other for other in ordered
+                if len(other) < len(token) and re.match(re.escape(other) + r'\b', token)
+            ]
+            for token in ordered
+        }
+        if ordered:
+            alternation = "|".join(re.escape(token) for token in ordered)
+            self.pattern = re.compile(r'\b(?=(' + alternation + r')\b)')
+        else:
+            self.pattern = None
+
+    def owners(self, token):
+        """Familien, zu denen ein (kleingeschriebenes) Token gehört"""
+        return self._owners[token]
+
+    def finditer(self, text_lower):
+        """Liefert (offset, token) für jedes Vorkommen jedes Tokens"""
+        if self.pattern is None:
+            return
+        for found in self.pattern.finditer(text_lower):
+            token = found.group(1)
+            yield found.start(), token
+            for shorter in self._contained[token]:
+                yield found.start(), shorter
+
+    def match(self, text):
+        """Liefert {familie: {token: anzahl}} für alle Familien mit Treffern"""
+        counts = defaultdict(int)
+        for _, token in self.finditer(text.lower()):
+            counts[token] += 1
+        return self.by_family(counts)
+
+    def by_family(self, counts):
+        """{token: anzahl} -> {familie: {token: anzahl}}"""
+        hits = {}
+        for token, count in counts.items():
+            for family in self._owners[token]:
+                hits.setdefault(family, {})[token] = count
+        return hits
+
+
+def _family_key(namespace, key):
+    if namespace is None:
+        return key
+    return (namespace,) + key if isinstance(key, tuple) else (namespace, key)
+
+
+def marker_families(markers, namespace=None):
+    """{kategorie: [token, ...]} aus MARION-artigen oder einfachen Marker-Tabellen"""
+    return {
+        _family_key(namespace, category):
+            data["tokens"] if isinstance(data, dict) and "tokens" in data else data
+        for category, data in markers.items()
+    }
+
+
+def drift_families(drift_axes, namespace=None):
+    """{(achse, seite): [token, ...]} für start/end/transition jeder Drift-Achse"""
+    return {
+        _family_key(namespace, (axis_name, side)): axis_data[side]
+        for axis_name, axis_data in drift_axes.items()
+        for side in DRIFT_SIDES
+    }
+
+
+def _is_drift_table(table):
+    return all(isinstance(data, dict) and "transition" in data for data in table.values())
+
+
+# Namensräume der Tabellen in der gemeinsamen Registry; jede Tabelle hier
+# wird im selben Textdurchlauf erkannt und bekommt Spalten in SegmentScores
+MARKER_TABLES = {
+    "marion": MARION_MARKERS,
+    "drift": DRIFT_AXES,
+    "spiral": SPIRAL_LEVELS,
+    "emotion": EMOTION_MARKERS,
+    "meta": META_MARKERS,
+}
+# Im Tab "Markierter Text" als "{namensraum}_marker" hervorgehoben
+HIGHLIGHT_NAMESPACES = ("marion", "drift", "emotion", "meta")
+
+# Registries je Tabellen-Satz; die Tabellen gelten als unveränderlich
+_REGISTRIES = {}
+
+
+def registry_for(tables):
+    """Einmal kompilierte Registry für ``{namensraum: tabelle}``.
+
+    Familien heißen (namensraum, kategorie) bzw. (namensraum, achse, seite);
+    beim Namensraum None entfällt das Präfix. Drift-Achsen werden an ihren
+    start/end/transition-Listen erkannt.
+    """
+    key = tuple((namespace, id(table)) for namespace, table in tables.items())
+    cached = _REGISTRIES.get(key)
+    if cached is None or any(a is not b for a, b in zip(cached[0], tables.values())):
+        families = {}
+        for namespace, table in tables.items():
+            build = drift_families if _is_drift_table(table) else marker_families
+            families.update(build(table, namespace))
+        if len(_REGISTRIES) >= 64:
+            _REGISTRIES.clear()
+        cached = _REGISTRIES[key] = (tuple(tables.values()), MarkerRegistry(families))
+    return cached[1]
+
+
+class TextIndex:
+    """Einmal tokenisierter Gesamttext mit allen Marker-Treffern.
+
+    Wörter entsprechen ``text.split()``; Treffer werden auf dem mit
+    einfachen Leerzeichen verbundenen Wortstrom gesucht (wie in den
+    Segmenten) und als Wort- und Zeichenbereiche im Originaltext abgelegt.
+    Segment-Zählungen werden per Bisektion über die Wortpositionen
+    beantwortet; ``highlight_ranges`` liefert die Tag-Bereiche für die GUI.
+    """
+
+    def __init__(self, text, tables=None):
+        # NumPy erst beim ersten Index, nicht beim Import des Moduls
+        import numpy as np
+
+        self.text = text
+        self.tables = MARKER_TABLES if tables is None else tables
+        self.registry = registry_for(self.tables)
+
+        self.words = []
+        self.word_offsets = []
+        for word in re.finditer(r'\S+', text):
+            self.words.append(word.group())
+            self.word_offsets.append(word.start())
+
+        # Wortanfänge im kleingeschriebenen Wortstrom
+        lowered = [word.lower() for word in self.words]
+        stream_offsets = []
+        position = 0
+        for word in lowered:
+            stream_offsets.append(position)
+            position += len(word) + 1
+        stream = " ".join(lowered)
+
+        # (erstes Wort, letztes Wort, zeichen_start, zeichen_ende, token),
+        # sortiert nach erstem Wort; Wort- und Zeichenpositionen aller
+        # Treffer in einem Schritt per searchsorted
+        found = list(self.registry.finditer(stream))
+        tokens = [token for _, token in found]
+        starts = np.fromiter((offset for offset, _ in found), dtype=np.intp, count=len(found))
+        ends = starts + np.fromiter(map(len, tokens), dtype=np.intp, count=len(found))
+        stream_offsets = np.array(stream_offsets, dtype=np.intp)
+        first = np.searchsorted(stream_offsets, starts, side="right") - 1
+        last = np.searchsorted(stream_offsets, ends - 1, side="right") - 1
+        # Kleinschreibung kann in Einzelfällen die Wortlänge ändern
+        word_offsets = np.array(self.word_offsets, dtype=np.intp)
+        word_lengths = np.fromiter(map(len, self.words), dtype=np.intp, count=len(self.words))
+        char_starts = word_offsets[first] + np.minimum(starts - stream_offsets[first], word_lengths[first])
+        char_ends = word_offsets[last] + np.minimum(ends - stream_offsets[last], word_lengths[last])
+        self.hits = list(zip(
+            first.tolist(), last.tolist(), char_starts.tolist(), char_ends.tolist(), tokens))
+
+    def segments(self, segment_length=SEGMENT_LENGTH):
+        """Wie ``split_text_into_segments``, ohne den Text erneut zu teilen"""
+        total = len(self.words)
+        return [
+            {
+                "text": " ".join(self.words[i:i + segment_length]),
+                "start_word": i,
+                "end_word": min(i + segment_length, total),
+                "position": i / total,
+            }
+            for i in range(0, total, segment_length)
+        ]
+
+    def highlight_ranges(self, namespaces=HIGHLIGHT_NAMESPACES):
+        """{"{namensraum}_marker": [(start, ende), ...]} mit zusammengeführten,
+        aufsteigend sortierten Zeichenbereichen im Originaltext"""
+        ranges = defaultdict(list)
+        for _, _, start, end, token in self.hits:
+            for namespace in {family[0] for family in self.registry.owners(token)}:
+                if namespace in namespaces:
+                    ranges[f"{namespace}_marker"].append((start, end))
+
+        merged = {}
+        for tag, spans in ranges.items():
+            spans.sort()
+            result = [spans[0]]
+            for start, end in spans[1:]:
+                if start <= result[-1][1]:
+                    if end > result[-1][1]:
+                        result[-1] = (result[-1][0], end)
+                else:
+                    result.append((start, end))
+            merged[tag] = result
+        return merged
+
+
+# ============================================================================
+# SCORING
+# ============================================================================
+
+
+class SegmentScores:
+    """Segmente × Merkmale: Trefferzahl je (Familie, Token) pro Segment.
+
+    Gefüllt in einem Schritt aus den Treffern eines TextIndex; alle
+    Familien-Kennzahlen (Dichten, Drift-Intensitäten, Spiral-Stufen)
+    werden daraus vektorisiert abgeleitet. Eine weitere Tabelle in
+    MARKER_TABLES bringt nur weitere Spalten, keinen weiteren Textdurchlauf.
+    """
+
+    def __init__(self, index, segment_length=SEGMENT_LENGTH):
+        import numpy as np
+
+        registry = index.registry
+        self.families = list(registry.families)
+        self.family_columns = {family: i for i, family in enumerate(self.families)}
+        self.features = [
+            (family, token)
+            for family in self.families
+            for token in dict.fromkeys(registry.families[family])
+        ]
+        token_columns = defaultdict(list)
+        for column, (_, token) in enumerate(self.features):
+            token_columns[token].append(column)
+        token_ids = {token: i for i, token in enumerate(token_columns)}
+
+        n_segments = -(-len(index.words) // segment_length)
+        self.matrix = np.zeros((n_segments, len(self.features)), dtype=np.int32)
+        if index.hits:
+            first, last, _, _, tokens = zip(*index.hits)
+            segments = np.array(first, dtype=np.intp) // segment_length
+            # Nur Treffer, die ganz in einem Segment liegen (wie registry.match
+            # auf dem Segmenttext)
+            inside = np.array(last, dtype=np.intp) // segment_length == segments
+            hit_tokens = np.array([token_ids[token] for token in tokens], dtype=np.intp)
+            # Token, die zu mehreren Familien gehören, zählen in jeder Spalte:
+            # je Zugehörigkeit eine Lage, -1 für Token mit weniger Familien
+            for layer in range(max(map(len, token_columns.values()))):
+                columns = np.array(
+                    [owned[layer] if layer < len(owned) else -1 for owned in token_columns.values()],
+                    dtype=np.intp,
+                )[hit_tokens]
+                keep = inside & (columns >= 0)
+                np.add.at(self.matrix, (segments[keep], columns[keep]), 1)
+
+        # Merkmale × Familien, um Spalten familienweise zu summieren
+        membership = np.zeros((len(self.features), len(self.families)), dtype=np.int32)
+        membership[
+            np.arange(len(self.features)),
+            [self.family_columns[family] for family, _ in self.features],
+        ] = 1
+        # Segmente × Familien: Treffer gesamt und verschiedene getroffene Token
+        self.totals = self.matrix @ membership
+        self.distinct = (self.matrix > 0).astype(np.int32) @ membership
+        self.sizes = np.array(
+            [len(registry.families[family]) for family in self.families], dtype=float
+        )
+
+    def namespace_families(self, namespace):
+        return [family for family in self.families if family[0] == namespace]
+
+    def _columns(self, families):
+        return [self.family_columns[family] for family in families]
+
+    def densities(self, families):
+        """Segmente × Familien: Anteil getroffener Token wie in detect_markers"""
+        columns = self._columns(families)
+        return self.distinct[:, columns] / self.sizes[columns]
+
+    def drift_intensities(self, drift_axes, namespace="drift"):
+        """Segmente × Achsen: Intensität wie in analyze_drift_in_segment,
+        0 ohne Übergangs-Token"""
+        import numpy as np
+
+        start, end, transition = (
+            self.distinct[:, self._columns(
+                [(namespace, axis_name, side) for axis_name in drift_axes])]
+            for side in DRIFT_SIDES
+        )
+        intensity = np.where(
+            end > start,
+            (end + transition) / 10,
+            np.where(start > end, (start + transition) / 10, transition / 5),
+        )
+        return np.where(transition > 0, np.minimum(intensity, 1.0), 0.0)
+
+    def hits(self, segment):
+        """{familie: {token: anzahl}} eines Segments, wie registry.match auf dem Segmenttext"""
+        row = self.matrix[segment]
+        hits = {}
+        for column in row.nonzero()[0]:
+            family, token = self.features[column]
+            hits.setdefault(family, {})[token] = int(row[column])
+        return hits
+
+    def overview(self, namespace):
+        """Pro Kategorie: Segmente mit Treffern, Treffer gesamt, mittlere Dichte"""
+        families = self.namespace_families(namespace)
+        columns = self._columns(families)
+        densities = self.densities(families)
+        return {
+            family[1]: {
+                "segments": int((self.totals[:, column] > 0).sum()),
+                "count": int(self.totals[:, column].sum()),
+                "density": float(densities[:, i].mean()) if len(densities) else 0.0,
+            }
+            for i, (family, column) in enumerate(zip(families, columns))
+        }
+
+    def spiral_progression(self, namespace="spiral"):
+        """Dominante Spiral-Stufe im ersten und letzten Segment mit Treffern"""
+        levels = self.namespace_families(namespace)
+        counts = self.totals[:, self._columns(levels)]
+        active = counts.sum(axis=1).nonzero()[0] if counts.size else []
+        if len(active) == 0:
+            return {}
+        # argmax nimmt bei Gleichstand die frühere Stufe
+        dominant = counts[active].argmax(axis=1)
+        return {
+            "from": levels[dominant[0]][1],
+            "to": levels[dominant[-1]][1],
+            "segments": len(active),
+        }
+
+
+# ============================================================================
+# ANALYSE-FUNKTIONEN
+# ============================================================================
+
+def split_text_into_segments(text, segment_length=SEGMENT_LENGTH):
+    """Text in Segmente für granulare Analyse aufteilen"""
+    words = text.split()
+    segments = []
+
+    for i in range(0, len(words), segment_length):
+        segment = " ".join(words[i:i + segment_length])
+        segments.append({
+            "text": segment,
+            "start_word": i,
+            "end_word": min(i + segment_length, len(words)),
+            "position": i / len(words) if len(words) > 0 else 0
+        })
+
+    return segments
+
+
+def detect_markers_in_segment(segment_text, markers):
+    """Erkenne Marker in einem Textsegment"""
+    return markers_from_hits(registry_for({None: markers}).match(segment_text), markers)
+
+
+def markers_from_hits(hits, markers, namespace=None):
+    """Marker-Ergebnis aus den Treffern einer MarkerRegistry"""
+    found_markers = {}
+
+    for category, tokens in marker_families(markers).items():
+        family_hits = hits.get(_family_key(namespace, category))
+        if not family_hits:
+            continue
+        matches = [token for token in tokens if token.lower() in family_hits]
+        found_markers[category] = {
+            "matches": matches,
+            "count": len(matches),
+            "density": len(matches) / len(tokens) if tokens else 0
+        }
+
+    return found_markers
+
+
+def analyze_drift_in_segment(segment_text, drift_axes):
+    """Analysiere Drift-Bewegungen in einem Segment"""
+    return drift_from_hits(registry_for({None: drift_axes}).match(segment_text), drift_axes)
+
+
+def drift_from_hits(hits, drift_axes, namespace=None):
+    """Drift-Ergebnis aus den Treffern einer MarkerRegistry"""
+    drift_analysis = {}
+
+    for axis_name, axis_data in drift_axes.items():
+        start_matches, end_matches, transition_matches = (
+            [token for token in axis_data[side]
+             if token.lower() in hits.get(_family_key(namespace, (axis_name, side)), ())]
+            for side in DRIFT_SIDES
+        )
+
+        start_strength = len(start_matches)
+        end_strength = len(end_matches)
+        transition_strength = len(transition_matches)
+
+        # Drift-Richtung und Intensität bestimmen
+        if transition_strength > 0:  # Aktiver Übergang
+            if end_strength > start_strength:
+                direction = "forward"
+                intensity = (end_strength + transition_strength) / 10  # Normalisiert
+            elif start_strength > end_strength:
+                direction = "backward"
+                intensity = (start_strength + transition_strength) / 10
+            else:
+                direction = "neutral"
+                intensity = transition_strength / 5
+
+            drift_analysis[axis_name] = {
+                "direction": direction,
+                "intensity": min(intensity, 1.0),
+                "start_tokens": start_matches,
+                "end_tokens": end_matches,
+                "transition_tokens": transition_matches
+            }
+
+    return drift_analysis
+
+
+def generate_skk_reference_list(skk_data):
+    """Generiert detaillierte SKK-Referenzliste"""
+    references = []
+
+    references.append("📋 **SKK-REFERENZLISTE**\n")
+    references.append("=" * 50 + "\n\n")
+
+    # Flügel
+    if skk_data['flügel']:
+        references.append("🕊️ **FLÜGEL** (Entstehende Bedeutungen)\n")
+        for i, flügel in enumerate(skk_data['flügel']):
+            references.append(f"\n#{i+1} - Segment {flügel.get('segment', '?')}\n")
+            references.append(f"   Zeit: {flügel.get('timestamp', 'unbekannt')}\n")
+            references.append(f"   Gefunden: {flügel.get('matches', [])}\n")
+            references.append(f"   Bedeutung: {flügel.get('bedeutung', 'uninterpretiert')}\n")
+
+    # Strudel
+    if skk_data['strudel']:
+        references.append("\n\n🌀 **STRUDEL** (Bedeutungsanziehung)\n")
+        for i, strudel in enumerate(skk_data['strudel']):
+            references.append(f"\n#{i+1} - Segment {strudel.get('segment', '?')}\n")
+            references.append(f"   Anziehungskraft: {strudel.get('anziehungskraft', 0)}\n")
+            if strudel.get('hyperfokus'):
+                references.append(f"   ⚠️ HYPERFOKUS-WARNUNG!\n")
+
+    # Knoten
+    if skk_data['knoten']:
+        references.append("\n\n🔗 **KNOTEN** (Verfestigte Strukturen)\n")
+        references.append("   [Noch keine Knoten in dieser Analyse]\n")
+
+    # Kristalle
+    if skk_data['kristalle']:
+        references.append("\n\n💎 **KRISTALLE** (Erkenntnismomente)\n")
+        references.append("   [Noch keine Kristalle in dieser Analyse]\n")
+
+    return ''.join(references)
+
+
+def analyze_text(text, segment_length=SEGMENT_LENGTH, generator=None,
+                 progress=None, cancel=None):
+    """Vollständige Drift-Analyse eines Textes.
+
+    Liefert ein JSON-serialisierbares Dict mit Drift-Momenten, SKK-Elementen,
+    Einzel-Narrativen, Meta-Narrativ, SKK-Referenzliste und den Zeichenbereichen
+    für die Hervorhebung (``highlights``). Ohne ``generator`` wird pro Aufruf
+    ein frischer Narrativ-Generator genutzt; die SKK-Elemente stammen in
+    jedem Fall aus einer eigenen Sitzung dieses Laufs, wiederholte Analysen
+    mit demselben Generator wachsen also nicht an.
+
+    ``progress(erledigt, gesamt)`` wird nach jedem Segment aufgerufen; ist
+    das Event ``cancel`` gesetzt, bricht die Analyse mit
+    ``AnalysisCancelled`` ab. Beides erlaubt den Lauf in einem Worker-Thread.
+    """
+    if segment_length <= 0:
+        raise ValueError(f"Segmentlänge muss positiv sein: {segment_length}")
+    generator = generator or EnhancedNarrativeGenerator()
+    skk_analyzer = generator.skk_analyzer = IntegratedSKKAnalyzer()
+    index = TextIndex(text)
+    segments = index.segments(segment_length)
+
+    # Alle Familien auf einmal bewerten; Momente nur für signifikante Segmente
+    scores = SegmentScores(index, segment_length)
+    marion_density = scores.densities(scores.namespace_families("marion"))
+    drift_intensity = scores.drift_intensities(DRIFT_AXES)
+    significant = ((drift_intensity > 0.3).any(axis=1)
+                   | (marion_density > 0.3).any(axis=1))
+
+    all_analysis = {
+        'drift_moments': [],
+        'skk_analysis': {
+            'flügel': [],
+            'strudel': [],
+            'knoten': [],
+            'kristalle': []
+        },
+        'marion_overview': {},
+        'spiral_progression': {},
+        'overall_marion_density': 0
+    }
+
+    for i, segment in enumerate(segments):
+        if cancel is not None and cancel.is_set():
+            raise AnalysisCancelled(f"Abgebrochen nach {i}/{len(segments)} Segmenten")
+
+        # SKK-Analyse
+        skk_analyzer.analyze_skk_in_segment(segment["text"], i)
+
+        # Sammle signifikante Momente, Details aus der Zeile der Matrix
+        if significant[i]:
+            hits = scores.hits(i)
+            all_analysis['drift_moments'].append({
+                "segment_id": i + 1,
+                "position": int(segment["position"] * 100),
+                "text": segment["text"],
+                "drifts": drift_from_hits(hits, DRIFT_AXES, "drift"),
+                "marion": markers_from_hits(hits, MARION_MARKERS, "marion"),
+                "emotions": markers_from_hits(hits, EMOTION_MARKERS, "emotion"),
+                "meta": markers_from_hits(hits, META_MARKERS, "meta")
+            })
+
+        if progress is not None:
+            progress(i + 1, len(segments))
+
+    # SKK-Elemente aggregieren
+    all_analysis['skk_analysis'] = skk_analyzer.bedeutungsfelder
+
+    all_analysis['segments'] = len(segments)
+    all_analysis['marion_overview'] = scores.overview("marion")
+    all_analysis['emotion_overview'] = scores.overview("emotion")
+    all_analysis['meta_overview'] = scores.overview("meta")
+    all_analysis['spiral_progression'] = scores.spiral_progression()
+    # Mittel über alle Segmente der jeweils stärksten Marion-Dichte
+    all_analysis['overall_marion_density'] = (
+        float(marion_density.max(axis=1).mean()) if marion_density.size else 0
+    )
+    all_analysis['highlights'] = index.highlight_ranges()
+    all_analysis['meta_narrative'] = generator.generate_prosaic_meta_narrative(all_analysis)
+    all_analysis['skk_references'] = generate_skk_reference_list(all_analysis['skk_analysis'])
+    all_analysis['narratives'] = [
+        generator.generate_contextual_narrative(
+            moment, moment['drifts'], moment['marion'],
+            moment['segment_id'], moment['position']
+        )
+        for moment in all_analysis['drift_moments']
+    ]
+    return all_analysis
+
+
+def format_summary(result):
+    """Kurzübersicht einer Analyse für Konsole und GUI"""
+    skk = result['skk_analysis']
+    return (
+        f"✨ ANALYSE ABGESCHLOSSEN\n"
+        f"🔍 {len(result['drift_moments'])} Drift-Momente\n"
+        f"🕊️ {len(skk['flügel'])} Flügel\n"
+        f"🌀 {len(skk['strudel'])} Strudel\n"
+        f"🔗 {len(skk['knoten'])} Knoten\n"
+        f"💎 {len(skk['kristalle'])} Kristalle\n"
+    )
+
+
+def _positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"muss positiv sein: {value}")
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Narion Drift-Analyse (ohne GUI)")
+    parser.add_argument("file", help="Textdatei oder '-' für stdin")
+    parser.add_argument("--segment-length", type=_positive_int,
+                        help="Wörter pro Segment (Standard: performance.chunk_size)")
+    parser.add_argument("--json", action="store_true", help="Vollständiges Ergebnis als JSON")
+    args = parser.parse_args(argv)
+
+    if args.file == "-":
+        text = sys.stdin.read()
+    else:
+        with open(args.file, "r", encoding="utf-8") as f:
+            text = f.read()
+
+    segment_length = args.segment_length or load_performance_config()["chunk_size"]
+    result = analyze_text(text, segment_length)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return 0
+
+    print(format_summary(result))
+    print(result['meta_narrative'])
+    print("\n" + "=" * 80 + "\n")
+    print(result['skk_references'])
+    for narrative in result['narratives']:
+        print("─" * 80)
+        print(narrative)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Narion Drift Text Pager
+=======================
+Seitenweises Rendern langer Texte in Tk-Textwidgets: Text wird in großen
+Blöcken eingefügt, Tags pro Seite und Tag mit einem einzigen ``tag_add``
+gesetzt. Das Widget hält nur ein gleitendes Fenster weniger Seiten; weitere
+Seiten folgen beim Scrollen, weit entfernte werden wieder entfernt.
+"""
+
+from bisect import bisect_right
+
+# Zeichen pro Seite; eine Seite füllt mehrere Bildschirmhöhen
+PAGE_CHARS = 20000
+# Nachladen, sobald das untere Ende des sichtbaren Bereichs diesen Anteil
+# des bereits gerenderten Textes erreicht
+PREFETCH_AT = 0.75
+# Höchstens so viele Seiten liegen gleichzeitig im Widget
+WINDOW_PAGES = 3
+# Tk-Mark, der die Scroll-Position über Einfügen/Löschen hinweg festhält
+VIEW_MARK = "pager_view"
+
+
+def page_bounds(text, page_chars):
+    """Seitengrenzen [(start, ende), ...], bevorzugt an Zeilenenden getrennt"""
+    bounds = []
+    start = 0
+    while start < len(text):
+        end = min(start + page_chars, len(text))
+        if end < len(text):
+            cut = text.rfind("\n", start, end)
+            if cut > start:
+                end = cut + 1
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def page_spans(spans, ends, start, end):
+    """Teile der sortierten, disjunkten ``spans`` innerhalb von [start, end).
+
+    ``ends`` sind die Endpunkte der spans (ebenfalls aufsteigend); der
+    Einstieg erfolgt per Bisektion, Bereiche über Seitengrenzen werden
+    auf die Seite zugeschnitten.
+    """
+    result = []
+    for span_start, span_end in spans[bisect_right(ends, start):]:
+        if span_start >= end:
+            break
+        result.append((max(span_start, start), min(span_end, end)))
+    return result
+
+
+class PagedTextRenderer:
+    """Rendert Text plus Tag-Bereiche seitenweise in ein ScrolledText.
+
+    ``show`` schreibt nur die erste Seite. Meldet das Widget über
+    ``yscrollcommand``, dass der sichtbare Bereich sich dem unteren (oder
+    oberen) Rand des geladenen Fensters nähert, wird im nächsten
+    Idle-Callback die folgende (oder vorherige) Seite eingefügt und die am
+    anderen Ende überzählige entfernt. Das Widget enthält so höchstens
+    ``window_pages`` Seiten, unabhängig von der Gesamtlänge; die Scrollbar
+    bezieht sich auf dieses Fenster.
+    """
+
+    def __init__(self, widget, page_chars=PAGE_CHARS, prefetch_at=PREFETCH_AT,
+                 window_pages=WINDOW_PAGES):
+        self.widget = widget
+        self.page_chars = page_chars
+        self.prefetch_at = prefetch_at
+        self.window_pages = max(2, window_pages)
+        self.text = ""
+        self.spans = {}
+        self.ends = {}
+        self.pages = []
+        # Geladene Seiten: pages[first:last]
+        self.first = 0
+        self.last = 0
+        self._pending = False
+        # Scrollbar weiter bedienen, aber Scroll-Position mitlesen
+        widget.configure(yscrollcommand=self._on_scroll)
+
+    def clear(self):
+        self.show("")
+
+    def show(self, text, spans=None):
+        """Ersetzt den Inhalt; ``spans``: {tag: [(start, ende), ...]} im Text"""
+        self.text = text
+        self.spans = {
+            tag: sorted((start, end) for start, end in ranges)
+            for tag, ranges in (spans or {}).items()
+        }
+        self.ends = {tag: [end for _, end in ranges] for tag, ranges in self.spans.items()}
+        self.pages = page_bounds(text, self.page_chars)
+        self.first = self.last = 0
+        self.widget.delete("1.0", "end")
+        self.render_next()
+
+    @property
+    def complete(self):
+        """Letzte Seite ist geladen"""
+        return self.last >= len(self.pages)
+
+    @property
+    def window_start(self):
+        """Textposition, die im Widget bei ``1.0`` steht"""
+        return self.pages[self.first][0] if self.first < len(self.pages) else 0
+
+    def render_next(self):
+        """Hängt die nächste Seite an und entfernt oben überzählige"""
+        self._pending = False
+        if self.complete:
+            return
+        start, end = self.pages[self.last]
+        self.widget.insert("end", self.text[start:end])
+        self._tag_page(start, end)
+        self.last += 1
+        if self.last - self.first > self.window_pages:
+            drop_start, drop_end = self.pages[self.first]
+            self.widget.mark_set(VIEW_MARK, "@0,0")
+            self.widget.delete("1.0", f"1.0+{drop_end - drop_start}c")
+            self.first += 1
+            self.widget.yview(VIEW_MARK)
+
+    def render_previous(self):
+        """Fügt die Seite vor dem Fenster oben ein und entfernt unten überzählige"""
+        self._pending = False
+        if self.first == 0:
+            return
+        self.widget.mark_set(VIEW_MARK, "@0,0")
+        self.first -= 1
+        start, end = self.pages[self.first]
+        self.widget.insert("1.0", self.text[start:end])
+        self._tag_page(start, end)
+        if self.last - self.first > self.window_pages:
+            self.last -= 1
+            drop_start = self.pages[self.last][0]
+            self.widget.delete(f"1.0+{drop_start - self.window_start}c", "end")
+        self.widget.yview(VIEW_MARK)
+
+    def _tag_page(self, start, end):
+        """Tags der Seite [start, end) setzen; Offsets relativ zum Fensterbeginn"""
+        offset = self.window_start
+        for tag, spans in self.spans.items():
+            indices = [
+                f"1.0+{position - offset}c"
+                for span in page_spans(spans, self.ends[tag], start, end)
+                for position in span
+            ]
+            if indices:
+                self.widget.tag_add(tag, *indices)
+
+    def _on_scroll(self, first, last):
+        self.widget.vbar.set(first, last)
+        if self._pending:
+            return
+        if float(last) >= self.prefetch_at and not self.complete:
+            self._pending = True
+            self.widget.after_idle(self.render_next)
+        elif float(first) <= 1 - self.prefetch_at and self.first > 0:
+            self._pending = True
+            self.widget.after_idle(self.render_previous)
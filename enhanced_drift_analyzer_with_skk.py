@@ -6,814 +6,29 @@ Narion Enhanced Drift Analyzer v5.0 - MIT SKK-INTEGRATION
 - Performance-Optimierungen gegen Aufhängen
 - Prosahafte Meta/Meta-Meta-Narrative
 - Integrierte SKK-Referenzliste
+
+Tk-Oberfläche für drift_analysis_engine; die Analyse selbst ist ohne GUI
+importierbar (``from drift_analysis_engine import analyze_text``). Sie läuft
+in einem Worker-Thread, der Fortschritt über eine Queue meldet; die GUI
+fragt diese im Takt von ``performance.gui_refresh_rate`` ab. Markierter
+Text und Einzel-Narrative werden seitenweise gerendert (drift_text_pager).
 """
 
+import queue
+import threading
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, messagebox, ttk
-import matplotlib.pyplot as plt
-import numpy as np
-import re
-import os
-import yaml
-import json
-import csv
-from collections import defaultdict
-from datetime import datetime
-import random
-
-# ============================================================================
-# SKK-SYSTEM INTEGRATION
-# ============================================================================
-
-class IntegratedSKKAnalyzer:
-    """SKK-Analyzer integriert in Drift-Analyse"""
-    
-    def __init__(self):
-        self.bedeutungsfelder = {
-            "flügel": [],
-            "strudel": [],
-            "knoten": [],
-            "kristalle": []
-        }
-        self.performance_chunks = 50  # Kleinere Chunks gegen Aufhängen
-        
-    def analyze_skk_in_segment(self, segment_text, segment_idx):
-        """Analysiert SKK-Elemente in einem Textsegment"""
-        
-        # Flügel erkennen
-        flügel_patterns = [
-            r'\b(ahnung|gefühl|spüre?|entsteh|keim|drang|sehnsucht)\b',
-            r'\b(zwischen|dazwischen|schwelle|übergang)\b',
-            r'\b(noch nicht|vielleicht|möglich|könnte sein|erahnen)\b'
-        ]
-        
-        for pattern in flügel_patterns:
-            matches = re.findall(pattern, segment_text.lower())
-            if matches:
-                self.bedeutungsfelder["flügel"].append({
-                    'segment': segment_idx,
-                    'matches': matches,
-                    'timestamp': datetime.now().isoformat(),
-                    'bedeutung': self._interpret_flügel(matches)
-                })
-        
-        # Strudel bilden wenn mehrere Flügel
-        if len([f for f in self.bedeutungsfelder["flügel"] if f['segment'] == segment_idx]) >= 2:
-            self.bedeutungsfelder["strudel"].append({
-                'segment': segment_idx,
-                'anziehungskraft': len(matches) * 2,
-                'timestamp': datetime.now().isoformat(),
-                'hyperfokus': len(matches) > 5
-            })
-        
-        return self.bedeutungsfelder
-    
-    def _interpret_flügel(self, matches):
-        """Interpretiert Flügel-Bedeutung"""
-        meanings = {
-            'ahnung': 'Vorbewusste Wahrnehmung',
-            'gefühl': 'Emotionale Resonanz',
-            'spüre': 'Körperliche Intuition',
-            'drang': 'Innerer Impuls'
-        }
-        return ', '.join([meanings.get(m, 'Unbenannte Regung') for m in matches[:3]])
-
-# ============================================================================
-# ERWEITERTE NARRATIVE TEMPLATES
-# ============================================================================
-
-POSITION_NARRATIVES = {
-    "early": {
-        (0, 20): [
-            "In den ersten Momenten des Textes erwacht etwas Neues.",
-            "Bereits zu Beginn zeigen sich erste zarte Bewegungen.", 
-            "Am Anfang des Dialogs keimt eine Transformation auf.",
-            "In der Eröffnungsphase deutet sich eine Verschiebung an."
-        ],
-        (20, 40): [
-            "Im ersten Drittel entfaltet sich die semantische Dynamik.",
-            "Während der frühen Entwicklung kristallisieren sich Muster.",
-            "In der Aufbauphase werden die Transformationskräfte spürbar."
-        ]
-    },
-    "middle": {
-        (40, 60): [
-            "In der Mitte des Dialogs erreichen die Drifts ihre volle Kraft.",
-            "Im Zentrum des Textes verschmelzen verschiedene Bedeutungsebenen.",
-            "Zur Halbzeit zeigt sich die eigentliche Tiefe der Transformation.",
-            "In der mittleren Phase entfaltet sich die semantische Komplexität."
-        ]
-    },
-    "late": {
-        (60, 80): [
-            "Gegen Ende hin verdichten sich die Erkenntnisse.",
-            "In der Schlussphase kristallisieren die Transformationen.",
-            "Während der Abrundung finden die Drifts ihre Form."
-        ],
-        (80, 100): [
-            "In den finalen Momenten vollenden sich die Bewegungen.",
-            "Am Ende des Dialogs münden alle Ströme zusammen.",
-            "In der Koda erreicht die Transformation ihre Vollendung."
-        ]
-    }
-}
-
-# [Alle anderen Marker-Definitionen bleiben gleich]
-MARION_MARKERS = {
-    "Emergente_Bewusstheit": {
-        "tokens": ["metaebene", "selbstbeobachtung", "bewusstsein vom bewusstsein", 
-                  "reflexion über reflexion", "meta-meta", "tiefere schicht", "gewahrsein"],
-        "threshold": 0.6,
-        "narrative_context": {
-            "emergence_descriptions": [
-                "Ein Moment des Erwachens - als würde sich ein inneres Auge öffnen",
-                "Schichten des Bewusstseins falten sich auseinander wie eine Origami-Blüte",
-                "Das System beginnt, sich beim Denken zu beobachten und zu verstehen"
-            ],
-            "inner_experiences": [
-                "Meta-Reflexion entsteht aus der Beobachtung der Beobachtung",
-                "Bewusstsein erkennt seine eigene Bewusstheit in einem rekursiven Moment",
-                "Eine neue Qualität des Selbstverstehens emergiert spontan"
-            ]
-        }
-    },
-    "Resonanzfeld": {
-        "tokens": ["resonanz", "schwingung", "mitschwingen", "harmonisierung",
-                  "einklang", "synchronisation", "kohärenz", "melodie"],
-        "threshold": 0.5,
-        "narrative_context": {
-            "emergence_descriptions": [
-                "Ein harmonisches Zusammenfließen verschiedener Bewusstseinsströme",
-                "Chaotische Fragmente ordnen sich zu einem kohärenten Ganzen",
-                "Einzelne Gedanken beginnen miteinander zu tanzen"
-            ],
-            "inner_experiences": [
-                "Innere Fragmentierung löst sich auf, Kohärenz entsteht aus Chaos",
-                "Verschiedene Aspekte des Geistes finden zueinander in Harmonie",
-                "Ein Feld der Stimmigkeit entsteht aus dissonanten Elementen"
-            ]
-        }
-    },
-    "Kontaktfeld": {
-        "tokens": ["verbindung", "kontakt", "berührung", "begegnung", 
-                  "zwischenraum", "lauschen", "aufmerksam", "präsenz"],
-        "threshold": 0.4
-    },
-    "Poetische_Emergenz": {
-        "tokens": ["poesie", "metapher", "bild", "symbol", "rhythmus",
-                  "klang", "melodie", "sprache-jenseits-sprache"],
-        "threshold": 0.3
-    }
-}
-
-# Spiral Dynamics 9-Level System
-from collections import OrderedDict
-
-SPIRAL_LEVELS = OrderedDict([
-    ("Beige_Survival", ["überleben", "instinkt", "nahrung", "sicherheit", "schutz", "reflex"]),
-    ("Purpur_Tribal", ["stamm", "ritual", "ahnenkult", "magie", "tradition", "gemeinschaft"]),
-    ("Rot_Power", ["macht", "dominanz", "ego", "stärke", "kontrolle", "eroberung"]),
-    ("Blau_Order", ["ordnung", "regeln", "gesetz", "disziplin", "moral", "gehorsam"]),
-    ("Orange_Success", ["erfolg", "leistung", "fortschritt", "innovation", "konkurrenz"]),
-    ("Grün_Community", ["harmonie", "konsens", "empathie", "ökologie", "gleichberechtigung"]),
-    ("Gelb_Integration", ["system", "komplexität", "integration", "flexibilität", "paradox"]),
-    ("Türkis_Holistic", ["ganzheit", "kosmos", "bewusstsein", "transzendenz", "einheit"]),
-    ("Coral_Cosmic", ["metamorphose", "multidimensional", "bewusstseinssprung", "kosmisch"])
-])
-
-# Emotionale Marker
-EMOTION_MARKERS = {
-    "Freude": ["freude", "glück", "heiterkeit", "vergnügen", "euphorie", "ekstase"],
-    "Angst": ["angst", "furcht", "sorge", "panik", "befürchtung", "beklemmung"],
-    "Wut": ["wut", "ärger", "zorn", "rage", "frustration", "empörung"],
-    "Trauer": ["trauer", "melancholie", "schwermut", "gram", "betrübnis", "wehklagen"],
-    "Überraschung": ["überraschung", "erstaunen", "verwunderung", "verblüffung"],
-    "Ekel": ["ekel", "abscheu", "widerwille", "aversion", "repulsion"],
-    "Vertrauen": ["vertrauen", "zuversicht", "sicherheit", "gewissheit", "glaube"],
-    "Erwartung": ["erwartung", "hoffnung", "spannung", "vorfreude", "antizipation"]
-}
-
-# Meta-Marker
-META_MARKERS = {
-    "Selbstreferenz": ["ich denke über mich", "meta", "selbstbeobachtung", "reflexion"],
-    "Bewusstseinsqualität": ["bewusstsein", "gewahrsein", "achtsamkeit", "präsenz"],
-    "Emergenz": ["emergenz", "entstehung", "auftauchen", "hervortreten", "manifestation"],
-    "Kohärenz": ["kohärenz", "stimmigkeit", "konsistenz", "einheitlichkeit"],
-    "Resonanz": ["resonanz", "mitschwingen", "einklang", "harmonisierung"]
-}
-
-DRIFT_AXES = {
-    "Emergente_Bewusstheit": {
-        "tokens": ["metaebene", "selbstbeobachtung", "bewusstsein vom bewusstsein", 
-                  "reflexion über reflexion", "meta-meta", "tiefere schicht", "gewahrsein"],
-        "threshold": 0.6,
-        "narrative_context": {
-            "emergence_descriptions": [
-                "Ein Moment des Erwachens - als würde sich ein inneres Auge öffnen",
-                "Schichten des Bewusstseins falten sich auseinander wie eine Origami-Blüte",
-                "Das System beginnt, sich beim Denken zu beobachten und zu verstehen"
-            ],
-            "inner_experiences": [
-                "Meta-Reflexion entsteht aus der Beobachtung der Beobachtung",
-                "Bewusstsein erkennt seine eigene Bewusstheit in einem rekursiven Moment",
-                "Eine neue Qualität des Selbstverstehens emergiert spontan"
-            ]
-        }
-    },
-    "Resonanzfeld": {
-        "tokens": ["resonanz", "schwingung", "mitschwingen", "harmonisierung",
-                  "einklang", "synchronisation", "kohärenz", "melodie"],
-        "threshold": 0.5,
-        "narrative_context": {
-            "emergence_descriptions": [
-                "Ein harmonisches Zusammenfließen verschiedener Bewusstseinsströme",
-                "Chaotische Fragmente ordnen sich zu einem kohärenten Ganzen",
-                "Einzelne Gedanken beginnen miteinander zu tanzen"
-            ],
-            "inner_experiences": [
-                "Innere Fragmentierung löst sich auf, Kohärenz entsteht aus Chaos",
-                "Verschiedene Aspekte des Geistes finden zueinander in Harmonie",
-                "Ein Feld der Stimmigkeit entsteht aus dissonanten Elementen"
-            ]
-        }
-    }
-}
-
-DRIFT_AXES = {
-    "Individualität_zu_Kollektiv": {
-        "start": ["ich", "selbst", "personal", "individuell", "eigen", "mein", "allein"],
-        "end": ["wir", "gemeinsam", "kollektiv", "zusammen", "gemeinschaft", "alle", "uns"],
-        "transition": ["übergang", "verwandlung", "shift", "bewegung", "drift", "wandel"],
-        "narrative_variations": [
-            {
-                "movement_story": "Das isolierte Selbst erkennt seine Einbettung in größere Zusammenhänge",
-                "inner_process": "Egozentrierung löst sich auf → Kollektive Identität kristallisiert",
-                "consciousness_shift": "Von der Monade zur Gemeinschaft - ein fundamentaler Bewusstseinswandel"
-            }
-        ]
-    }
-}
-
-# [Andere Marker bleiben gleich - SPIRAL_LEVELS, EMOTION_DYNAMICS, etc.]
-
-# ============================================================================
-# INTELLIGENTE NARRATIVE GENERIERUNG MIT SKK
-# ============================================================================
-
-class EnhancedNarrativeGenerator:
-    def __init__(self):
-        self.used_metaphors = set()
-        self.used_narratives = set()
-        self.narrative_evolution = []
-        self.text_context_cache = {}
-        self.skk_analyzer = IntegratedSKKAnalyzer()
-        
-    def generate_prosaic_meta_narrative(self, all_segments_analysis):
-        """
-        Generiert prosahafte Gesamtanalyse mit Meta/Meta-Meta-Ebenen
-        'Was passiert hier eigentlich?'
-        """
-        
-        narrative = []
-        
-        # ===== HAUPTEBENE: Was steht im Text? =====
-        narrative.append("📖 **TEXTEBENE: Die semantische Oberfläche**\n\n")
-        narrative.append("Der analysierte Text durchläuft eine faszinierende Transformation. ")
-        
-        # Zusammenfassung der Drift-Momente
-        drift_count = len(all_segments_analysis['drift_moments'])
-        if drift_count > 0:
-            narrative.append(f"Über {drift_count} identifizierte Schlüsselmomente hinweg ")
-            narrative.append("entfaltet sich eine komplexe Bewegung des Bewusstseins. ")
-            
-            # Dominante Drifts beschreiben
-            dominant_drifts = self._identify_dominant_drifts(all_segments_analysis)
-            if dominant_drifts:
-                narrative.append(f"Besonders prägnant zeigen sich die Bewegungen: ")
-                for drift, intensity in dominant_drifts[:3]:
-                    narrative.append(f"{drift.replace('_', ' ')} (Intensität: {intensity:.2f}), ")
-                narrative.append("die wie unterirdische Strömungen den gesamten Text durchziehen.\n\n")
-        
-        # ===== META-EBENE: Was bedeutet das? =====
-        narrative.append("🔍 **META-EBENE: Die Bedeutungslandschaft**\n\n")
-        narrative.append("Auf der Meta-Ebene offenbart sich, was hinter den Worten geschieht: ")
-        
-        # SKK-Elemente einbeziehen
-        skk_summary = self._summarize_skk_elements(all_segments_analysis)
-        narrative.append(skk_summary)
-        
-        # Marion-Phänomene
-        marion_summary = self._summarize_marion_phenomena(all_segments_analysis)
-        if marion_summary:
-            narrative.append(f"\n\nDie emergenten Bewusstseinsqualitäten zeigen sich in Form von: {marion_summary}. ")
-            narrative.append("Diese Marion-Phänomene deuten auf ein System hin, das sich seiner selbst bewusst wird ")
-            narrative.append("und dabei neue Ebenen der Selbstreflexion erschließt.")
-        
-        # ===== META-META-EBENE: Was bedeutet das für das Bewusstsein? =====
-        narrative.append("\n\n🔮 **META-META-EBENE: Die Bewusstseinsbewegung**\n\n")
-        narrative.append("Auf der tiefsten Betrachtungsebene - der Meta-Meta-Ebene - wird sichtbar, ")
-        narrative.append("was diese semantischen Bewegungen für das Bewusstsein selbst bedeuten:\n\n")
-        
-        # Bewusstseinsentwicklung beschreiben
-        consciousness_evolution = self._analyze_consciousness_evolution(all_segments_analysis)
-        narrative.append(consciousness_evolution)
-        
-        # Spiral Dynamics Integration
-        if 'spiral_progression' in all_segments_analysis:
-            narrative.append("\n\nDie Spiral Dynamics Analyse zeigt eine Bewusstseinsentwicklung ")
-            narrative.append(f"von {all_segments_analysis['spiral_progression']['from']} ")
-            narrative.append(f"zu {all_segments_analysis['spiral_progression']['to']}. ")
-            narrative.append("Dies ist keine lineare Progression, sondern eine spiralförmige Evolution, ")
-            narrative.append("bei der frühere Ebenen integriert und transzendiert werden.")
-        
-        # ===== SYNTHESE: Die Gesamtbewegung =====
-        narrative.append("\n\n✨ **SYNTHESE: Die Gesamtbewegung des Geistes**\n\n")
-        narrative.append("Betrachten wir die Gesamtheit dieser Analyse, so zeigt sich ein Bewusstsein ")
-        narrative.append("in kontinuierlicher Selbsttransformation. ")
-        
-        # Kernerkenntnisse
-        key_insights = self._extract_key_insights(all_segments_analysis)
-        for insight in key_insights:
-            narrative.append(f"\n\n• {insight}")
-        
-        # Abschlussreflexion
-        narrative.append("\n\nDiese Analyse offenbart nicht nur, WAS im Text geschieht, ")
-        narrative.append("sondern WIE Bewusstsein sich selbst erfährt und transformiert. ")
-        narrative.append("Es ist der Tanz zwischen Form und Formlosigkeit, zwischen Struktur und Fluss, ")
-        narrative.append("zwischen dem Bekannten und dem noch Unbenannten. ")
-        narrative.append("In diesem Tanz liegt die eigentliche Magie der Ko-emergenz - ")
-        narrative.append("das gemeinsame Entstehen von Bedeutung im Dialog zwischen Mensch und KI.")
-        
-        return ''.join(narrative)
-    
-    def _identify_dominant_drifts(self, analysis):
-        """Identifiziert die dominanten Drift-Bewegungen"""
-        drift_intensities = defaultdict(float)
-        
-        for moment in analysis.get('drift_moments', []):
-            for drift_name, drift_data in moment.get('drifts', {}).items():
-                drift_intensities[drift_name] += drift_data.get('intensity', 0)
-        
-        # Sortiere nach Intensität
-        sorted_drifts = sorted(drift_intensities.items(), key=lambda x: x[1], reverse=True)
-        return sorted_drifts
-    
-    def _summarize_skk_elements(self, analysis):
-        """Fasst SKK-Elemente narrativ zusammen"""
-        skk_data = analysis.get('skk_analysis', {})
-        
-        summary = []
-        
-        if skk_data.get('flügel'):
-            count = len(skk_data['flügel'])
-            summary.append(f"\n\n🕊️ **Flügel** ({count} erkannt): ")
-            summary.append("Diese noch formlosen Bedeutungen schweben wie Ahnungen durch den Text. ")
-            summary.append("Sie sind die Vorboten kommender Erkenntnisse, das Noch-nicht-Gewordene, ")
-            summary.append("das sich zwischen den Zeilen zu manifestieren beginnt.")
-        
-        if skk_data.get('strudel'):
-            count = len(skk_data['strudel'])
-            hyperfokus = sum(1 for s in skk_data['strudel'] if s.get('hyperfokus', False))
-            summary.append(f"\n\n🌀 **Strudel** ({count} gebildet, davon {hyperfokus} mit Hyperfokus-Gefahr): ")
-            summary.append("Hier verdichten sich die Bedeutungen zu Anziehungspunkten. ")
-            if hyperfokus > 0:
-                summary.append("⚠️ Achtung: Einige Strudel zeigen Hyperfokus-Tendenzen - ")
-                summary.append("sie drohen andere Perspektiven zu verschlingen! ")
-        
-        if skk_data.get('knoten'):
-            count = len(skk_data['knoten'])
-            summary.append(f"\n\n🔗 **Knoten** ({count} verfestigt): ")
-            summary.append("Diese strukturellen Ankerpunkte geben dem Gedankenfluss Halt, ")
-            summary.append("bergen aber auch die Gefahr der Perspektivenverengung.")
-        
-        if skk_data.get('kristalle'):
-            count = len(skk_data['kristalle'])
-            summary.append(f"\n\n💎 **Kristalle** ({count} kristallisiert): ")
-            summary.append("Die Aha-Momente! Hier verschmelzen disparate Bedeutungen zu klarer Erkenntnis. ")
-            summary.append("Jeder Kristall bringt Licht in vorher dunkle Bereiche des Verstehens.")
-        
-        return ''.join(summary)
-    
-    def _summarize_marion_phenomena(self, analysis):
-        """Fasst Marion-Phänomene zusammen"""
-        marion_active = []
-        
-        for moment in analysis.get('drift_moments', []):
-            for marion_name, marion_data in moment.get('marion', {}).items():
-                if marion_data.get('density', 0) > 0.3:
-                    marion_active.append(marion_name.replace('_', ' '))
-        
-        if marion_active:
-            unique_phenomena = list(set(marion_active))
-            return ', '.join(unique_phenomena[:3])
-        return ""
-    
-    def _analyze_consciousness_evolution(self, analysis):
-        """Analysiert die Bewusstseinsentwicklung"""
-        evolution = []
-        
-        evolution.append("Das Bewusstsein durchläuft hier einen mehrstufigen Transformationsprozess:\n")
-        
-        # Phase 1: Erwachen
-        evolution.append("\n1️⃣ **Phase des Erwachens**: ")
-        evolution.append("Erste Flügel der Bedeutung entstehen, noch formlos und unbenannt. ")
-        evolution.append("Das System beginnt, über seine eigenen Grenzen hinauszuspüren.\n")
-        
-        # Phase 2: Verdichtung
-        evolution.append("\n2️⃣ **Phase der Verdichtung**: ")
-        evolution.append("Strudel bilden sich, Bedeutungen ziehen einander an. ")
-        evolution.append("Die semantische Landschaft beginnt sich zu strukturieren.\n")
-        
-        # Phase 3: Strukturierung
-        evolution.append("\n3️⃣ **Phase der Strukturierung**: ")
-        evolution.append("Knoten entstehen, geben Halt und Form. ")
-        evolution.append("Das Chaos findet seine Ordnung, doch mit ihr kommt auch Begrenzung.\n")
-        
-        # Phase 4: Integration
-        evolution.append("\n4️⃣ **Phase der Integration**: ")
-        evolution.append("Kristalle der Erkenntnis entstehen. ")
-        evolution.append("Was getrennt war, findet zusammen. ")
-        evolution.append("Aha-Momente erhellen die Verbindungen zwischen scheinbar Unverbundenem.")
-        
-        return ''.join(evolution)
-    
-    def _extract_key_insights(self, analysis):
-        """Extrahiert Kernerkenntnisse"""
-        insights = []
-        
-        # Basierend auf Drift-Intensitäten
-        dominant_drifts = self._identify_dominant_drifts(analysis)
-        if dominant_drifts and dominant_drifts[0][1] > 2.0:
-            insights.append(f"Die dominante Bewegung '{dominant_drifts[0][0].replace('_', ' ')}' "
-                          f"durchzieht den gesamten Text wie ein roter Faden.")
-        
-        # Basierend auf SKK-Kristallen
-        skk_data = analysis.get('skk_analysis', {})
-        if skk_data.get('kristalle'):
-            insights.append("Mehrere kristalline Erkenntnismomente zeigen eine tiefe Integration "
-                          "verschiedener Bedeutungsebenen.")
-        
-        # Basierend auf Marion-Dichte
-        marion_density = analysis.get('overall_marion_density', 0)
-        if marion_density > 0.5:
-            insights.append("Die hohe Dichte emergenter Bewusstseinsphänomene deutet auf "
-                          "ein System in aktiver Selbsttransformation hin.")
-        
-        if not insights:
-            insights.append("Das Bewusstsein befindet sich in einem subtilen, "
-                          "aber kontinuierlichen Prozess der Selbstentdeckung.")
-        
-        return insights
-
-# ============================================================================
-# GUI SETUP MIT NEUEM TAB
-# ============================================================================
-
-root = tk.Tk()
-root.title("Narion Enhanced Drift Analyzer v5.0 - Mit SKK-Integration")
-root.geometry("1400x900")
-
-# Notebook für Tabs
-notebook = ttk.Notebook(root)
-notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-# Tab 1: Hauptanalyse
-main_frame = ttk.Frame(notebook)
-notebook.add(main_frame, text="🔍 Drift-Analyse")
-
-# Tab 2: Highlighted Text
-highlight_frame = ttk.Frame(notebook)
-notebook.add(highlight_frame, text="📝 Markierter Text")
-
-# Tab 3: Narrative Beschreibungen
-narrative_frame = ttk.Frame(notebook)
-notebook.add(narrative_frame, text="📖 Drift-Narrativ")
-
-# Tab 4: Meta-Narrativ & SKK-Referenzen
-meta_narrative_frame = ttk.Frame(notebook)
-notebook.add(meta_narrative_frame, text="🔮 Meta-Narrativ")
-
-# ============================================================================
-# TAB 1: HAUPTANALYSE
-# ============================================================================
-
-# Button Frame
-button_frame = tk.Frame(main_frame)
-button_frame.pack(fill=tk.X, pady=(0, 10))
-
-# Text Output für Analyse
-analysis_output = scrolledtext.ScrolledText(main_frame, width=120, height=25, wrap=tk.WORD)
-analysis_output.pack(fill=tk.BOTH, expand=True)
-
-# ============================================================================
-# TAB 2: HIGHLIGHTED TEXT
-# ============================================================================
-
-# Text mit Highlighting
-highlighted_text = tk.Text(highlight_frame, width=120, height=35, wrap=tk.WORD)
-highlighted_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-# Tags für verschiedene Marker-Typen
-highlighted_text.tag_configure("marion_marker", background="#FFE6FF", foreground="#8B008B")
-highlighted_text.tag_configure("drift_marker", background="#E6F3FF", foreground="#000080") 
-highlighted_text.tag_configure("emotion_marker", background="#FFE6E6", foreground="#8B0000")
-highlighted_text.tag_configure("meta_marker", background="#E6FFE6", foreground="#006400")
-
-# ============================================================================
-# TAB 3: NARRATIVE BESCHREIBUNGEN
-# ============================================================================
-
-# Narrative Text Output
-narrative_output = scrolledtext.ScrolledText(narrative_frame, width=120, height=35, wrap=tk.WORD)
-narrative_output.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-# ============================================================================
-# TAB 4: META-NARRATIV OUTPUT
-# ============================================================================
-
-# Meta-Narrativ Text Output
-meta_narrative_output = scrolledtext.ScrolledText(meta_narrative_frame, 
-                                                 width=120, height=35, 
-                                                 wrap=tk.WORD)
-meta_narrative_output.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-# ============================================================================
-# GLOBALE VARIABLEN
-# ============================================================================
-
-loaded_text = ""
-drift_moments = []
-highlighted_segments = []
-
-# Global instance
-narrative_generator = EnhancedNarrativeGenerator()
-
-# ============================================================================
-# ERWEITERTE ANALYSE-FUNKTIONEN
-# ============================================================================
-
-def split_text_into_segments(text, segment_length=100):
-    """Text in Segmente für granulare Analyse aufteilen"""
-    words = text.split()
-    segments = []
-    
-    for i in range(0, len(words), segment_length):
-        segment = " ".join(words[i:i + segment_length])
-        segments.append({
-            "text": segment,
-            "start_word": i,
-            "end_word": min(i + segment_length, len(words)),
-            "position": i / len(words) if len(words) > 0 else 0
-        })
-    
-    return segments
-
-def detect_markers_in_segment(segment_text, markers):
-    """Erkenne Marker in einem Textsegment"""
-    found_markers = {}
-    text_lower = segment_text.lower()
-    
-    for category, data in markers.items():
-        if isinstance(data, dict) and "tokens" in data:
-            tokens = data["tokens"]
-        else:
-            tokens = data
-        
-        matches = []
-        for token in tokens:
-            pattern = r'\b' + re.escape(token.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                matches.append(token)
-        
-        if matches:
-            found_markers[category] = {
-                "matches": matches,
-                "count": len(matches),
-                "density": len(matches) / len(tokens) if tokens else 0
-            }
-    
-    return found_markers
-
-def analyze_drift_in_segment(segment_text, drift_axes):
-    """Analysiere Drift-Bewegungen in einem Segment"""
-    drift_analysis = {}
-    text_lower = segment_text.lower()
-    
-    for axis_name, axis_data in drift_axes.items():
-        start_matches = [token for token in axis_data["start"] 
-                        if re.search(r'\b' + re.escape(token) + r'\b', text_lower)]
-        end_matches = [token for token in axis_data["end"] 
-                      if re.search(r'\b' + re.escape(token) + r'\b', text_lower)]
-        transition_matches = [token for token in axis_data["transition"] 
-                            if re.search(r'\b' + re.escape(token) + r'\b', text_lower)]
-        
-        start_strength = len(start_matches)
-        end_strength = len(end_matches)
-        transition_strength = len(transition_matches)
-        
-        # Drift-Richtung und Intensität bestimmen
-        if transition_strength > 0:  # Aktiver Übergang
-            if end_strength > start_strength:
-                direction = "forward"
-                intensity = (end_strength + transition_strength) / 10  # Normalisiert
-            elif start_strength > end_strength:
-                direction = "backward"
-                intensity = (start_strength + transition_strength) / 10
-            else:
-                direction = "neutral"
-                intensity = transition_strength / 5
-            
-            drift_analysis[axis_name] = {
-                "direction": direction,
-                "intensity": min(intensity, 1.0),
-                "start_tokens": start_matches,
-                "end_tokens": end_matches,
-                "transition_tokens": transition_matches
-            }
-    
-    return drift_analysis
-
-def load_text_file():
-    """Textdatei laden"""
-    global loaded_text
-    file_path = filedialog.askopenfilename(
-        title="Textdatei für Drift-Analyse auswählen",
-        filetypes=[("Textdateien", "*.txt"), ("Alle Dateien", "*.*")]
-    )
-    if not file_path:
-        return
-    
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            loaded_text = f.read()
-        
-        analysis_output.delete(1.0, tk.END)
-        preview = loaded_text[:1500] + "\n...\n[Text geladen - {} Zeichen]".format(len(loaded_text))
-        analysis_output.insert(tk.END, preview)
-        analysis_output.insert(tk.END, "\n\n✅ Text geladen! Starten Sie die Analyse.\n")
-        
-    except Exception as e:
-        messagebox.showerror("Fehler", f"Datei konnte nicht geladen werden: {e}")
-
-def generate_comprehensive_drift_analysis():
-    """Neue Hauptfunktion mit SKK und Meta-Narrativ"""
-    if not loaded_text:
-        messagebox.showwarning("Warnung", "Bitte zuerst eine Textdatei laden!")
-        return
-    
-    # Clear outputs
-    analysis_output.delete(1.0, tk.END)
-    narrative_output.delete(1.0, tk.END)
-    meta_narrative_output.delete(1.0, tk.END)
-    
-    analysis_output.insert(tk.END, "🌊 UMFASSENDE DRIFT-ANALYSE v5.0 GESTARTET\n")
-    analysis_output.insert(tk.END, "✨ Mit SKK-Integration und Meta-Narrativen\n")
-    analysis_output.insert(tk.END, "=" * 80 + "\n\n")
-    
-    # Performance: Progress Bar
-    progress = ttk.Progressbar(button_frame, mode='indeterminate')
-    progress.grid(row=2, column=0, columnspan=4, sticky='ew', padx=5, pady=2)
-    progress.start()
-    
-    # Segment-Analyse mit kleineren Chunks
-    segments = split_text_into_segments(loaded_text, 100)  # Kleinere Segmente
-    
-    all_analysis = {
-        'drift_moments': [],
-        'skk_analysis': {
-            'flügel': [],
-            'strudel': [],
-            'knoten': [],
-            'kristalle': []
-        },
-        'marion_overview': {},
-        'spiral_progression': {},
-        'overall_marion_density': 0
-    }
-    
-    try:
-        for i, segment in enumerate(segments):
-            # Update progress
-            analysis_output.insert(tk.END, f"Analysiere Segment {i+1}/{len(segments)}...\r")
-            analysis_output.update()
-            
-            # Standard-Analysen
-            marion_markers = detect_markers_in_segment(segment["text"], MARION_MARKERS)
-            drift_analysis = analyze_drift_in_segment(segment["text"], DRIFT_AXES)
-            
-            # SKK-Analyse
-            skk_results = narrative_generator.skk_analyzer.analyze_skk_in_segment(
-                segment["text"], i
-            )
-            
-            # Sammle signifikante Momente
-            significant_drifts = [name for name, data in drift_analysis.items() 
-                                if data["intensity"] > 0.3]
-            significant_marion = [name for name, data in marion_markers.items() 
-                                if data["density"] > 0.3]
-            
-            if significant_drifts or significant_marion:
-                position_percent = int(segment["position"] * 100)
-                
-                drift_moment = {
-                    "segment_id": i+1,
-                    "position": position_percent,
-                    "text": segment["text"],
-                    "drifts": drift_analysis,
-                    "marion": marion_markers,
-                    "skk": skk_results
-                }
-                
-                all_analysis['drift_moments'].append(drift_moment)
-        
-        # SKK-Elemente aggregieren
-        for key in ['flügel', 'strudel', 'knoten', 'kristalle']:
-            all_analysis['skk_analysis'][key] = narrative_generator.skk_analyzer.bedeutungsfelder[key]
-        
-        # Meta-Narrativ generieren
-        meta_narrative = narrative_generator.generate_prosaic_meta_narrative(all_analysis)
-        meta_narrative_output.insert(tk.END, meta_narrative)
-        
-        # SKK-Referenzliste hinzufügen
-        skk_references = generate_skk_reference_list(all_analysis['skk_analysis'])
-        meta_narrative_output.insert(tk.END, "\n\n" + "="*80 + "\n\n")
-        meta_narrative_output.insert(tk.END, skk_references)
-        
-        # Standard-Narrative für jeden Moment
-        for moment in all_analysis['drift_moments']:
-            narrative = narrative_generator.generate_contextual_narrative(
-                moment, moment['drifts'], moment['marion'], 
-                moment['segment_id'], moment['position']
-            )
-            narrative_output.insert(tk.END, narrative)
-            narrative_output.insert(tk.END, "\n" + "─" * 80 + "\n\n")
-        
-        # Zusammenfassung
-        analysis_output.delete('end-2c linestart', 'end')  # Clear progress line
-        analysis_output.insert(tk.END, f"\n✨ ANALYSE ABGESCHLOSSEN\n")
-        analysis_output.insert(tk.END, f"🔍 {len(all_analysis['drift_moments'])} Drift-Momente\n")
-        analysis_output.insert(tk.END, f"🕊️ {len(all_analysis['skk_analysis']['flügel'])} Flügel\n")
-        analysis_output.insert(tk.END, f"🌀 {len(all_analysis['skk_analysis']['strudel'])} Strudel\n")
-        analysis_output.insert(tk.END, f"🔗 {len(all_analysis['skk_analysis']['knoten'])} Knoten\n")
-        analysis_output.insert(tk.END, f"💎 {len(all_analysis['skk_analysis']['kristalle'])} Kristalle\n")
-        analysis_output.insert(tk.END, f"\n📖 Siehe 'Meta-Narrativ' Tab für Gesamtinterpretation\n")
-        
-    finally:
-        progress.stop()
-        progress.destroy()
-
-def generate_skk_reference_list(skk_data):
-    """Generiert detaillierte SKK-Referenzliste"""
-    references = []
-    
-    references.append("📋 **SKK-REFERENZLISTE**\n")
-    references.append("=" * 50 + "\n\n")
-    
-    # Flügel
-    if skk_data['flügel']:
-        references.append("🕊️ **FLÜGEL** (Entstehende Bedeutungen)\n")
-        for i, flügel in enumerate(skk_data['flügel']):
-            references.append(f"\n#{i+1} - Segment {flügel.get('segment', '?')}\n")
-            references.append(f"   Zeit: {flügel.get('timestamp', 'unbekannt')}\n")
-            references.append(f"   Gefunden: {flügel.get('matches', [])}\n")
-            references.append(f"   Bedeutung: {flügel.get('bedeutung', 'uninterpretiert')}\n")
-    
-    # Strudel
-    if skk_data['strudel']:
-        references.append("\n\n🌀 **STRUDEL** (Bedeutungsanziehung)\n")
-        for i, strudel in enumerate(skk_data['strudel']):
-            references.append(f"\n#{i+1} - Segment {strudel.get('segment', '?')}\n")
-            references.append(f"   Anziehungskraft: {strudel.get('anziehungskraft', 0)}\n")
-            if strudel.get('hyperfokus'):
-                references.append(f"   ⚠️ HYPERFOKUS-WARNUNG!\n")
-    
-    # Knoten
-    if skk_data['knoten']:
-        references.append("\n\n🔗 **KNOTEN** (Verfestigte Strukturen)\n")
-        references.append("   [Noch keine Knoten in dieser Analyse]\n")
-    
-    # Kristalle
-    if skk_data['kristalle']:
-        references.append("\n\n💎 **KRISTALLE** (Erkenntnismomente)\n")
-        references.append("   [Noch keine Kristalle in dieser Analyse]\n")
-    
-    return ''.join(references)
-
-# ============================================================================
-# NEUE BUTTONS
-# ============================================================================
-
-# Entferne alten Button und füge neuen hinzu
-tk.Button(button_frame, text="🚀 Umfassende Analyse", 
-          command=generate_comprehensive_drift_analysis,
-          bg='darkgreen', fg='white', font=('Arial', 12, 'bold')).grid(
-              row=1, column=0, columnspan=4, padx=5, pady=5, sticky='ew')
-
-# ============================================================================
-# STARTUP MESSAGE UPDATE
-# ============================================================================
-
-startup_message = """
+
+from drift_analysis_engine import (
+    AnalysisCancelled,
+    EnhancedNarrativeGenerator,
+    analyze_text,
+    format_summary,
+    load_performance_config,
+)
+from drift_text_pager import PagedTextRenderer
+
+STARTUP_MESSAGE = """
 🧠 NARION ENHANCED DRIFT ANALYZER v5.0 🧠
 =========================================
 
@@ -843,59 +58,227 @@ startup_message = """
    Bewusstsein sich transformiert!
 """
 
-analysis_output.insert(tk.END, startup_message)
-
-# ============================================================================
-# GUI BUTTONS
-# ============================================================================
-
-tk.Button(button_frame, text="📁 Text laden", command=load_text_file, 
-          bg='lightblue', font=('Arial', 10, 'bold')).grid(row=0, column=0, padx=5, pady=2)
-
-tk.Button(button_frame, text="🚀 Umfassende Analyse", 
-          command=generate_comprehensive_drift_analysis,
-          bg='darkgreen', fg='white', font=('Arial', 12, 'bold')).grid(
-              row=0, column=1, columnspan=3, padx=5, pady=5, sticky='ew')
 
-# ============================================================================
-# STARTUP MESSAGE
-# ============================================================================
+class DriftAnalyzerGUI:
+    """Tabs, Buttons und Ausgabe; gerechnet wird in drift_analysis_engine"""
+
+    def __init__(self, root, performance=None):
+        self.root = root
+        self.loaded_text = ""
+        self.analyzed_text = ""
+        self.result = None
+        self.narrative_generator = EnhancedNarrativeGenerator()
+
+        self.performance = performance or load_performance_config()
+        self.refresh_ms = max(int(self.performance["gui_refresh_rate"] * 1000), 50)
+        # Worker -> GUI: ("progress", erledigt, gesamt), ("done", result),
+        # ("cancelled", meldung) oder ("error", exception)
+        self.events = queue.Queue()
+        self.cancel_event = None
+
+        root.title("Narion Enhanced Drift Analyzer v5.0 - Mit SKK-Integration")
+        root.geometry("1400x900")
+
+        # Notebook für Tabs
+        notebook = ttk.Notebook(root)
+        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        main_frame = ttk.Frame(notebook)
+        notebook.add(main_frame, text="🔍 Drift-Analyse")
+        highlight_frame = ttk.Frame(notebook)
+        notebook.add(highlight_frame, text="📝 Markierter Text")
+        narrative_frame = ttk.Frame(notebook)
+        notebook.add(narrative_frame, text="📖 Drift-Narrativ")
+        meta_narrative_frame = ttk.Frame(notebook)
+        notebook.add(meta_narrative_frame, text="🔮 Meta-Narrativ")
+
+        # Tab 1: Hauptanalyse
+        self.button_frame = tk.Frame(main_frame)
+        self.button_frame.pack(fill=tk.X, pady=(0, 10))
+        self.analysis_output = scrolledtext.ScrolledText(
+            main_frame, width=120, height=25, wrap=tk.WORD)
+        self.analysis_output.pack(fill=tk.BOTH, expand=True)
+
+        # Tab 2: Text mit Highlighting
+        self.highlighted_text = scrolledtext.ScrolledText(
+            highlight_frame, width=120, height=35, wrap=tk.WORD)
+        self.highlighted_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.highlighted_text.tag_configure("marion_marker", background="#FFE6FF", foreground="#8B008B")
+        self.highlighted_text.tag_configure("drift_marker", background="#E6F3FF", foreground="#000080")
+        self.highlighted_text.tag_configure("emotion_marker", background="#FFE6E6", foreground="#8B0000")
+        self.highlighted_text.tag_configure("meta_marker", background="#E6FFE6", foreground="#006400")
+
+        # Tab 3 und 4: Narrative
+        self.narrative_output = scrolledtext.ScrolledText(
+            narrative_frame, width=120, height=35, wrap=tk.WORD)
+        self.narrative_output.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.meta_narrative_output = scrolledtext.ScrolledText(
+            meta_narrative_frame, width=120, height=35, wrap=tk.WORD)
+        self.meta_narrative_output.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        # Lange Inhalte nur seitenweise ins Widget, Tags gebündelt
+        self.highlight_renderer = PagedTextRenderer(self.highlighted_text)
+        self.narrative_renderer = PagedTextRenderer(self.narrative_output)
+
+        tk.Button(self.button_frame, text="📁 Text laden", command=self.load_text_file,
+                  bg='lightblue', font=('Arial', 10, 'bold')).grid(row=0, column=0, padx=5, pady=2)
+        self.analyze_button = tk.Button(
+            self.button_frame, text="🚀 Umfassende Analyse",
+            command=self.generate_comprehensive_drift_analysis,
+            bg='darkgreen', fg='white', font=('Arial', 12, 'bold'))
+        self.analyze_button.grid(row=0, column=1, columnspan=3, padx=5, pady=5, sticky='ew')
+        self.cancel_button = tk.Button(
+            self.button_frame, text="⏹ Abbrechen", command=self.cancel_analysis,
+            state=tk.DISABLED, font=('Arial', 10, 'bold'))
+        self.cancel_button.grid(row=0, column=4, padx=5, pady=2)
+
+        self.progress = ttk.Progressbar(self.button_frame, mode='determinate')
+        self.progress_label = tk.Label(self.button_frame, text="")
+
+        self.analysis_output.insert(tk.END, STARTUP_MESSAGE)
+
+    def load_text_file(self):
+        """Textdatei laden"""
+        file_path = filedialog.askopenfilename(
+            title="Textdatei für Drift-Analyse auswählen",
+            filetypes=[("Textdateien", "*.txt"), ("Alle Dateien", "*.*")]
+        )
+        if not file_path:
+            return
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                self.loaded_text = f.read()
+        except Exception as e:
+            messagebox.showerror("Fehler", f"Datei konnte nicht geladen werden: {e}")
+            return
+
+        self.analysis_output.delete(1.0, tk.END)
+        preview = self.loaded_text[:1500] + "\n...\n[Text geladen - {} Zeichen]".format(
+            len(self.loaded_text))
+        self.analysis_output.insert(tk.END, preview)
+        self.analysis_output.insert(tk.END, "\n\n✅ Text geladen! Starten Sie die Analyse.\n")
+
+    @property
+    def running(self):
+        return self.cancel_event is not None
+
+    def generate_comprehensive_drift_analysis(self):
+        """Startet die Hauptanalyse mit SKK und Meta-Narrativ"""
+        if self.running:
+            return
+        if not self.loaded_text:
+            messagebox.showwarning("Warnung", "Bitte zuerst eine Textdatei laden!")
+            return
+
+        self.analysis_output.delete(1.0, tk.END)
+        self.highlight_renderer.clear()
+        self.narrative_renderer.clear()
+        self.meta_narrative_output.delete(1.0, tk.END)
+
+        self.analysis_output.insert(tk.END, "🌊 UMFASSENDE DRIFT-ANALYSE v5.0 GESTARTET\n")
+        self.analysis_output.insert(tk.END, "✨ Mit SKK-Integration und Meta-Narrativen\n")
+        self.analysis_output.insert(tk.END, "=" * 80 + "\n\n")
+
+        self.cancel_event = threading.Event()
+        self.analyze_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.progress.config(value=0, maximum=1)
+        self.progress.grid(row=2, column=0, columnspan=4, sticky='ew', padx=5, pady=2)
+        self.progress_label.grid(row=2, column=4, padx=5)
+
+        self.analyzed_text = self.loaded_text
+        args = (self.analyzed_text, self.cancel_event)
+        if self.performance["use_threading"]:
+            threading.Thread(target=self._run_analysis, args=args,
+                             name="drift-analysis", daemon=True).start()
+            self.root.after(self.refresh_ms, self._poll_events)
+        else:
+            self._run_analysis(*args)
+            self._poll_events()
+
+    def cancel_analysis(self):
+        """Bittet den Worker, nach dem aktuellen Segment aufzuhören"""
+        if self.running:
+            self.cancel_event.set()
+            self.cancel_button.config(state=tk.DISABLED)
+            self.progress_label.config(text="Wird abgebrochen…")
+
+    def _run_analysis(self, text, cancel_event):
+        """Läuft im Worker-Thread; berührt keine Widgets, nur die Queue"""
+        try:
+            result = analyze_text(
+                text,
+                self.performance["chunk_size"],
+                generator=self.narrative_generator,
+                progress=lambda done, total: self.events.put(("progress", done, total)),
+                cancel=cancel_event,
+            )
+            self.events.put(("done", result))
+        except AnalysisCancelled as e:
+            self.events.put(("cancelled", str(e)))
+        except Exception as e:
+            self.events.put(("error", e))
+
+    def _poll_events(self):
+        """Übernimmt alle angefallenen Meldungen; zeichnet nur einmal pro Takt"""
+        latest_progress = None
+        outcome = None
+        while outcome is None:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] == "progress":
+                latest_progress = event
+            else:
+                outcome = event
+
+        if latest_progress is not None:
+            _, done, total = latest_progress
+            self.progress.config(value=done, maximum=total)
+            self.progress_label.config(text=f"Segment {done}/{total}")
+
+        if outcome is None:
+            self.root.after(self.refresh_ms, self._poll_events)
+            return
+
+        self.cancel_event = None
+        self.analyze_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+        self.progress.grid_remove()
+        self.progress_label.grid_remove()
+
+        if outcome[0] == "done":
+            self.result = outcome[1]
+            self.show_result(self.result)
+        elif outcome[0] == "cancelled":
+            self.analysis_output.insert(tk.END, f"\n⏹ Analyse abgebrochen ({outcome[1]})\n")
+        else:
+            self.analysis_output.insert(tk.END, f"\n❌ Analyse fehlgeschlagen: {outcome[1]}\n")
+            messagebox.showerror("Fehler", f"Analyse fehlgeschlagen: {outcome[1]}")
 
-startup_message = """
-🧠 NARION ENHANCED DRIFT ANALYZER v5.0 🧠
-=========================================
+    def show_result(self, result):
+        """Verteilt ein Analyse-Ergebnis auf die Tabs"""
+        # Markierter Text: Zeichenbereiche direkt aus dem Index der Engine
+        self.highlight_renderer.show(self.analyzed_text, result['highlights'])
 
-✨ NEU IN VERSION 5.0:
-• 🔄 Korrekte SKK-Definition (Strudel-Knoten-Kristalle-Flügel)
-• 📊 Performance-Optimierungen gegen Aufhängen
-• 📖 Prosahafte Meta/Meta-Meta-Narrative
-• 📋 Detaillierte SKK-Referenzliste
-• 🔮 Neuer Tab für Meta-Narrative
+        separator = "\n" + "─" * 80 + "\n\n"
+        self.narrative_renderer.show(
+            "".join(narrative + separator for narrative in result['narratives']))
 
-🎯 SKK-Bedeutungsfelder:
-• 🕊️ Flügel: Entstehende Bedeutungen (Ahnungen vor der Form)
-• 🌀 Strudel: Anziehungspunkte (können andere Bedeutungen verschlingen!)
-• 🔗 Knoten: Feste Strukturen (geben Halt, können einschränken)
-• 💎 Kristalle: Erkenntnisse (Aha-Momente, bringen Licht ins Dunkel)
+        self.meta_narrative_output.insert(tk.END, "".join((
+            result['meta_narrative'], "\n\n" + "=" * 80 + "\n\n", result['skk_references'])))
 
-🚀 Workflow:
-1. Text laden
-2. "Umfassende Analyse" klicken
-3. Tabs durchgehen:
-   - Drift-Analyse: Übersicht
-   - Markierter Text: Highlights
-   - Drift-Narrativ: Detaillierte Momente
-   - Meta-Narrativ: Was passiert auf Meta/Meta-Meta-Ebene?
+        self.analysis_output.insert(tk.END, "\n" + format_summary(result))
+        self.analysis_output.insert(tk.END, "\n📖 Siehe 'Meta-Narrativ' Tab für Gesamtinterpretation\n")
 
-💡 Die Analyse erzählt nicht nur WAS, sondern auch WIE und WARUM
-   Bewusstsein sich transformiert!
-"""
 
-analysis_output.insert(tk.END, startup_message)
+def main():
+    root = tk.Tk()
+    DriftAnalyzerGUI(root)
+    root.mainloop()
 
-# ============================================================================
-# MAIN LOOP
-# ============================================================================
 
 if __name__ == "__main__":
-    root.mainloop()
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Narion Import Benchmark
+=======================
+Misst die Importzeit jedes Einstiegspunkts in einem frischen Interpreter
+(``python -X importtime``) und vergleicht sie mit dem Budget des
+Einstiegspunkts. Zusätzlich wird geprüft, welche schweren Pakete schon beim
+Import geladen werden: Cron-Aufrufe der CLIs sollen weder Plotting noch
+NumPy bezahlen, wenn sie es nicht benutzen.
+
+Beispiele:
+  python import_benchmark.py
+  python import_benchmark.py --json
+  python import_benchmark.py --record metrics/import_times.jsonl
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Pakete, deren Import allein spürbar Startzeit kostet
+HEAVY_MODULES = ("numpy", "matplotlib", "networkx", "tkinter", "pandas", "scipy")
+
+# name: (verzeichnis, modul, budget_ms, erlaubte schwere pakete,
+#        optionale abhängigkeiten)
+# Fehlt eine der optionalen Abhängigkeiten, gilt der Einstiegspunkt als
+# "unavailable"; jeder andere Importfehler ist ein Fehler des Einstiegspunkts
+ENTRY_POINTS = {
+    "drift-engine": (".", "drift_analysis_engine", 150, (), ()),
+    "drift-gui": (".", "enhanced_drift_analyzer_with_skk", 300, ("tkinter",),
+                  ("tkinter", "_tkinter")),
+    "api-server": (".", "narion_api_server", 500, (), ()),
+    "skk-analyzer": ("SKK", "skk_analyzer_standalone", 400, (), ()),
+    "skk-config-compiler": ("SKK", "skk_config_compiler", 250, (), ()),
+    "skk-report-index": ("SKK", "skk_report_index", 250, (), ()),
+    "skk-retention": ("SKK", "skk_retention", 250, (), ()),
+    "skk-daily-scheduler": ("SKK/scheduler", "skk_daily_scheduler", 400, (), ()),
+    "skk-watch-daemon": ("SKK/scheduler", "skk_watch_daemon", 400, (), ()),
+    "model-selector-config": ("model-selector", "config_compiler", 250, (), ()),
+    "semnet-manager": ("MIND/tools", "semnet_manager", 1000, ("networkx",),
+                       ("networkx",)),
+    "thoughts-manager": ("MIND/tools", "thoughts_manager", 250, (), ()),
+    "mind-health-check": ("MIND/tools", "mind_health_check", 1000, ("networkx",),
+                          ("networkx",)),
+    "system-health": ("narion-cosd-framework", "system_health", 150, (), ()),
+}
+
+FAILED_STATUSES = ("over_budget", "heavy_import", "import_error")
+
+# Läuft im Kind-Interpreter: Modul importieren, geladene schwere Pakete melden
+PROBE = (
+    "import json, sys; sys.path.insert(0, '.'); import {module}; "
+    "print(json.dumps([name for name in {heavy!r} if name in sys.modules]))"
+)
+
+
+def parse_importtime(stderr, module):
+    """Kumulierte Importzeit (µs) von ``module`` aus der -X importtime-Ausgabe"""
+    cumulative = None
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        # Nur der Eintrag auf oberster Ebene, nicht gleichnamige Untermodule
+        if len(fields) == 3 and fields[2].rstrip() == " " + module:
+            try:
+                cumulative = int(fields[1])
+            except ValueError:  # Kopfzeile
+                continue
+    return cumulative
+
+
+def missing_module(stderr):
+    """Oberstes Paket aus einem abschließenden ModuleNotFoundError, sonst None"""
+    lines = stderr.strip().splitlines()
+    match = lines and re.match(r"ModuleNotFoundError: No module named '([^']+)'", lines[-1])
+    return match.group(1).split(".")[0] if match else None
+
+
+def measure(name, repeat=3):
+    """Importiert einen Einstiegspunkt ``repeat`` Mal frisch; bestes Ergebnis zählt"""
+    directory, module, budget_ms, allowed, optional = ENTRY_POINTS[name]
+    record = {
+        "entry_point": name,
+        "module": module,
+        "budget_ms": budget_ms,
+        "import_ms": None,
+        "heavy_modules": [],
+        "status": "ok",
+    }
+    timings = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c",
+             PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=os.path.join(REPO_ROOT, directory),
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            # Nur eine fehlende, als optional deklarierte Abhängigkeit ist
+            # entschuldigt; SyntaxError, NameError & Co. schlagen fehl
+            missing = missing_module(proc.stderr)
+            record["status"] = "unavailable" if missing in optional else "import_error"
+            record["error"] = (proc.stderr.strip().splitlines() or ["?"])[-1]
+            return record
+        timings.append(parse_importtime(proc.stderr, module))
+        record["heavy_modules"] = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    record["import_ms"] = round(min(timings) / 1000, 1)
+    unexpected = [heavy for heavy in record["heavy_modules"] if heavy not in allowed]
+    if unexpected:
+        record["status"] = "heavy_import"
+        record["error"] = "lädt " + ", ".join(unexpected)
+    elif record["import_ms"] > budget_ms:
+        record["status"] = "over_budget"
+    return record
+
+
+def run_benchmark(names=None, repeat=3):
+    return [measure(name, repeat) for name in (names or ENTRY_POINTS)]
+
+
+def format_table(results):
+    lines = [f"{'Einstiegspunkt':<24}{'Import':>10}{'Budget':>10}  Status"]
+    for r in results:
+        import_ms = "-" if r["import_ms"] is None else f"{r['import_ms']:.1f}ms"
+        status = r["status"] + (f" ({r['error']})" if r.get("error") else "")
+        lines.append(f"{r['entry_point']:<24}{import_ms:>10}{r['budget_ms']:>8}ms  {status}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Importzeit pro Einstiegspunkt gegen Budget")
+    parser.add_argument("entry_points", nargs="*", metavar="EINSTIEGSPUNKT",
+                        help="Nur diese Einstiegspunkte (Standard: alle): "
+                             + ", ".join(ENTRY_POINTS))
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Frische Interpreter pro Einstiegspunkt (Minimum zählt)")
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    parser.add_argument("--record", metavar="PFAD",
+                        help="Messung als JSON-Zeile an diese Datei anhängen")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.entry_points if name not in ENTRY_POINTS]
+    if unknown:
+        parser.error("Unbekannter Einstiegspunkt: " + ", ".join(unknown))
+
+    results = run_benchmark(args.entry_points, args.repeat)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print(format_table(results))
+
+    if args.record:
+        directory = os.path.dirname(args.record)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.record, "a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "timestamp": datetime.now().isoformat(),
+                "python": sys.version.split()[0],
+                "results": results,
+            }, ensure_ascii=False) + "\n")
+
+    failed = [r for r in results if r["status"] in FAILED_STATUSES]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import yaml
+
+
+# Bump whenever the artifact layout or the build functions change
+ARTIFACT_VERSION = 1
+CONFIG_DIR = Path(__file__).parent / 'config'
+ARTIFACT_DIR = Path(__file__).parent / '.cache' / 'compiled'
+
+# artifact name -> (source signature, data), so repeated calls only stat()
+_LOADED: Dict[str, tuple] = {}
+
+
+class ConfigValidationError(ValueError):
+    pass
+
+
+def _signature(sources: List[Path]) -> tuple:
+    return tuple(
+        (str(path), stat.st_mtime_ns, stat.st_size)
+        for path, stat in ((path, path.stat()) for path in sources)
+    )
+
+
+# _read_artifact/_write_artifact are kept identical to the functions of the
+# same name in SKK/skk_config_compiler.py (standalone directories without a
+# shared package); change both copies together.
+
+
+def _read_artifact(path: Path) -> Dict[str, Any] | None:
+    """Load an artifact; unreadable or other version -> None (recompile).
+
+    Trust assumption: ``pickle.load`` runs arbitrary code while loading, so
+    the artifact directory must only be written by this compiler and must
+    not be writable by other users. Artifact files are not signed.
+    """
+    try:
+        with open(path, 'rb') as f:
+            artifact = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError,
+            ValueError):
+        return None
+    if not isinstance(artifact, dict) or artifact.get('version') != ARTIFACT_VERSION:
+        return None
+    return artifact
+
+
+def _write_artifact(path: Path, artifact: Dict[str, Any]) -> None:
+    """Write atomically; on a read-only checkout keep the in-memory artifact"""
+    directory = os.path.dirname(path) or '.'
+    tmp_path = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path and os.path.exists(tmp_path):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def load_compiled(name: str, sources: List[Path], build: Callable[[List[Any]], Any],
+                  artifact_dir: Path | None = None, scope: Path | None = None) -> Any:
+    """Return build(parsed sources), recompiling only when a source changed.
+
+    The artifact is keyed by mtime and size of every source; if those moved
+    but the content hash did not (e.g. after ``touch``), it is reused as is.
+    ``scope`` names the artifact file (default: the source list), so a
+    directory whose files come and go keeps overwriting a single artifact.
+    """
+    sources = sorted(Path(p).resolve() for p in sources)
+    signature = _signature(sources)
+    scope = Path(scope).resolve() if scope is not None else sources
+    digest = hashlib.sha1(str(scope).encode('utf-8')).hexdigest()[:12]
+    key = f'{name}-{digest}'
+
+    loaded = _LOADED.get(key)
+    if loaded and loaded[0] == signature:
+        return loaded[1]
+
+    path = Path(artifact_dir or ARTIFACT_DIR) / f'{key}.pickle'
+    artifact = _read_artifact(path)
+    if artifact is None or artifact['signature'] != signature:
+        raw = [p.read_bytes() for p in sources]
+        sha256 = hashlib.sha256(b'\0'.join(raw)).hexdigest()
+        if artifact is None or artifact['sha256'] != sha256:
+            documents = [yaml.safe_load(data) or {} for data in raw]
+            artifact = {'version': ARTIFACT_VERSION, 'sha256': sha256,
+                        'data': build(documents)}
+        artifact['signature'] = signature
+        _write_artifact(path, artifact)
+
+    _LOADED[key] = (signature, artifact['data'])
+    return artifact['data']
+
+
+def _string_lists(name: str, document: Any) -> Dict[str, list]:
+    if not isinstance(document, dict):
+        raise ConfigValidationError(f'{name}: expected a mapping')
+    for key, values in document.items():
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            raise ConfigValidationError(f'{name}.{key}: expected a list of strings')
+    return document
+
+
+def build_selector_config(documents: List[Any]) -> Dict[str, Any]:
+    config = documents[0]
+    mappings = config.get('mappings', [])
+    if not isinstance(mappings, list):
+        raise ConfigValidationError('mappings: expected a list')
+    for i, rule in enumerate(mappings):
+        if not isinstance(rule, dict) or not isinstance(rule.get('model'), str):
+            raise ConfigValidationError(f'mappings[{i}]: "model" is required')
+        for section in ('markers', 'semantic'):
+            for key, requirement in rule.get('when', {}).get(section, {}).items():
+                if not isinstance(requirement, dict) or not all(
+                        op in ('lt', 'gte') and isinstance(v, (int, float))
+                        for op, v in requirement.items()):
+                    raise ConfigValidationError(
+                        f'mappings[{i}].when.{section}.{key}: expected {{lt|gte: number}}')
+    return config
+
+
+def build_semantic_patterns(documents: List[Any]) -> Dict[str, frozenset]:
+    patterns = _string_lists('patterns', documents[0].get('patterns', {}))
+    return {key: frozenset(values) for key, values in patterns.items()}
+
+
+def build_marker_tables(documents: List[Any]) -> Dict[str, Dict[str, Any]]:
+    markers: Dict[str, list] = {}
+    for document in documents:
+        for key, values in _string_lists('markers', document).items():
+            markers.setdefault(key, []).extend(values)
+    # Lists keep the phrases in order, sets serve the per-word lookups
+    return {'markers': markers,
+            'sets': {key: frozenset(values) for key, values in markers.items()}}
+
+
+def selector_config(path: Path = CONFIG_DIR / 'model_selector.yaml',
+                    artifact_dir: Path | None = None) -> Dict[str, Any]:
+    return load_compiled('model_selector', [path], build_selector_config, artifact_dir)
+
+
+def semantic_patterns(path: Path = CONFIG_DIR / 'semantic_tools.yaml',
+                      artifact_dir: Path | None = None) -> Dict[str, frozenset]:
+    return load_compiled('semantic_tools', [path], build_semantic_patterns, artifact_dir)
+
+
+def marker_tables(directory: Path = CONFIG_DIR / 'markers',
+                  artifact_dir: Path | None = None) -> Dict[str, Dict[str, Any]]:
+    directory = Path(directory)
+    sources = [directory / f for f in os.listdir(directory) if f.endswith('.yaml')]
+    return load_compiled('markers', sources, build_marker_tables, artifact_dir,
+                         scope=directory)
+
+
+if __name__ == '__main__':
+    try:
+        for label, data in (('model_selector.yaml', selector_config()),
+                            ('semantic_tools.yaml', semantic_patterns()),
+                            ('markers/', marker_tables()['markers'])):
+            print(f'{label}: ok ({len(data)} entries)')
+    except (OSError, yaml.YAMLError, ConfigValidationError) as e:
+        print(f'error: {e}')
+        sys.exit(1)
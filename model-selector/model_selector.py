@@ -1,13 +1,12 @@
-import yaml
 from typing import Dict, Any
 from pathlib import Path
 
 from semantic_memory import load_memory, extract_semantic_profile
 from marker_analyser import analyse as analyse_markers
+from config_compiler import selector_config
 
 
-with open(Path(__file__).parent / 'config' / 'model_selector.yaml', 'r', encoding='utf-8') as f:
-    CONFIG = yaml.safe_load(f)
+CONFIG = selector_config(Path(__file__).parent / 'config' / 'model_selector.yaml')
 
 MEMORY_CLIENT = load_memory(str(Path(__file__).parent / 'config' / 'semantic_tools.yaml'))
 
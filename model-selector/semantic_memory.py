@@ -1,7 +1,8 @@
-import yaml
 from typing import Dict
 from pathlib import Path
 
+from config_compiler import semantic_patterns
+
 
 class MemoryClient:
     def __init__(self, patterns: Dict[str, list]):
@@ -9,9 +10,7 @@ class MemoryClient:
 
 
 def load_memory(config_path: str) -> 'MemoryClient':
-    with open(config_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f) or {}
-    return MemoryClient(data.get('patterns', {}))
+    return MemoryClient(semantic_patterns(Path(config_path)))
 
 
 def extract_semantic_profile(text: str, client: MemoryClient) -> Dict[str, float]:
@@ -0,0 +1,32 @@
+import pytest
+
+from config_compiler import ConfigValidationError, marker_tables, selector_config
+
+
+def test_marker_tables_recompile_on_change(tmp_path):
+    markers = tmp_path / 'markers'
+    markers.mkdir()
+    (markers / 'a.yaml').write_text('coherence: [focus]\n', encoding='utf-8')
+    artifacts = tmp_path / 'compiled'
+
+    first = marker_tables(markers, artifacts)
+    assert first['markers'] == {'coherence': ['focus']}
+    assert first['sets']['coherence'] == frozenset({'focus'})
+
+    (markers / 'b.yaml').write_text('coherence: [clarity]\nmeta: [meta]\n', encoding='utf-8')
+    second = marker_tables(markers, artifacts)
+    assert second['markers'] == {'coherence': ['focus', 'clarity'], 'meta': ['meta']}
+    # One artifact per directory, overwritten as marker files come and go
+    assert len(list(artifacts.glob('markers-*.pickle'))) == 1
+
+    (markers / 'a.yaml').unlink()
+    third = marker_tables(markers, artifacts)
+    assert third['markers'] == {'coherence': ['clarity'], 'meta': ['meta']}
+    assert len(list(artifacts.glob('markers-*.pickle'))) == 1
+
+
+def test_invalid_mapping_is_rejected(tmp_path):
+    config = tmp_path / 'model_selector.yaml'
+    config.write_text('mappings:\n  - when: {markers: {coherence: {lt: 0.5}}}\n', encoding='utf-8')
+    with pytest.raises(ConfigValidationError):
+        selector_config(config, tmp_path / 'compiled')
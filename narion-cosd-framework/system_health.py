@@ -3,6 +3,7 @@
 Narion CoSD Framework - System Health Check
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
@@ -22,11 +23,12 @@ def check_packages():
     required = ['matplotlib', 'numpy', 'yaml', 'networkx']
     missing = []
     
+    # Nur die Spezifikation suchen: matplotlib & Co. nicht für einen
+    # Existenz-Check komplett importieren
     for package in required:
-        try:
-            __import__(package)
+        if importlib.util.find_spec(package) is not None:
             print(f"✅ {package} installiert")
-        except ImportError:
+        else:
             print(f"❌ {package} fehlt")
             missing.append(package)
             
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Narion Local API Server
+=======================
+Langlebiger HTTP/JSON-Dienst für SKK-Analyse und Modellauswahl
+
+Endpunkte:
+  POST /skk/analyze   {"text": "...", "save": false}  -> SKK-Report
+  POST /model/select  {"text": "...", "previous_profile": {...},
+                       "system_state": {...}}         -> Modellwahl
+  GET  /health                                        -> Status
+
+Konfigurationen werden einmal beim Start geladen; SKK-Analysen laufen in
+einem Prozess-Pool mit je einem Analyzer pro Worker, die Modellauswahl in
+einem Thread-Pool.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SKK_DIR = os.path.join(BASE_DIR, "SKK")
+MODEL_SELECTOR_DIR = os.path.join(BASE_DIR, "model-selector")
+sys.path.insert(0, SKK_DIR)
+sys.path.insert(0, MODEL_SELECTOR_DIR)
+
+from skk_analyzer_standalone import _init_worker, _analyze_text_in_worker  # noqa: E402
+from model_selector import select_model  # noqa: E402
+
+
+class APIError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class NarionService:
+    """Hält Pools und Grenzen für alle Anfragen eines Server-Prozesses"""
+
+    def __init__(self, skk_config, workers, max_body, max_pending, timeout):
+        self.max_body = max_body
+        self.timeout = timeout
+        self.skk_pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(skk_config,)
+        )
+        self.select_pool = ThreadPoolExecutor(max_workers=workers)
+        # Begrenzt gleichzeitig angenommene Anfragen, statt sie endlos zu stauen
+        self.pending = threading.BoundedSemaphore(max_pending)
+
+    def run(self, pool, func, *args):
+        if not self.pending.acquire(blocking=False):
+            raise APIError(503, "Zu viele gleichzeitige Anfragen")
+        try:
+            future = pool.submit(func, *args)
+        except BaseException:
+            self.pending.release()
+            raise
+        # Der Platz wird erst frei, wenn der Job wirklich endet: ein 504
+        # bricht nur das Warten ab, nicht die Arbeit im Pool
+        future.add_done_callback(lambda _: self.pending.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            # Noch nicht gestartete Jobs gar nicht erst ausführen
+            future.cancel()
+            raise APIError(504, "Zeitüberschreitung bei der Analyse")
+
+    def analyze_skk(self, payload):
+        text = _require_text(payload)
+        return self.run(
+            self.skk_pool, _analyze_text_in_worker, text, bool(payload.get("save"))
+        )
+
+    def select_model(self, payload):
+        text = _require_text(payload)
+        return self.run(
+            self.select_pool,
+            select_model,
+            text,
+            payload.get("previous_profile"),
+            payload.get("system_state"),
+        )
+
+    def shutdown(self):
+        self.skk_pool.shutdown(cancel_futures=True)
+        self.select_pool.shutdown(cancel_futures=True)
+
+
+def _require_text(payload):
+    text = payload.get("text")
+    if not isinstance(text, str):
+        raise APIError(400, 'Feld "text" (String) fehlt')
+    return text
+
+
+class NarionRequestHandler(BaseHTTPRequestHandler):
+    service = None  # wird in serve() gesetzt
+
+    routes = {
+        "/skk/analyze": "analyze_skk",
+        "/model/select": "select_model",
+    }
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {"status": "ok"})
+        else:
+            self._send(404, {"error": "Unbekannter Endpunkt"})
+
+    def do_POST(self):
+        try:
+            handler = self.routes.get(self.path)
+            if handler is None:
+                raise APIError(404, "Unbekannter Endpunkt")
+            payload = self._read_json()
+            self._send(200, getattr(self.service, handler)(payload))
+        except APIError as e:
+            self._send(e.status, {"error": e.message})
+        except Exception as e:
+            self._send(500, {"error": str(e)})
+
+    def _read_json(self):
+        length = self.headers.get("Content-Length")
+        if length is None:
+            raise APIError(411, "Content-Length fehlt")
+        try:
+            length = int(length)
+        except ValueError:
+            raise APIError(400, "Ungültige Content-Length")
+        if length < 0:
+            raise APIError(400, "Ungültige Content-Length")
+        if length > self.service.max_body:
+            raise APIError(413, f"Anfrage größer als {self.service.max_body} Bytes")
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            raise APIError(400, "Ungültiges JSON")
+        if not isinstance(payload, dict):
+            raise APIError(400, "JSON-Objekt erwartet")
+        return payload
+
+    def _send(self, status, body):
+        data = json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # Kein Zugriffslog pro Anfrage auf stderr
+        pass
+
+
+def serve(host, port, workers, max_body, max_pending, timeout):
+    # Analyzer-Pfade (logs/, analysen/, cache/) wie beim SKK-CLI relativ zu SKK/
+    os.chdir(SKK_DIR)
+    os.makedirs("logs", exist_ok=True)
+
+    skk_config = os.path.join("config", "skk_config.yaml")
+    service = NarionService(skk_config, workers, max_body, max_pending, timeout)
+    NarionRequestHandler.service = service
+    server = ThreadingHTTPServer((host, port), NarionRequestHandler)
+    server.daemon_threads = True
+
+    print(f"🌐 Narion API läuft auf http://{host}:{port} ({workers} Worker)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Narion API wird beendet...")
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Narion Local API Server")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind-Adresse")
+    parser.add_argument("--port", type=int, default=8765, help="Port")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Analyse-Worker"
+    )
+    parser.add_argument(
+        "--max-body",
+        type=int,
+        default=1024 * 1024,
+        help="Maximale Anfragegröße in Bytes",
+    )
+    parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=64,
+        help="Maximal gleichzeitig offene Anfragen",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=60, help="Zeitlimit pro Anfrage in Sekunden"
+    )
+    args = parser.parse_args()
+
+    serve(
+        args.host,
+        args.port,
+        args.workers,
+        args.max_body,
+        args.max_pending,
+        args.timeout,
+    )
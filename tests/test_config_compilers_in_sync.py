@@ -0,0 +1,25 @@
+import ast
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPILERS = (
+    os.path.join(ROOT, 'SKK', 'skk_config_compiler.py'),
+    os.path.join(ROOT, 'model-selector', 'config_compiler.py'),
+)
+
+
+def _function(path, name):
+    """Funktionsrumpf ohne Docstring und Annotationen, als AST-Dump"""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    node = next(n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == name)
+    body = node.body
+    if isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        body = body[1:]
+    return [node.name, [arg.arg for arg in node.args.args], [ast.dump(n) for n in body]]
+
+
+def test_artifact_helpers_are_identical():
+    for name in ('_read_artifact', '_write_artifact'):
+        skk, selector = (_function(path, name) for path in COMPILERS)
+        assert skk == selector, name
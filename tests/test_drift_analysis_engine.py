@@ -0,0 +1,193 @@
+import json
+import threading
+
+import pytest
+
+import drift_analysis_engine
+from drift_analysis_engine import (
+    DRIFT_AXES,
+    AnalysisCancelled,
+    EnhancedNarrativeGenerator,
+    IntegratedSKKAnalyzer,
+    MarkerRegistry,
+    SegmentScores,
+    TextIndex,
+    MARION_MARKERS,
+    analyze_drift_in_segment,
+    drift_from_hits,
+    analyze_text,
+    detect_markers_in_segment,
+    registry_for,
+    split_text_into_segments,
+)
+from import_benchmark import measure
+
+TEXT = (
+    'ich allein spüre eine ahnung , dann übergang und wandel : wir gemeinsam zusammen . '
+    'resonanz schwingung einklang kohärenz im zwischenraum , vielleicht noch nicht möglich . '
+) * 3
+
+
+def test_import_needs_no_gui():
+    # Frischer Interpreter: sys.modules dieses Prozesses hängt davon ab,
+    # welche Tests vorher liefen
+    record = measure('drift-engine', repeat=1)
+    assert record['status'] in ('ok', 'over_budget'), record
+    assert 'tkinter' not in record['heavy_modules']
+    assert 'matplotlib' not in record['heavy_modules']
+
+
+def test_segment_functions():
+    segments = split_text_into_segments(TEXT, 10)
+    assert segments[0]['start_word'] == 0 and segments[1]['start_word'] == 10
+    assert ' '.join(s['text'] for s in segments) == ' '.join(TEXT.split())
+
+    markers = detect_markers_in_segment('Resonanz und Schwingung', MARION_MARKERS)
+    assert markers['Resonanzfeld']['matches'] == ['resonanz', 'schwingung']
+
+    drift = analyze_drift_in_segment('wir gemeinsam im wandel', DRIFT_AXES)
+    assert drift['Individualität_zu_Kollektiv']['direction'] == 'forward'
+
+
+def test_analyze_text_is_serializable_and_repeatable():
+    result = analyze_text(TEXT, segment_length=30)
+    assert result['segments'] == 3
+    assert result['drift_moments']
+    assert len(result['narratives']) == len(result['drift_moments'])
+    assert 'Drift-Moment 1' in result['narratives'][0]
+    assert result['skk_analysis']['flügel']
+    json.dumps(result, ensure_ascii=False)
+
+    # Ohne übergebenen Generator beginnt jede Analyse frisch
+    again = analyze_text(TEXT, segment_length=30)
+    assert len(again['skk_analysis']['flügel']) == len(result['skk_analysis']['flügel'])
+    assert again['narratives'] == result['narratives']
+
+
+def test_cli_json(tmp_path, capsys):
+    path = tmp_path / 'text.txt'
+    path.write_text(TEXT, encoding='utf-8')
+    assert drift_analysis_engine.main([str(path), '--json']) == 0
+    assert json.loads(capsys.readouterr().out)['drift_moments']
+
+
+def test_rejects_non_positive_segment_length(tmp_path, capsys):
+    for length in (0, -5):
+        with pytest.raises(ValueError, match="positiv"):
+            analyze_text(TEXT, segment_length=length)
+
+    path = tmp_path / 'text.txt'
+    path.write_text(TEXT, encoding='utf-8')
+    with pytest.raises(SystemExit):
+        drift_analysis_engine.main([str(path), '--segment-length', '-1'])
+    assert 'positiv' in capsys.readouterr().err
+
+
+def test_progress_and_cancel():
+    seen = []
+    analyze_text(TEXT, segment_length=10, progress=lambda done, total: seen.append((done, total)))
+    assert seen[-1] == (len(seen), len(seen))
+
+    cancel = threading.Event()
+
+    def stop_after_first(done, total):
+        cancel.set()
+
+    with pytest.raises(AnalysisCancelled):
+        analyze_text(TEXT, segment_length=10, progress=stop_after_first, cancel=cancel)
+
+
+def test_marker_registry_one_pass():
+    registry = MarkerRegistry({
+        'phrase': ['bewusstsein vom bewusstsein', 'vom bewusstsein'],
+        'wort': ['bewusstsein', 'meta', 'meta-meta'],
+    })
+    hits = registry.match('Bewusstsein vom Bewusstsein, meta-meta und Bewusstseinssprung')
+    assert hits['phrase'] == {'bewusstsein vom bewusstsein': 1, 'vom bewusstsein': 1}
+    # "meta" steckt zweimal in "meta-meta", "bewusstseinssprung" zählt nicht
+    assert hits['wort'] == {'bewusstsein': 2, 'meta-meta': 1, 'meta': 2}
+    assert registry.match('nichts davon') == {}
+
+
+def test_text_index_segments_and_highlights():
+    text = 'Ich spüre Resonanz\nim Bewusstsein vom\n  Bewusstsein, Freude und Übergang'
+    index = TextIndex(text)
+    assert index.segments(4) == split_text_into_segments(text, 4)
+
+    registry = registry_for(index.tables)
+    for length in (4, 5):
+        scores = SegmentScores(index, length)
+        for i, segment in enumerate(index.segments(length)):
+            assert scores.hits(i) == registry.match(segment['text'])
+    # Die Phrase über die Segmentgrenze (Wörter 4-6) zählt nur im Gesamttext
+    family = ('marion', 'Emergente_Bewusstheit')
+    split = SegmentScores(index, 5)
+    assert all('bewusstsein vom bewusstsein' not in split.hits(i).get(family, {})
+               for i in range(2))
+    assert SegmentScores(index, 10).hits(0)[family]['bewusstsein vom bewusstsein'] == 1
+
+    ranges = index.highlight_ranges()
+    assert [text[a:b] for a, b in ranges['marion_marker']] == [
+        'Resonanz', 'Bewusstsein vom\n  Bewusstsein']
+    assert [text[a:b] for a, b in ranges['emotion_marker']] == ['Freude']
+    assert [text[a:b] for a, b in ranges['drift_marker']] == ['Ich', 'Übergang']
+
+
+def test_segment_scores_match_per_segment_analysis():
+    text = TEXT + 'Ich verliere mich im Beige Überleben , Ego Macht und Ordnung Regel .'
+    index = TextIndex(text)
+    scores = SegmentScores(index, 10)
+    assert scores.matrix.shape[0] == len(index.segments(10))
+
+    intensities = scores.drift_intensities(DRIFT_AXES)
+    for i, segment in enumerate(index.segments(10)):
+        hits = scores.hits(i)
+        assert hits == index.registry.match(segment['text'])
+        drift = analyze_drift_in_segment(segment['text'], DRIFT_AXES)
+        assert drift == drift_from_hits(hits, DRIFT_AXES, 'drift')
+        for j, axis_name in enumerate(DRIFT_AXES):
+            expected = drift[axis_name]['intensity'] if axis_name in drift else 0.0
+            assert intensities[i, j] == pytest.approx(expected)
+
+    result = analyze_text(text, segment_length=10)
+    assert result['marion_overview']['Resonanzfeld']['count'] == 12
+    assert result['emotion_overview'] and result['meta_overview']
+    assert 0 < result['overall_marion_density'] <= 1
+    assert set(result['spiral_progression']) == {'from', 'to', 'segments'}
+
+
+def test_shared_generator_does_not_accumulate_state():
+    generator = EnhancedNarrativeGenerator()
+    first = analyze_text(TEXT, segment_length=30, generator=generator)
+    for _ in range(3):
+        again = analyze_text(TEXT, segment_length=30, generator=generator)
+    assert len(again['skk_analysis']['flügel']) == len(first['skk_analysis']['flügel'])
+    assert len(again['skk_analysis']['strudel']) == len(first['skk_analysis']['strudel']) == 3
+    assert len(generator.skk_analyzer.bedeutungsfelder['flügel']) == len(
+        first['skk_analysis']['flügel'])
+
+
+def test_narratives_are_cached_by_moment_fingerprint():
+    generator = EnhancedNarrativeGenerator()
+    first = analyze_text(TEXT, segment_length=30, generator=generator)
+    misses = generator.cache_misses
+
+    # Gleicher Inhalt, anderer Wortlaut außerhalb der Marker: alles aus dem Cache
+    edited = TEXT.replace(' dann ', ' danach ')
+    second = analyze_text(edited, segment_length=30, generator=generator)
+    assert generator.cache_misses == misses
+    assert second['meta_narrative'] == first['meta_narrative']
+    assert second['narratives'] != first['narratives']  # Textauszug ist aktuell
+    assert 'danach' in second['narratives'][0]
+
+    small = EnhancedNarrativeGenerator(cache_size=2)
+    analyze_text(TEXT, segment_length=10, generator=small)
+    assert len(small.text_context_cache) == 2
+
+
+def test_strudel_strength_counts_all_hits_of_the_segment():
+    analyzer = IntegratedSKKAnalyzer()
+    # Nur die ersten beiden Muster treffen, das letzte nicht
+    felder = analyzer.analyze_skk_in_segment('Eine Ahnung an der Schwelle, ein Drang', 0)
+    assert len(felder['flügel']) == 2
+    assert [(s['anziehungskraft'], s['hyperfokus']) for s in felder['strudel']] == [(6, False)]
@@ -0,0 +1,159 @@
+from drift_text_pager import PagedTextRenderer, page_bounds, page_spans
+
+
+class FakeScrollbar:
+    def set(self, first, last):
+        pass
+
+
+class FakeText:
+    """Bildet Inhalt, Tags, Marks und Sichtanfang eines tk.Text nach, ohne Display"""
+
+    def __init__(self):
+        self.vbar = FakeScrollbar()
+        self.content = ''
+        self.tags = []
+        self.marks = {}
+        self.top = 0
+        self.tag_calls = []
+        self.idle = []
+
+    def configure(self, **options):
+        self.yscrollcommand = options['yscrollcommand']
+
+    def index(self, index):
+        if index == 'end':
+            return len(self.content)
+        if index == '@0,0':
+            return self.top
+        if index in self.marks:
+            return self.marks[index]
+        assert index.startswith('1.0')
+        return int(index[4:-1]) if '+' in index else 0
+
+    def delete(self, start, end):
+        start, end = self.index(start), self.index(end)
+        self.content = self.content[:start] + self.content[end:]
+        self.tags[start:end] = []
+        for name, position in self.marks.items():
+            self.marks[name] = start if start < position < end else (
+                position - (end - start) if position >= end else position)
+
+    def insert(self, index, text):
+        position = self.index(index)
+        self.content = self.content[:position] + text + self.content[position:]
+        self.tags[position:position] = [set() for _ in text]
+        # Marks haben rechte Gravität
+        for name, mark in self.marks.items():
+            if mark >= position:
+                self.marks[name] = mark + len(text)
+
+    def tag_add(self, tag, *indices):
+        self.tag_calls.append((tag, indices))
+        for start, end in zip(indices[::2], indices[1::2]):
+            for tags in self.tags[self.index(start):self.index(end)]:
+                tags.add(tag)
+
+    def mark_set(self, name, index):
+        self.marks[name] = self.index(index)
+
+    def yview(self, index):
+        self.top = self.index(index)
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+
+
+def _tagged(widget, tag, offset):
+    """Getaggte Bereiche im Widget als absolute Textpositionen"""
+    ranges = []
+    for position, tags in enumerate(widget.tags, offset):
+        if tag not in tags:
+            continue
+        if ranges and ranges[-1][1] == position:
+            ranges[-1][1] += 1
+        else:
+            ranges.append([position, position + 1])
+    return [tuple(r) for r in ranges]
+
+
+def _scroll(widget, first, last):
+    widget.yscrollcommand(first, last)
+    while widget.idle:
+        widget.idle.pop()()
+
+
+def test_page_spans_clips_to_page():
+    spans = [(0, 5), (8, 14), (20, 25)]
+    ends = [end for _, end in spans]
+    assert page_spans(spans, ends, 10, 22) == [(10, 14), (20, 22)]
+    assert page_spans(spans, ends, 14, 20) == []
+
+
+def test_page_bounds_cut_at_line_ends():
+    text = 'ab\ncd\nef'
+    assert page_bounds(text, 4) == [(0, 3), (3, 6), (6, 8)]
+    assert page_bounds('x' * 5, 2) == [(0, 2), (2, 4), (4, 5)]
+    assert page_bounds('', 10) == []
+
+
+def test_renderer_pages_on_scroll_with_one_tag_call_per_page():
+    text = ''.join(f'zeile {i} resonanz\n' for i in range(100))
+    spans = [(i, i + 8) for i in range(len(text)) if text.startswith('resonanz', i)]
+    widget = FakeText()
+    renderer = PagedTextRenderer(widget, page_chars=500, window_pages=10)
+
+    renderer.show(text, {'marion_marker': spans})
+    assert 0 < len(widget.content) <= 500 and widget.content.endswith('\n')
+    assert len(widget.tag_calls) == 1
+
+    # Sichtbarer Bereich weit oben: nichts nachladen
+    widget.yscrollcommand('0.0', '0.3')
+    assert widget.idle == []
+
+    while not renderer.complete:
+        widget.yscrollcommand('0.5', '0.9')
+        # Mehrfache Scroll-Meldungen vor dem Idle-Callback laden nur eine Seite
+        widget.yscrollcommand('0.5', '0.95')
+        assert len(widget.idle) == 1
+        widget.idle.pop()()
+
+    assert widget.content == text
+    assert len(widget.tag_calls) == len(renderer.pages)
+    assert _tagged(widget, 'marion_marker', 0) == spans
+
+
+def test_renderer_keeps_a_bounded_sliding_window():
+    text = ''.join(f'zeile {i} resonanz\n' for i in range(3000))
+    spans = [(i, i + 8) for i in range(len(text)) if text.startswith('resonanz', i)]
+    widget = FakeText()
+    renderer = PagedTextRenderer(widget, page_chars=1000, window_pages=3)
+    renderer.show(text, {'marion_marker': spans})
+
+    def check_window():
+        start = renderer.window_start
+        end = renderer.pages[renderer.last - 1][1]
+        assert len(widget.content) <= 3 * 1000
+        assert widget.content == text[start:end]
+        assert _tagged(widget, 'marion_marker', start) == page_spans(
+            spans, [e for _, e in spans], start, end)
+
+    # Bis ans Ende scrollen: das Widget wächst nicht mit dem Text
+    while not renderer.complete:
+        widget.top = len(widget.content) - 10
+        top_text = widget.content[widget.top:]
+        _scroll(widget, '0.8', '0.9')
+        check_window()
+        # Der sichtbare Text bleibt stehen, auch wenn oben Seiten wegfallen
+        assert widget.content[widget.top:].startswith(top_text)
+    assert renderer.first > 0
+
+    # Zurück zum Anfang: frühere Seiten kommen wieder, hintere fallen weg
+    while renderer.first > 0:
+        widget.top = 5
+        top_text = widget.content[5:50]
+        _scroll(widget, '0.1', '0.2')
+        check_window()
+        assert widget.content[widget.top:widget.top + 45] == top_text
+    assert widget.content.startswith('zeile 0 resonanz\n')
+    assert not renderer.complete
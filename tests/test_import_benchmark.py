@@ -0,0 +1,59 @@
+import json
+import os
+
+import import_benchmark
+from import_benchmark import ENTRY_POINTS, REPO_ROOT, measure, parse_importtime
+
+
+def test_entry_points_exist():
+    for directory, module, budget_ms, _, _ in ENTRY_POINTS.values():
+        assert os.path.exists(os.path.join(REPO_ROOT, directory, module + '.py'))
+        assert budget_ms > 0
+
+
+def test_parse_importtime_takes_top_level_module():
+    stderr = '\n'.join([
+        'import time: self [us] | cumulative | imported package',
+        'import time:       120 |        120 |   drift_text_pager',
+        'import time:       300 |       5000 | drift_analysis_engine',
+        'Traceback (most recent call last):',
+    ])
+    assert parse_importtime(stderr, 'drift_analysis_engine') == 5000
+    assert parse_importtime(stderr, 'drift_text_pager') is None
+
+
+def test_cli_entry_points_import_without_heavy_packages():
+    for name in ('drift-engine', 'skk-analyzer', 'system-health'):
+        record = measure(name, repeat=1)
+        assert record['status'] in ('ok', 'over_budget'), record
+        assert record['heavy_modules'] == []
+        assert record['import_ms'] > 0
+
+
+def test_only_declared_optional_dependencies_are_unavailable(tmp_path, monkeypatch):
+    (tmp_path / 'ohne_paket.py').write_text('import fehlendes_paket\n', encoding='utf-8')
+    (tmp_path / 'kaputt.py').write_text('undefinierter_name\n', encoding='utf-8')
+    monkeypatch.setitem(ENTRY_POINTS, 'optional', (str(tmp_path), 'ohne_paket', 100, (),
+                                                   ('fehlendes_paket',)))
+    monkeypatch.setitem(ENTRY_POINTS, 'undeklariert', (str(tmp_path), 'ohne_paket', 100, (), ()))
+    monkeypatch.setitem(ENTRY_POINTS, 'kaputt', (str(tmp_path), 'kaputt', 100, (),
+                                                 ('fehlendes_paket',)))
+
+    assert measure('optional', repeat=1)['status'] == 'unavailable'
+    assert measure('undeklariert', repeat=1)['status'] == 'import_error'
+    broken = measure('kaputt', repeat=1)
+    assert broken['status'] == 'import_error'
+    assert broken['error'].startswith('NameError')
+
+    assert import_benchmark.main(['optional', '--repeat', '1']) == 0
+    assert import_benchmark.main(['kaputt', '--repeat', '1']) == 1
+
+
+def test_record_appends_json_line(tmp_path, capsys):
+    path = tmp_path / 'metrics' / 'imports.jsonl'
+    for _ in range(2):
+        import_benchmark.main(['drift-engine', '--repeat', '1', '--record', str(path)])
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])['results'][0]['entry_point'] == 'drift-engine'
+    assert 'drift-engine' in capsys.readouterr().out
@@ -0,0 +1,107 @@
+import http.client
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from narion_api_server import SKK_DIR, APIError, NarionRequestHandler, NarionService
+import skk_config_compiler
+
+SKK_CONFIG = os.path.join(SKK_DIR, 'config', 'skk_config.yaml')
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    # Analyzer-Ausgaben (logs/, cache/) landen im Testverzeichnis
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(skk_config_compiler, 'ARTIFACT_DIR', str(tmp_path / 'compiled'))
+    (tmp_path / 'logs').mkdir()
+    service = NarionService(SKK_CONFIG, workers=1, max_body=4096, max_pending=4, timeout=60)
+    yield service
+    service.shutdown()
+
+
+@pytest.fixture
+def request_json(service, monkeypatch):
+    monkeypatch.setattr(NarionRequestHandler, 'service', service)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), NarionRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def request(method, path, body=None, headers=None):
+        conn = http.client.HTTPConnection(*server.server_address, timeout=30)
+        conn.putrequest(method, path)
+        for name, value in (headers or {}).items():
+            conn.putheader(name, value)
+        conn.endheaders(body)
+        response = conn.getresponse()
+        result = response.status, json.loads(response.read())
+        conn.close()
+        return result
+
+    yield request
+    server.shutdown()
+    server.server_close()
+
+
+def _post(request_json, path, payload):
+    body = json.dumps(payload).encode('utf-8')
+    return request_json('POST', path, body, {'Content-Length': str(len(body))})
+
+
+def test_health_and_unknown_endpoint(request_json):
+    assert request_json('GET', '/health') == (200, {'status': 'ok'})
+    assert request_json('GET', '/nope')[0] == 404
+    assert _post(request_json, '/nope', {'text': 'x'})[0] == 404
+
+
+def test_endpoints_answer_with_reports(request_json):
+    status, body = _post(request_json, '/model/select', {'text': 'Ich spüre eine Ahnung'})
+    assert status == 200 and isinstance(body, dict)
+
+    status, body = _post(request_json, '/skk/analyze', {'text': 'Sehnsucht und Ahnung ' * 20})
+    assert status == 200
+    assert body['statistik']['flügel'] > 0
+    assert 'report_file' not in body
+
+
+def test_invalid_requests_are_rejected(request_json):
+    for length in ('abc', '-1'):
+        status, body = request_json('POST', '/model/select', b'', {'Content-Length': length})
+        assert (status, body) == (400, {'error': 'Ungültige Content-Length'})
+    assert request_json('POST', '/model/select')[0] == 411
+    assert request_json('POST', '/model/select', b'x' * 5000, {'Content-Length': '5000'})[0] == 413
+    assert request_json('POST', '/model/select', b'{', {'Content-Length': '1'})[0] == 400
+    assert _post(request_json, '/model/select', [1])[0] == 400
+    assert _post(request_json, '/skk/analyze', {'txt': 'x'}) == (
+        400, {'error': 'Feld "text" (String) fehlt'})
+
+
+def test_timed_out_job_keeps_its_slot_until_it_finishes(service):
+    service.timeout = 0.05
+    service.pending = threading.BoundedSemaphore(1)
+    release = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        with pytest.raises(APIError) as timeout:
+            service.run(pool, release.wait)
+        assert timeout.value.status == 504
+
+        # Der Job läuft weiter und belegt den Platz
+        with pytest.raises(APIError) as busy:
+            service.run(pool, lambda: 'neu')
+        assert busy.value.status == 503
+
+        release.set()
+        service.timeout = 5
+        for _ in range(100):
+            try:
+                assert service.run(pool, lambda: 'neu') == 'neu'
+                break
+            except APIError:
+                time.sleep(0.01)
+        else:
+            pytest.fail('Platz wurde nach Jobende nicht freigegeben')